@@ -0,0 +1,36 @@
+"""
+Outbox table for policy expiry events
+
+Revision ID: policy_expiry_outbox
+Revises: policy_unlogged_expiry_idx
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+
+from alembic import op
+
+# revision identifiers.
+revision = "policy_expiry_outbox"
+down_revision = "policy_unlogged_expiry_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "policy_expiry_outbox",
+        sa.Column("id", sa.BigInteger(), primary_key=True),
+        sa.Column("policy_id", sa.Integer(), nullable=False),
+        sa.Column("car_id", sa.Integer(), nullable=False),
+        sa.Column("end_date", sa.Date(), nullable=False),
+        sa.Column("logged_at", TIMESTAMP(timezone=False), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()
+        ),
+    )
+
+
+def downgrade():
+    op.drop_table("policy_expiry_outbox")
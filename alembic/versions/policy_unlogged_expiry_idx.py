@@ -0,0 +1,44 @@
+"""
+Partial index for unlogged expiring policies (scheduler lookup)
+
+Revision ID: policy_unlogged_expiry_idx
+Revises: taska_enddate_notnull
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers.
+revision = "policy_unlogged_expiry_idx"
+down_revision = "taska_enddate_notnull"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_insurance_policy_end_date_unlogged"
+
+
+def upgrade():
+    # CONCURRENTLY avoids locking writes on insurance_policy while building,
+    # but cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            "insurance_policy",
+            ["end_date"],
+            unique=False,
+            postgresql_where=sa.text("logged_expiry_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME,
+            table_name="insurance_policy",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
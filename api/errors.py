@@ -4,6 +4,7 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from db.query_stats import QueryBudgetExceeded
 from services.exceptions import NotFoundError
 from services.exceptions import ValidationError as DomainValidationError
 
@@ -26,6 +27,14 @@ def register_exception_handlers(app):
             status_code=400, content={"error": "validation_error", "detail": str(exc)}
         )
 
+    @app.exception_handler(QueryBudgetExceeded)
+    async def query_budget_handler(request, exc: QueryBudgetExceeded):
+        """Strict query budget (dev/CI): fail loudly instead of shipping an N+1."""
+        return JSONResponse(
+            status_code=500,
+            content={"error": "query_budget_exceeded", "detail": str(exc)},
+        )
+
     @app.exception_handler(StarletteHTTPException)
     async def starlette_http_exception_handler(request, exc: StarletteHTTPException):
         """Handle Starlette HTTP exceptions (including 404)."""
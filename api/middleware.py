@@ -0,0 +1,85 @@
+"""Raw ASGI middleware for request context (request id, logging, SQL stats).
+
+Unlike `@app.middleware("http")` (BaseHTTPMiddleware) this does not run the
+app in a separate task or re-stream the response body; it only looks at the
+`http.response.start` message to add the request id header and capture the
+status code.
+"""
+
+import time
+import uuid
+
+import structlog
+
+from core.logging import get_logger
+from db.query_stats import track as track_queries
+
+log = get_logger()
+
+REQUEST_ID_HEADER = "X-Request-ID"
+_REQUEST_ID_HEADER_RAW = REQUEST_ID_HEADER.lower().encode("latin-1")
+
+
+class RequestContextMiddleware:
+    """Bind request_id/path/method for structlog and log request_completed."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = next(
+            (
+                value.decode("latin-1")
+                for name, value in scope["headers"]
+                if name == _REQUEST_ID_HEADER_RAW
+            ),
+            None,
+        ) or str(uuid.uuid4())
+        structlog.contextvars.bind_contextvars(
+            request_id=request_id, path=scope["path"], method=scope["method"]
+        )
+        status = 500
+
+        async def send_with_request_id(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", ()))
+                if not any(
+                    name.lower() == _REQUEST_ID_HEADER_RAW for name, _ in headers
+                ):
+                    headers.append(
+                        (_REQUEST_ID_HEADER_RAW, request_id.encode("latin-1"))
+                    )
+                message = {**message, "headers": headers}
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            with track_queries() as queries:
+                await self.app(scope, receive, send_with_request_id)
+            structlog.contextvars.bind_contextvars(
+                dbStatements=queries.count, dbTimeMs=queries.db_time_ms
+            )
+            if problems := queries.violations():
+                log.warning(
+                    "query_budget_exceeded",
+                    problems=problems,
+                    shape=queries.most_repeated()[0],
+                )
+            log.info(
+                "request_completed",
+                status=status,
+                durationMs=round((time.perf_counter() - started) * 1000, 3),
+            )
+        except Exception:
+            # Ensure stack trace is logged with context (ServerErrorMiddleware renders the 500)
+            log.exception("unhandled_exception")
+            raise
+        finally:
+            # Clear to avoid leaking across requests
+            structlog.contextvars.clear_contextvars()
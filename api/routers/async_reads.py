@@ -0,0 +1,145 @@
+"""Async read routes served fully on the event loop.
+
+`main.create_app` mounts this router ahead of the sync routers when
+`ASYNC_DB_ENABLED` is set, so these handlers take over the matching GET paths
+while writes keep using the sync stack. Contracts are identical to the sync
+routes, which stay the documented ones (`include_in_schema=False` here).
+"""
+
+from datetime import date
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.schemas import (CarRead, ClaimRead, HistoryPage, InsurancePolicyRead,
+                         InsuranceValidityResponse, Page)
+from core.settings import settings
+from db.session import get_async_db, get_async_read_db
+from services.car_service import get_car_cached_async as svc_get_car_cached
+from services.car_service import list_cars_async as svc_list_cars
+from services.claim_service import get_claim_by_id_async as svc_get_claim_by_id
+from services.claim_service import list_claims_async as svc_list_claims
+from services.exceptions import NotFoundError
+from services.history_service import get_car_history_async
+from services.policy_service import \
+    get_policy_cached_async as svc_get_policy_cached
+from services.policy_service import list_policies_async as svc_list_policies
+from services.validity_service import is_insurance_valid_async
+
+async_reads_router = APIRouter(include_in_schema=False)
+
+
+@async_reads_router.get(
+    "/cars", response_model=Page[CarRead], status_code=status.HTTP_200_OK
+)
+async def list_cars(
+    limit: int = Query(
+        settings.PAGINATION_DEFAULT_LIMIT, ge=1, le=settings.PAGINATION_MAX_LIMIT
+    ),
+    after: Optional[int] = Query(None, description="Cursor: last car id seen"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    items, next_cursor = await svc_list_cars(db, limit=limit, after=after)
+    return {"items": items, "next_cursor": next_cursor}
+
+
+@async_reads_router.get(
+    "/cars/{car_id}", response_model=CarRead, status_code=status.HTTP_200_OK
+)
+async def get_car(car_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await svc_get_car_cached(db, car_id)
+
+
+@async_reads_router.get(
+    "/cars/{car_id}/insurance-valid",
+    response_model=InsuranceValidityResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def insurance_valid(
+    car_id: int,
+    date: str = Query(..., description="Date in YYYY-MM-DD format"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    valid = await is_insurance_valid_async(db, car_id, date)
+    return InsuranceValidityResponse(car_id=car_id, date=date, valid=valid)
+
+
+@async_reads_router.get(
+    "/cars/{car_id}/history",
+    response_model=HistoryPage,
+    status_code=status.HTTP_200_OK,
+)
+async def car_history(
+    car_id: int,
+    limit: int = Query(
+        settings.PAGINATION_DEFAULT_LIMIT, ge=1, le=settings.PAGINATION_MAX_LIMIT
+    ),
+    before: Optional[str] = Query(None, description="Cursor from nextCursor"),
+    type: Optional[Literal["POLICY", "CLAIM"]] = Query(None),
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    items, next_cursor = await get_car_history_async(
+        db,
+        car_id,
+        limit=limit,
+        before=before,
+        event_type=type,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return {"items": items, "next_cursor": next_cursor}
+
+
+@async_reads_router.get(
+    "/policies",
+    response_model=Page[InsurancePolicyRead],
+    status_code=status.HTTP_200_OK,
+)
+async def list_policies(
+    limit: int = Query(
+        settings.PAGINATION_DEFAULT_LIMIT, ge=1, le=settings.PAGINATION_MAX_LIMIT
+    ),
+    after: Optional[int] = Query(None, description="Cursor: last policy id seen"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    items, next_cursor = await svc_list_policies(db, limit=limit, after=after)
+    return {"items": items, "next_cursor": next_cursor}
+
+
+@async_reads_router.get(
+    "/policies/{policy_id}",
+    response_model=InsurancePolicyRead,
+    status_code=status.HTTP_200_OK,
+)
+async def get_policy(policy_id: int, db: AsyncSession = Depends(get_async_db)):
+    policy = await svc_get_policy_cached(db, policy_id)
+    if not policy:
+        raise NotFoundError("Policy", policy_id)
+    return policy
+
+
+@async_reads_router.get(
+    "/claims", response_model=Page[ClaimRead], status_code=status.HTTP_200_OK
+)
+async def list_claims(
+    limit: int = Query(
+        settings.PAGINATION_DEFAULT_LIMIT, ge=1, le=settings.PAGINATION_MAX_LIMIT
+    ),
+    after: Optional[int] = Query(None, description="Cursor: last claim id seen"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    items, next_cursor = await svc_list_claims(db, limit=limit, after=after)
+    return {"items": items, "next_cursor": next_cursor}
+
+
+@async_reads_router.get(
+    "/claims/{claim_id}", response_model=ClaimRead, status_code=status.HTTP_200_OK
+)
+async def get_claim(claim_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    claim = await svc_get_claim_by_id(db, claim_id)
+    if not claim:
+        raise NotFoundError("Claim", claim_id)
+    return claim
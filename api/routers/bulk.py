@@ -0,0 +1,82 @@
+from typing import Any, Dict, List
+
+from fastapi import APIRouter, Body, Depends, Query, Response, status
+from sqlalchemy.orm import Session
+
+from api.schemas import BulkResult
+from db.query_stats import query_budget
+from db.session import get_db
+from services.bulk_service import bulk_create_cars as svc_bulk_create_cars
+from services.bulk_service import bulk_create_claims as svc_bulk_create_claims
+from services.bulk_service import \
+    bulk_create_policies as svc_bulk_create_policies
+
+# Statement count grows with the payload (chunked lookups, per-row fallback)
+bulk_router = APIRouter(dependencies=[Depends(query_budget(None, None))])
+
+BULK_RESPONSES = {
+    201: {"description": "Every item created"},
+    207: {"description": "Partial mode: some items created, see per-item status"},
+    400: {"description": "Atomic mode: nothing created, or too many items"},
+    422: {"description": "Request body is not a JSON array of objects"},
+}
+
+ATOMIC_QUERY = Query(
+    True,
+    description="true: all-or-nothing; false: commit the items that succeed",
+)
+
+
+def _bulk_result(items: List[dict], atomic: bool, response: Response) -> dict:
+    created = sum(1 for i in items if i["status"] == "created")
+    failed = len(items) - created
+    if failed:
+        response.status_code = (
+            status.HTTP_400_BAD_REQUEST if atomic else status.HTTP_207_MULTI_STATUS
+        )
+    return {"created": created, "failed": failed, "items": items}
+
+
+@bulk_router.post(
+    "/cars:bulk",
+    response_model=BulkResult,
+    status_code=status.HTTP_201_CREATED,
+    responses=BULK_RESPONSES,
+)
+def create_cars_bulk(
+    response: Response,
+    items: List[Dict[str, Any]] = Body(...),
+    atomic: bool = ATOMIC_QUERY,
+    db: Session = Depends(get_db),
+):
+    return _bulk_result(svc_bulk_create_cars(db, items, atomic), atomic, response)
+
+
+@bulk_router.post(
+    "/policies:bulk",
+    response_model=BulkResult,
+    status_code=status.HTTP_201_CREATED,
+    responses=BULK_RESPONSES,
+)
+def create_policies_bulk(
+    response: Response,
+    items: List[Dict[str, Any]] = Body(...),
+    atomic: bool = ATOMIC_QUERY,
+    db: Session = Depends(get_db),
+):
+    return _bulk_result(svc_bulk_create_policies(db, items, atomic), atomic, response)
+
+
+@bulk_router.post(
+    "/claims:bulk",
+    response_model=BulkResult,
+    status_code=status.HTTP_201_CREATED,
+    responses=BULK_RESPONSES,
+)
+def create_claims_bulk(
+    response: Response,
+    items: List[Dict[str, Any]] = Body(...),
+    atomic: bool = ATOMIC_QUERY,
+    db: Session = Depends(get_db),
+):
+    return _bulk_result(svc_bulk_create_claims(db, items, atomic), atomic, response)
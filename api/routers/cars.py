@@ -1,37 +1,49 @@
-from typing import Any, Dict, List
+from datetime import date
+from typing import List, Literal, Optional
 
 from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.orm import Session
 
 from api.schemas import (CarCreate, CarRead, ClaimCreate, ClaimCreateNested,
-                         ClaimRead, InsurancePolicyCreate,
+                         ClaimRead, HistoryPage, InsurancePolicyCreate,
                          InsurancePolicyCreateNested, InsurancePolicyRead,
-                         InsuranceValidityResponse)
-from db.session import get_db
+                         InsuranceValidityBatchResult, InsuranceValidityQuery,
+                         InsuranceValidityResponse, Page)
+from core.settings import settings
+from db.session import get_db, get_read_db
 from services.car_service import create_car as svc_create_car
 from services.car_service import delete_car as svc_delete_car
-from services.car_service import get_car as svc_get_car
+from services.car_service import get_car_cached as svc_get_car_cached
 from services.car_service import list_cars as svc_list_cars
 from services.car_service import update_car as svc_update_car
 from services.claim_service import create_claim as svc_create_claim
+from services.exceptions import ValidationError
 from services.history_service import get_car_history
 from services.policy_service import create_policy as svc_create_policy
-from services.validity_service import is_insurance_valid
+from services.validity_service import (is_insurance_valid,
+                                       is_insurance_valid_batch)
 
 cars_router = APIRouter()
 
 
 @cars_router.get(
     "/cars",
-    response_model=List[CarRead],
+    response_model=Page[CarRead],
     status_code=status.HTTP_200_OK,
     responses={
-        200: {"description": "List of cars"},
+        200: {"description": "Page of cars ordered by id"},
         422: {"description": "Validation error in query/path"},
     },
 )
-def list_cars(db: Session = Depends(get_db)):
-    return svc_list_cars(db)
+def list_cars(
+    limit: int = Query(
+        settings.PAGINATION_DEFAULT_LIMIT, ge=1, le=settings.PAGINATION_MAX_LIMIT
+    ),
+    after: Optional[int] = Query(None, description="Cursor: last car id seen"),
+    db: Session = Depends(get_read_db),
+):
+    items, next_cursor = svc_list_cars(db, limit=limit, after=after)
+    return {"items": items, "next_cursor": next_cursor}
 
 
 @cars_router.get(
@@ -45,7 +57,7 @@ def list_cars(db: Session = Depends(get_db)):
     },
 )
 def get_car(car_id: int, db: Session = Depends(get_db)):
-    return svc_get_car(db, car_id)
+    return svc_get_car_cached(db, car_id)
 
 
 @cars_router.post(
@@ -156,19 +168,61 @@ def create_claims(
 def insurance_valid(
     car_id: int,
     date: str = Query(..., description="Date in YYYY-MM-DD format"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     valid = is_insurance_valid(db, car_id, date)
     return InsuranceValidityResponse(car_id=car_id, date=date, valid=valid)
 
 
+@cars_router.post(
+    "/insurance-valid:batch",
+    status_code=status.HTTP_200_OK,
+    response_model=List[InsuranceValidityBatchResult],
+    responses={
+        200: {"description": "Per-item insurance validity, in input order"},
+        400: {"description": "Too many items in one batch"},
+        422: {"description": "Request body validation error"},
+    },
+)
+def insurance_valid_batch(
+    items: List[InsuranceValidityQuery], db: Session = Depends(get_read_db)
+):
+    if len(items) > settings.VALIDITY_BATCH_MAX_ITEMS:
+        raise ValidationError(
+            f"At most {settings.VALIDITY_BATCH_MAX_ITEMS} items allowed per batch"
+        )
+    return is_insurance_valid_batch(db, [(i.car_id, i.date) for i in items])
+
+
 @cars_router.get(
     "/cars/{car_id}/history",
+    response_model=HistoryPage,
     status_code=status.HTTP_200_OK,
     responses={
-        200: {"description": "Chronological list of policies and claims for a car"},
+        200: {"description": "Page of policies and claims for a car, newest first"},
+        400: {"description": "Invalid cursor"},
         404: {"description": "Car not found"},
+        422: {"description": "Query parameter validation error"},
     },
 )
-def car_history(car_id: int, db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
-    return get_car_history(db, car_id)
+def car_history(
+    car_id: int,
+    limit: int = Query(
+        settings.PAGINATION_DEFAULT_LIMIT, ge=1, le=settings.PAGINATION_MAX_LIMIT
+    ),
+    before: Optional[str] = Query(None, description="Cursor from nextCursor"),
+    type: Optional[Literal["POLICY", "CLAIM"]] = Query(None),
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    db: Session = Depends(get_read_db),
+):
+    items, next_cursor = get_car_history(
+        db,
+        car_id,
+        limit=limit,
+        before=before,
+        event_type=type,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return {"items": items, "next_cursor": next_cursor}
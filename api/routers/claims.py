@@ -1,11 +1,12 @@
-from typing import List
+from typing import Optional
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.orm import Session
 
-from api.schemas import ClaimCreate, ClaimRead
+from api.schemas import ClaimCreate, ClaimRead, Page
+from core.settings import settings
 from db.models import Claim
-from db.session import get_db
+from db.session import get_db, get_read_db
 from services.claim_service import create_claim as svc_create_claim
 from services.claim_service import delete_claim as svc_delete_claim
 from services.claim_service import get_claim_by_id as svc_get_claim_by_id
@@ -18,15 +19,22 @@ claims_router = APIRouter()
 
 @claims_router.get(
     "/claims",
-    response_model=List[ClaimRead],
+    response_model=Page[ClaimRead],
     status_code=status.HTTP_200_OK,
     responses={
-        200: {"description": "List of claims"},
+        200: {"description": "Page of claims ordered by id"},
         422: {"description": "Validation error in query/path"},
     },
 )
-def list_claims(db: Session = Depends(get_db)):
-    return svc_list_claims(db)
+def list_claims(
+    limit: int = Query(
+        settings.PAGINATION_DEFAULT_LIMIT, ge=1, le=settings.PAGINATION_MAX_LIMIT
+    ),
+    after: Optional[int] = Query(None, description="Cursor: last claim id seen"),
+    db: Session = Depends(get_read_db),
+):
+    items, next_cursor = svc_list_claims(db, limit=limit, after=after)
+    return {"items": items, "next_cursor": next_cursor}
 
 
 @claims_router.get(
@@ -39,7 +47,7 @@ def list_claims(db: Session = Depends(get_db)):
         422: {"description": "Invalid path parameter"},
     },
 )
-def get_claim(claim_id: int, db: Session = Depends(get_db)):
+def get_claim(claim_id: int, db: Session = Depends(get_read_db)):
     claim = svc_get_claim_by_id(db, claim_id)
     if not claim:
         raise NotFoundError("Claim", claim_id)
@@ -77,11 +85,7 @@ def create_claim(
     },
 )
 def update_claim(claim_id: int, payload: ClaimCreate, db: Session = Depends(get_db)):
-    claim = svc_get_claim_by_id(db, claim_id)
-    if not claim:
-        raise NotFoundError("Claim", claim_id)
-    updated = svc_update_claim(db, claim, payload)
-    return updated
+    return svc_update_claim(db, claim_id, payload)
 
 
 @claims_router.delete(
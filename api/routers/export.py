@@ -0,0 +1,30 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from db.session import get_read_db
+from services.export_service import iter_ndjson
+
+export_router = APIRouter()
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+@export_router.get(
+    "/export/{resource}",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Whole table streamed as newline-delimited JSON",
+            "content": {NDJSON_MEDIA_TYPE: {}},
+        },
+        422: {"description": "Unknown export resource"},
+    },
+)
+def export_resource(
+    resource: Literal["cars", "policies", "claims"], db: Session = Depends(get_read_db)
+):
+    return StreamingResponse(iter_ndjson(db, resource), media_type=NDJSON_MEDIA_TYPE)
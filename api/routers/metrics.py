@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Response
+
+from core.metrics import render_latest
+
+metrics_router = APIRouter(include_in_schema=False)
+
+
+@metrics_router.get("/metrics")
+def metrics():
+    payload, content_type = render_latest()
+    return Response(content=payload, media_type=content_type)
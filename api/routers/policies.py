@@ -1,15 +1,17 @@
-from typing import List
+from typing import Optional
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.orm import Session
 
-from api.schemas import InsurancePolicyCreate, InsurancePolicyRead
+from api.schemas import InsurancePolicyCreate, InsurancePolicyRead, Page
+from core.settings import settings
 from db.models import Car, InsurancePolicy
-from db.session import get_db
+from db.session import get_db, get_read_db
 from services.exceptions import NotFoundError
 from services.policy_service import create_policy as svc_create_policy
 from services.policy_service import delete_policy as svc_delete_policy
 from services.policy_service import get_policy_by_id as svc_get_policy_by_id
+from services.policy_service import get_policy_cached as svc_get_policy_cached
 from services.policy_service import list_policies as svc_list_policies
 from services.policy_service import update_policy as svc_update_policy
 
@@ -18,15 +20,22 @@ policies_router = APIRouter()
 
 @policies_router.get(
     "/policies",
-    response_model=List[InsurancePolicyRead],
+    response_model=Page[InsurancePolicyRead],
     status_code=status.HTTP_200_OK,
     responses={
-        200: {"description": "List of policies"},
+        200: {"description": "Page of policies ordered by id"},
         422: {"description": "Validation error in query/path"},
     },
 )
-def list_policies(db: Session = Depends(get_db)):
-    return svc_list_policies(db)
+def list_policies(
+    limit: int = Query(
+        settings.PAGINATION_DEFAULT_LIMIT, ge=1, le=settings.PAGINATION_MAX_LIMIT
+    ),
+    after: Optional[int] = Query(None, description="Cursor: last policy id seen"),
+    db: Session = Depends(get_read_db),
+):
+    items, next_cursor = svc_list_policies(db, limit=limit, after=after)
+    return {"items": items, "next_cursor": next_cursor}
 
 
 @policies_router.get(
@@ -40,7 +49,7 @@ def list_policies(db: Session = Depends(get_db)):
     },
 )
 def get_policy(policy_id: int, db: Session = Depends(get_db)):
-    policy = svc_get_policy_by_id(db, policy_id)
+    policy = svc_get_policy_cached(db, policy_id)
     if not policy:
         raise NotFoundError("Policy", policy_id)
     return policy
@@ -81,11 +90,7 @@ def create_policy(
 def update_policy(
     policy_id: int, payload: InsurancePolicyCreate, db: Session = Depends(get_db)
 ):
-    policy = svc_get_policy_by_id(db, policy_id)
-    if not policy:
-        raise NotFoundError("Policy", policy_id)
-    updated = svc_update_policy(db, policy, payload)
-    return updated
+    return svc_update_policy(db, policy_id, payload)
 
 
 @policies_router.delete(
@@ -0,0 +1,36 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import FileResponse
+
+from api.schemas import ProfileRead
+from core.profiling import (PROFILE_TOKEN_HEADER, list_profiles, profile_path,
+                            verify_token)
+from services.exceptions import NotFoundError
+
+
+def require_admin_token(
+    token: str | None = Header(None, alias=PROFILE_TOKEN_HEADER),
+) -> None:
+    if not verify_token(token, "admin"):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+
+
+profiles_router = APIRouter(
+    prefix="/admin/profiles",
+    include_in_schema=False,
+    dependencies=[Depends(require_admin_token)],
+)
+
+
+@profiles_router.get("", response_model=List[ProfileRead])
+def list_captured_profiles():
+    return list_profiles()
+
+
+@profiles_router.get("/{profile_id}")
+def download_profile(profile_id: str):
+    path = profile_path(profile_id)
+    if path is None:
+        raise NotFoundError("Profile", profile_id)
+    return FileResponse(path, media_type="text/plain", filename=path.name)
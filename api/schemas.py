@@ -1,11 +1,19 @@
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Dict, Generic, List, Literal, Optional, TypeVar
 
 from pydantic import field_validator
 
 from core.config import CamelModel
 
+T = TypeVar("T")
+
+
+# Pagination envelope for list endpoints
+class Page(CamelModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[int] = None
+
 
 # Owner Models
 class OwnerCreate(CamelModel):
@@ -91,6 +99,20 @@ class InsuranceValidityResponse(CamelModel):
     valid: bool
 
 
+# Used for POST /api/insurance-valid:batch
+class InsuranceValidityQuery(CamelModel):
+    car_id: int
+    date: str
+
+
+class InsuranceValidityBatchResult(CamelModel):
+    car_id: int
+    date: str
+    valid: Optional[bool] = None
+    # "not_found" or "invalid_date" when valid could not be determined
+    error: Optional[str] = None
+
+
 # Claim Models
 # Used for top-level /api/claims endpoints (requires car_id)
 class ClaimCreate(CamelModel):
@@ -138,5 +160,32 @@ class ClaimRead(CamelModel):
     }
 
 
+# Bulk create (POST /api/{cars,policies,claims}:bulk)
+class BulkItemResult(CamelModel):
+    index: int
+    status: Literal["created", "invalid", "not_found", "conflict", "skipped"]
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class BulkResult(CamelModel):
+    created: int
+    failed: int
+    items: List[BulkItemResult]
+
+
+# History Models
+class HistoryPage(CamelModel):
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+
+
 class HealthRead(CamelModel):
     status: str
+
+
+# Captured request profiles (GET /admin/profiles)
+class ProfileRead(CamelModel):
+    id: str
+    size_bytes: int
+    created_at: datetime
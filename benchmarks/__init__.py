@@ -0,0 +1,4 @@
+"""Performance benchmarks for service functions and HTTP endpoints.
+
+Run with `python -m benchmarks.run --help`.
+"""
@@ -0,0 +1,192 @@
+"""Benchmark cases for service functions and the matching HTTP endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import uuid
+from collections.abc import Iterator
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import httpx
+from sqlalchemy import update
+from sqlalchemy.orm import sessionmaker
+
+from api.schemas import (CarCreate, ClaimCreateNested,
+                         InsurancePolicyCreateNested)
+from benchmarks.dataset import Dataset
+from benchmarks.harness import Case
+from core.redis import RedisLock
+from db.models import InsurancePolicy
+from db.session import get_db, get_read_db
+from main import create_app
+from services.car_service import create_car, list_cars
+from services.claim_service import create_claim
+from services.history_service import get_car_history
+from services.policy_service import create_policy
+from services.scheduler import _run_policy_expiry_job
+from services.validity_service import is_insurance_valid
+
+
+def _vins() -> Iterator[str]:
+    # Unique across cases and runs against the same database
+    token = uuid.uuid4().hex[:8].upper()
+    return (f"BX{token}{n:010d}" for n in itertools.count())
+
+
+def service_cases(session_factory: sessionmaker, data: Dataset) -> list[Case]:
+    cars = data.car_ids
+    on_date = data.today.isoformat()
+    vins = _vins()
+
+    def car_id(i: int) -> int:
+        return cars[i % len(cars)]
+
+    def call(fn, *args, **kwargs):
+        with session_factory() as db:
+            return fn(db, *args, **kwargs)
+
+    def reset_expiry(_: int) -> None:
+        with session_factory() as db:
+            db.execute(
+                update(InsurancePolicy)
+                .where(InsurancePolicy.end_date == data.today)
+                .values(logged_expiry_at=None)
+            )
+            db.commit()
+
+    def session_gen():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def held_lock(key, ttl_seconds):
+        lock = RedisLock(key, ttl_seconds, client=MagicMock())
+        lock.acquire()
+        return lock
+
+    @contextlib.contextmanager
+    def expiry_env():
+        # The job takes a Redis lock and opens its own session
+        with (
+            patch("services.scheduler.acquire_lock", side_effect=held_lock),
+            patch("services.scheduler.get_db", side_effect=lambda: session_gen()),
+        ):
+            yield
+
+    policy = InsurancePolicyCreateNested(
+        provider="Bench", start_date=data.today, end_date=data.today
+    )
+    claim = ClaimCreateNested(
+        claim_date=data.today, description="Bench", amount=Decimal("10.00")
+    )
+    return [
+        Case("service.list_cars", lambda i: call(list_cars, limit=50)),
+        Case(
+            "service.list_cars_after",
+            lambda i: call(list_cars, limit=50, after=car_id(i)),
+        ),
+        Case("service.get_car_history", lambda i: call(get_car_history, car_id(i))),
+        Case(
+            "service.is_insurance_valid",
+            lambda i: call(is_insurance_valid, car_id(i), on_date),
+        ),
+        Case(
+            "service.create_car",
+            lambda i: call(
+                create_car,
+                CarCreate(vin=next(vins), owner_id=data.owner_ids[0]),
+            ),
+        ),
+        Case("service.create_policy", lambda i: call(create_policy, car_id(i), policy)),
+        Case("service.create_claim", lambda i: call(create_claim, car_id(i), claim)),
+        Case(
+            "service.policy_expiry_job",
+            lambda i: _run_policy_expiry_job(),
+            setup=reset_expiry,
+            context=expiry_env,
+        ),
+    ]
+
+
+@contextlib.contextmanager
+def http_cases(session_factory: sessionmaker, data: Dataset) -> Iterator[list[Case]]:
+    """Endpoints through the ASGI app from `main.create_app` (no network).
+
+    The cases share one client and event loop, closed when the context exits.
+    """
+    app = create_app(enable_scheduler=False, configure_logs=False)
+
+    def override_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_read_db] = override_db
+
+    loop = asyncio.new_event_loop()
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    )
+    cars = data.car_ids
+    on_date = data.today.isoformat()
+    vins = _vins()
+
+    def car_id(i: int) -> int:
+        return cars[i % len(cars)]
+
+    def request(method: str, url: str, expected: int, json=None):
+        def run(i: int):
+            resp = loop.run_until_complete(
+                client.request(
+                    method, url.format(car=car_id(i)), json=json(i) if json else None
+                )
+            )
+            if resp.status_code != expected:
+                raise RuntimeError(f"{method} {url}: {resp.status_code} {resp.text}")
+
+        return run
+
+    policy = {"provider": "Bench", "startDate": on_date, "endDate": on_date}
+    claim = {"claimDate": on_date, "description": "Bench", "amount": 10}
+    cases = [
+        Case("http.GET /api/cars", request("GET", "/api/cars?limit=50", 200)),
+        Case("http.GET /api/cars/{id}", request("GET", "/api/cars/{car}", 200)),
+        Case(
+            "http.GET /api/cars/{id}/history",
+            request("GET", "/api/cars/{car}/history", 200),
+        ),
+        Case(
+            "http.GET /api/cars/{id}/insurance-valid",
+            request("GET", f"/api/cars/{{car}}/insurance-valid?date={on_date}", 200),
+        ),
+        Case(
+            "http.POST /api/cars",
+            request(
+                "POST",
+                "/api/cars",
+                201,
+                json=lambda i: {"vin": next(vins), "ownerId": data.owner_ids[0]},
+            ),
+        ),
+        Case(
+            "http.POST /api/cars/{id}/policies",
+            request("POST", "/api/cars/{car}/policies", 201, json=lambda i: policy),
+        ),
+        Case(
+            "http.POST /api/cars/{id}/claims",
+            request("POST", "/api/cars/{car}/claims", 201, json=lambda i: claim),
+        ),
+    ]
+    try:
+        yield cases
+    finally:
+        loop.run_until_complete(client.aclose())
+        loop.close()
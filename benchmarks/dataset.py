@@ -0,0 +1,127 @@
+"""Deterministic benchmark dataset, seeded through SQLAlchemy Core.
+
+Works on SQLite and PostgreSQL. Tables are created if missing (checkfirst), so
+a migrated database is used as-is.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import Engine, create_engine, event, insert
+from sqlalchemy.pool import StaticPool
+
+from db.base import Base
+from db.models import Car, Claim, InsurancePolicy, Owner
+from scripts.seed import MAKES, MODELS, PROVIDERS, claim_values, policy_dates
+
+INSERT_CHUNK = 5_000
+
+
+@dataclass(frozen=True)
+class Dataset:
+    owner_ids: list[int]
+    car_ids: list[int]
+    today: date
+
+
+def make_engine(url: str) -> Engine:
+    """Engine for `url`; in-memory SQLite keeps one shared connection."""
+    if not url.startswith("sqlite"):
+        return create_engine(url, pool_pre_ping=True)
+    kwargs: dict = {"connect_args": {"check_same_thread": False}}
+    if url in ("sqlite://", "sqlite:///:memory:"):
+        kwargs["poolclass"] = StaticPool
+    engine = create_engine(url, **kwargs)
+
+    @event.listens_for(engine, "connect")
+    def _foreign_keys(dbapi_connection, _):
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    return engine
+
+
+def _insert_ids(conn, model, rows: list[dict]) -> list[int]:
+    ids: list[int] = []
+    for i in range(0, len(rows), INSERT_CHUNK):
+        chunk = rows[i : i + INSERT_CHUNK]
+        # executemany + RETURNING: ids only match input order when asked to
+        stmt = insert(model).returning(model.c.id, sort_by_parameter_order=True)
+        ids.extend(conn.scalars(stmt, chunk))
+    return ids
+
+
+def _insert(conn, model, rows: list[dict]) -> None:
+    for i in range(0, len(rows), INSERT_CHUNK):
+        conn.execute(insert(model), rows[i : i + INSERT_CHUNK])
+
+
+def seed_dataset(
+    engine: Engine,
+    cars: int,
+    policies_per_car: int = 2,
+    claims_per_car: int = 2,
+    seed: int = 42,
+    reset: bool = False,
+) -> Dataset:
+    """Insert `cars` cars (two per owner) with policies and claims.
+
+    Values come from the `scripts.seed` generators, drawn from one seeded RNG.
+    Every tenth car has a policy ending today so the expiry job has work.
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        if reset:
+            for table in reversed(Base.metadata.sorted_tables):
+                conn.execute(table.delete())
+
+        owners = [
+            {"name": f"Bench Owner {i}", "email": f"bench{seed}.{i}@example.com"}
+            for i in range((cars + 1) // 2)
+        ]
+        owner_ids = _insert_ids(conn, Owner.__table__, owners)
+
+        car_rows = [
+            {
+                "vin": f"BENCH{seed:04d}{i:012d}",
+                "make": rng.choice(MAKES),
+                "model": rng.choice(MODELS),
+                "year_of_manufacture": rng.randint(2005, 2024),
+                "owner_id": owner_ids[i // 2],
+            }
+            for i in range(cars)
+        ]
+        car_ids = _insert_ids(conn, Car.__table__, car_rows)
+
+        policies = []
+        claims = []
+        for n, car_id in enumerate(car_ids):
+            for p in range(policies_per_car):
+                start, end = policy_dates(today, rng)
+                if p == 0 and n % 10 == 0:
+                    end = today
+                policies.append(
+                    {
+                        "car_id": car_id,
+                        "provider": rng.choice(PROVIDERS),
+                        "start_date": start,
+                        "end_date": end,
+                    }
+                )
+            for _ in range(claims_per_car):
+                claim_date, amount = claim_values(today, rng)
+                claims.append(
+                    {
+                        "car_id": car_id,
+                        "claim_date": claim_date,
+                        "description": f"Bench claim {rng.randint(1, 10**6)}",
+                        "amount": amount,
+                    }
+                )
+        _insert(conn, InsurancePolicy.__table__, policies)
+        _insert(conn, Claim.__table__, claims)
+    return Dataset(owner_ids=owner_ids, car_ids=car_ids, today=today)
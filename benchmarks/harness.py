@@ -0,0 +1,86 @@
+"""Timing and SQL statement counting for benchmark cases."""
+
+from __future__ import annotations
+
+import contextlib
+import math
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, ContextManager
+
+from sqlalchemy import Engine, event
+
+
+@dataclass
+class Case:
+    """One benchmark: `fn(i)` is timed, `setup(i)` runs untimed before it."""
+
+    name: str
+    fn: Callable[[int], Any]
+    setup: Callable[[int], Any] | None = None
+    # Entered once around warmup + measurement (e.g. mock.patch of Redis locks)
+    context: Callable[[], ContextManager] = field(default=contextlib.nullcontext)
+
+
+class StatementCounter:
+    """Count cursor executions on an engine while active."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, *args) -> None:
+        self.count += 1
+
+    def __enter__(self) -> "StatementCounter":
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+class _NoCounter(contextlib.nullcontext):
+    count = 0
+
+    def __enter__(self) -> "_NoCounter":
+        return self
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def measure(engine: Engine | None, case: Case, iterations: int, warmup: int) -> dict:
+    """Run `case` and summarise latency (ms), throughput and SQL per op.
+
+    With `engine=None` (cases that never touch the database) SQL is not counted.
+    """
+    samples: list[float] = []
+    statements = 0
+    counting = StatementCounter(engine) if engine is not None else _NoCounter()
+    with case.context(), counting as counter:
+        for i in range(-warmup, iterations):
+            if case.setup is not None:
+                case.setup(i)
+            before = counter.count
+            started = time.perf_counter()
+            case.fn(i)
+            elapsed = time.perf_counter() - started
+            if i >= 0:
+                samples.append(elapsed)
+                statements += counter.count - before
+    samples.sort()
+    total = sum(samples)
+    return {
+        "iterations": iterations,
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p95_ms": round(percentile(samples, 95) * 1000, 3),
+        "p99_ms": round(percentile(samples, 99) * 1000, 3),
+        "mean_ms": round(total / iterations * 1000, 3),
+        "ops_per_sec": round(iterations / total, 1) if total else None,
+        "sql_per_op": round(statements / iterations, 2),
+    }
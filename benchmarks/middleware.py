@@ -0,0 +1,163 @@
+"""Per-request cost of the request-context middleware on `/api/health`.
+
+Usage (from project root):
+    python -m benchmarks.middleware --iterations 5000 --output bench_middleware.json
+
+Three apps serving only the health router are driven directly over ASGI (no
+HTTP client in the loop, so the middleware is most of what differs):
+
+    none        no middleware, the baseline
+    decorator   the previous `@app.middleware("http")` implementation, which
+                runs on Starlette's BaseHTTPMiddleware
+    asgi        api.middleware.RequestContextMiddleware
+
+`overhead_us` is each variant's mean minus the baseline's mean.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+import uuid
+
+import structlog
+from fastapi import FastAPI, Request, Response
+
+from api.middleware import REQUEST_ID_HEADER, RequestContextMiddleware
+from api.routers.health import health_router
+from benchmarks.harness import Case, measure
+from core.logging import get_logger
+from db.query_stats import track as track_queries
+
+log = get_logger()
+
+
+async def decorator_request_context(request: Request, call_next):
+    """The middleware as it was before RequestContextMiddleware, for comparison."""
+    request_id = request.headers.get(REQUEST_ID_HEADER) or str(uuid.uuid4())
+    structlog.contextvars.bind_contextvars(
+        request_id=request_id, path=request.url.path, method=request.method
+    )
+    started = time.perf_counter()
+    try:
+        with track_queries() as queries:
+            response: Response = await call_next(request)
+        structlog.contextvars.bind_contextvars(
+            dbStatements=queries.count, dbTimeMs=queries.db_time_ms
+        )
+        if problems := queries.violations():
+            log.warning(
+                "query_budget_exceeded",
+                problems=problems,
+                shape=queries.most_repeated()[0],
+            )
+        log.info(
+            "request_completed",
+            status=response.status_code,
+            durationMs=round((time.perf_counter() - started) * 1000, 3),
+        )
+    except Exception:
+        log.exception("unhandled_exception")
+        raise
+    finally:
+        structlog.contextvars.clear_contextvars()
+    response.headers.setdefault(REQUEST_ID_HEADER, request_id)
+    return response
+
+
+def build_app(variant: str) -> FastAPI:
+    app = FastAPI()
+    if variant == "decorator":
+        app.middleware("http")(decorator_request_context)
+    elif variant == "asgi":
+        app.add_middleware(RequestContextMiddleware)
+    app.include_router(health_router, prefix="/api")
+    return app
+
+
+def health_case(variant: str, loop: asyncio.AbstractEventLoop) -> Case:
+    app = build_app(variant)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/health",
+        "raw_path": b"/api/health",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    def request(i: int) -> None:
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        loop.run_until_complete(app(dict(scope), receive, send))
+        assert sent[0]["status"] == 200
+
+    return Case(f"GET /api/health [{variant}]", request)
+
+
+def run_middleware_bench(iterations: int = 5000, warmup: int = 500) -> dict:
+    """Time each variant and return the JSON-ready report."""
+    structlog_config = structlog.get_config()
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+    loop = asyncio.new_event_loop()
+    try:
+        results = {
+            variant: measure(None, health_case(variant, loop), iterations, warmup)
+            for variant in ("none", "decorator", "asgi")
+        }
+    finally:
+        loop.close()
+        structlog.configure(**structlog_config)
+
+    baseline = results["none"]["mean_ms"]
+    for variant, r in results.items():
+        r["overhead_us"] = round((r["mean_ms"] - baseline) * 1000, 1)
+        print(
+            f"{variant:10} p50 {r['p50_ms']:7.3f}ms  p99 {r['p99_ms']:7.3f}ms  "
+            f"{r['ops_per_sec']:>9} ops/s  overhead {r['overhead_us']:>6}us",
+            flush=True,
+        )
+    return {
+        "meta": {"iterations": iterations, "warmup": warmup},
+        "results": results,
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Compare request-context middleware implementations"
+    )
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--warmup", type=int, default=500)
+    parser.add_argument("--output")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    report = run_middleware_bench(iterations=args.iterations, warmup=args.warmup)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""Prometheus metrics: HTTP, DB pool, Redis, cache and scheduler instrumentation.
+
+Metrics live in the default registry. When several worker processes share a
+host, set PROMETHEUS_MULTIPROC_DIR (an empty, writable directory) in the
+environment before the app starts; each worker then writes its samples to
+mmap'd files there and `/metrics` aggregates all of them.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from functools import lru_cache
+
+from prometheus_client import (CONTENT_TYPE_LATEST, REGISTRY,
+                               CollectorRegistry, Counter, Gauge, Histogram,
+                               generate_latest, multiprocess)
+from sqlalchemy import Engine, event
+
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route template and status code.",
+    ["method", "route", "status"],
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time from request start to the end of the response body.",
+    ["method", "route"],
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "Response body size.",
+    ["method", "route"],
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000),
+)
+# Route is only known after routing, so in-flight is tracked per method
+HTTP_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Requests currently being served.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Configured pool size (excluding overflow).",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OPEN = Gauge(
+    "db_pool_open_connections",
+    "DBAPI connections currently open.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the pool.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+
+REDIS_COMMAND_LATENCY = Histogram(
+    "redis_command_duration_seconds",
+    "Redis command round-trip time.",
+    ["command"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+
+REDIS_LOCK_WAIT = Histogram(
+    "redis_lock_wait_seconds",
+    "Time spent waiting for a Redis lock that was then acquired.",
+    ["lock"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+REDIS_LOCK_HOLD = Histogram(
+    "redis_lock_hold_seconds",
+    "Time a Redis lock was held, from acquire to release.",
+    ["lock"],
+    buckets=(0.01, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0, 3600.0),
+)
+REDIS_LOCK_LOST = Counter(
+    "redis_lock_lost_total",
+    "Locks whose lease was taken over or expired while held.",
+    ["lock"],
+)
+
+COVERAGE_INDEX_LOOKUPS = Counter(
+    "coverage_index_lookups_total",
+    "In-process coverage index lookups by result (hit, miss).",
+    ["result"],
+)
+COVERAGE_INDEX_INVALIDATIONS = Counter(
+    "coverage_index_invalidations_total",
+    "Coverage index invalidations (one car or the whole index).",
+)
+COVERAGE_INDEX_SIZE = Gauge(
+    "coverage_index_cars",
+    "Cars currently held in the coverage index.",
+    multiprocess_mode="livesum",
+)
+
+SCHEDULER_JOB_RUNS = Counter(
+    "scheduler_job_runs_total",
+    "Scheduler job runs by outcome (done, skipped, error).",
+    ["job", "outcome"],
+)
+SCHEDULER_JOB_DURATION = Histogram(
+    "scheduler_job_duration_seconds",
+    "Scheduler job duration while holding the lock.",
+    ["job"],
+)
+SCHEDULER_LEADER = Gauge(
+    "scheduler_leader",
+    "1 while this process holds the scheduler leader lease.",
+    multiprocess_mode="livesum",
+)
+SCHEDULER_JOB_ROWS = Counter(
+    "scheduler_job_rows_total",
+    "Rows processed by scheduler jobs.",
+    ["job"],
+)
+
+
+@lru_cache(maxsize=1024)
+def _http_children(method: str, route: str):
+    # Resolve labelled children once per route instead of on every request
+    return (
+        HTTP_LATENCY.labels(method, route),
+        HTTP_RESPONSE_SIZE.labels(method, route),
+    )
+
+
+def observe_request(
+    method: str, route: str, status: int, seconds: float, size: int
+) -> None:
+    latency, response_size = _http_children(method, route)
+    latency.observe(seconds)
+    response_size.observe(size)
+    HTTP_REQUESTS.labels(method, route, str(status)).inc()
+
+
+class MetricsMiddleware:
+    """Raw ASGI middleware recording per-route latency, size and in-flight.
+
+    The route label is the matched path template (scope["route"], set by the
+    router), so `/api/cars/{car_id}` is one series however many ids are hit.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        in_flight = HTTP_IN_FLIGHT.labels(method)
+        in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_flight.dec()
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            observe_request(method, route, status, time.perf_counter() - started, size)
+
+
+def instrument_engine(engine: Engine, pool: str) -> None:
+    """Track open/checked-out connections of `engine`'s pool under label `pool`."""
+    size = getattr(engine.pool, "size", None)
+    if callable(size):
+        DB_POOL_SIZE.labels(pool).set(size())
+    open_ = DB_POOL_OPEN.labels(pool)
+    checked_out = DB_POOL_CHECKED_OUT.labels(pool)
+    event.listen(engine, "connect", lambda *a: open_.inc())
+    event.listen(engine, "close", lambda *a: open_.dec())
+    event.listen(engine, "checkout", lambda *a: checked_out.inc())
+    event.listen(engine, "checkin", lambda *a: checked_out.dec())
+
+
+def render_latest() -> tuple[bytes, str]:
+    """Exposition payload and content type for `/metrics`."""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the shared directory on shutdown."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,247 @@
+"""On-demand request profiling with a low-overhead stack sampler.
+
+With PROFILING_ENABLED set, a request carrying a valid signed token (header
+`X-Profile-Token` or query param `profile_token`) is profiled: a background
+thread samples the Python stacks of every thread each
+PROFILING_SAMPLE_INTERVAL_MS while the request runs, and the result is written
+in collapsed-stack format (`thread;frame;frame count`, one stack per line,
+readable by flamegraph.pl and speedscope) to PROFILING_DIR/<request id>.collapsed.
+The response carries the id in `X-Profile-Id`.
+
+Sampling rather than cProfile because sync endpoints run in the threadpool,
+which a cProfile session started in the middleware would not see. Stacks of
+all threads are sampled, so concurrent requests on the same worker show up
+too; one capture runs at a time per process.
+
+Tokens are `<expires unix ts>.<hmac-sha256>` signed with PROFILING_SECRET for
+a purpose ("request" to trigger a capture, "admin" for the profile endpoints);
+mint them with `python -m scripts.profile_token`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import parse_qs
+
+import structlog
+
+from core.logging import get_logger
+from core.settings import settings
+
+log = get_logger()
+
+PROFILE_TOKEN_HEADER = "X-Profile-Token"
+PROFILE_TOKEN_PARAM = "profile_token"
+PROFILE_ID_HEADER = "X-Profile-Id"
+_PROFILE_SUFFIX = ".collapsed"
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+_TOKEN_HEADER_RAW = PROFILE_TOKEN_HEADER.lower().encode("latin-1")
+_PROFILE_ID_HEADER_RAW = PROFILE_ID_HEADER.lower().encode("latin-1")
+
+# Leaf frames of threads that are blocked, not working
+_IDLE_FRAMES = {
+    "threading.py:wait",
+    "selectors.py:select",
+    "queue.py:get",
+    "threading.py:_wait_for_tstate_lock",
+}
+
+_capture_lock = threading.Lock()
+
+
+# -------------- Tokens --------------
+
+
+def sign_token(secret: str, purpose: str, expires_at: int) -> str:
+    digest = hmac.new(
+        secret.encode(), f"{purpose}:{expires_at}".encode(), hashlib.sha256
+    ).hexdigest()
+    return f"{expires_at}.{digest}"
+
+
+def verify_token(token: str | None, purpose: str, now: float | None = None) -> bool:
+    """True if `token` is unexpired and signed with PROFILING_SECRET for `purpose`."""
+    secret = settings.PROFILING_SECRET
+    if not (settings.PROFILING_ENABLED and secret and token):
+        return False
+    expires, _, _ = token.partition(".")
+    if not expires.isdigit() or int(expires) < (
+        now if now is not None else time.time()
+    ):
+        return False
+    return hmac.compare_digest(token, sign_token(secret, purpose, int(expires)))
+
+
+# -------------- Sampler --------------
+
+
+class StackSampler:
+    """Collect collapsed stacks of all other threads every `interval` seconds."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._labels: dict = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="profile-sampler", daemon=True
+        )
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = code.co_filename.rsplit("/", 1)[-1].rsplit("\\", 1)[-1]
+            label = self._labels[code] = f"{filename}:{code.co_name}"
+        return label
+
+    def _sample(self, names: dict[int, str]) -> None:
+        own = threading.get_ident()
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self._label(frame.f_code))
+                frame = frame.f_back
+            if stack[0] in _IDLE_FRAMES:
+                continue
+            stack.append(names.get(ident, str(ident)))
+            self.stacks[";".join(reversed(stack))] += 1
+
+    def _run(self) -> None:
+        names = {t.ident: t.name for t in threading.enumerate()}
+        while not self._stop.wait(self.interval):
+            self._sample(names)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> Counter[str]:
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+
+# -------------- Storage --------------
+
+
+def _profile_dir() -> Path:
+    return Path(settings.PROFILING_DIR)
+
+
+def profile_path(profile_id: str) -> Path | None:
+    """Path of a stored profile, or None if the id is unknown or malformed."""
+    if not _SAFE_ID.match(profile_id):
+        return None
+    path = _profile_dir() / f"{profile_id}{_PROFILE_SUFFIX}"
+    return path if path.is_file() else None
+
+
+def list_profiles() -> list[dict]:
+    """Stored profiles, newest first."""
+    directory = _profile_dir()
+    if not directory.is_dir():
+        return []
+    profiles = []
+    for path in directory.glob(f"*{_PROFILE_SUFFIX}"):
+        stat = path.stat()
+        profiles.append(
+            {
+                "id": path.name[: -len(_PROFILE_SUFFIX)],
+                "size_bytes": stat.st_size,
+                "created_at": datetime.fromtimestamp(stat.st_mtime, timezone.utc),
+            }
+        )
+    return sorted(profiles, key=lambda p: p["created_at"], reverse=True)
+
+
+def save_profile(profile_id: str, stacks: Counter[str]) -> Path:
+    """Write `stacks` and prune the oldest profiles beyond PROFILING_MAX_FILES."""
+    directory = _profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{profile_id}{_PROFILE_SUFFIX}"
+    path.write_text(
+        "".join(f"{stack} {count}\n" for stack, count in stacks.most_common()),
+        encoding="utf-8",
+    )
+    for old in list_profiles()[settings.PROFILING_MAX_FILES :]:
+        (directory / f"{old['id']}{_PROFILE_SUFFIX}").unlink(missing_ok=True)
+    return path
+
+
+# -------------- Middleware --------------
+
+
+def _request_token(scope) -> str | None:
+    for name, value in scope["headers"]:
+        if name == _TOKEN_HEADER_RAW:
+            return value.decode("latin-1")
+    query = scope.get("query_string", b"")
+    if PROFILE_TOKEN_PARAM.encode() in query:
+        values = parse_qs(query.decode("latin-1")).get(PROFILE_TOKEN_PARAM)
+        return values[0] if values else None
+    return None
+
+
+def _profile_id() -> str:
+    # Request ids come from a client header; only safe ones become file names
+    request_id = structlog.contextvars.get_contextvars().get("request_id")
+    if request_id and _SAFE_ID.match(request_id):
+        return request_id
+    return uuid.uuid4().hex
+
+
+class ProfilingMiddleware:
+    """Raw ASGI middleware sampling requests that carry a valid token.
+
+    Registered inside RequestContextMiddleware so the profile is keyed by the
+    request id.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not verify_token(
+            _request_token(scope), "request"
+        ):
+            await self.app(scope, receive, send)
+            return
+        if not _capture_lock.acquire(blocking=False):
+            log.warning("profile_skipped", reason="capture_in_progress")
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = _profile_id()
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                headers = [
+                    *message.get("headers", ()),
+                    (_PROFILE_ID_HEADER_RAW, profile_id.encode("latin-1")),
+                ]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        sampler = StackSampler(settings.PROFILING_SAMPLE_INTERVAL_MS / 1000)
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            stacks = sampler.stop()
+            _capture_lock.release()
+            save_profile(profile_id, stacks)
+            log.info(
+                "profile_captured",
+                profileId=profile_id,
+                samples=sum(stacks.values()),
+            )
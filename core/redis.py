@@ -1,22 +1,61 @@
-"""Redis connection and distributed lock helpers."""
+"""Redis connection, distributed lock and leader election helpers."""
 
 from __future__ import annotations
 
+import os
+import socket
+import threading
 import time
-from typing import Optional
+import uuid
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
 
 import redis
+import redis.asyncio
 
+from core.logging import get_logger
+from core.metrics import (REDIS_COMMAND_LATENCY, REDIS_LOCK_HOLD,
+                          REDIS_LOCK_LOST, REDIS_LOCK_WAIT, SCHEDULER_LEADER)
 from core.settings import settings
 
+log = get_logger()
+
+
+class _TimedRedis(redis.Redis):
+    """redis.Redis recording per-command latency."""
+
+    def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            return super().execute_command(*args, **options)
+        finally:
+            REDIS_COMMAND_LATENCY.labels(str(args[0]).upper()).observe(
+                time.perf_counter() - started
+            )
+
+
+class _TimedAsyncRedis(redis.asyncio.Redis):
+    """redis.asyncio.Redis recording per-command latency."""
+
+    async def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            REDIS_COMMAND_LATENCY.labels(str(args[0]).upper()).observe(
+                time.perf_counter() - started
+            )
+
+
 _redis_client: Optional[redis.Redis] = None
+_async_redis_client: Optional[redis.asyncio.Redis] = None
 
 
 def get_redis() -> redis.Redis:
     """Get or create a Redis client instance."""
     global _redis_client
     if _redis_client is None:
-        _redis_client = redis.Redis(
+        _redis_client = _TimedRedis(
             host=settings.REDIS_HOST,
             port=settings.REDIS_PORT,
             db=settings.REDIS_DB,
@@ -26,16 +65,274 @@ def get_redis() -> redis.Redis:
     return _redis_client
 
 
-def acquire_lock(key: str, ttl_seconds: int) -> bool:
-    """Attempt to acquire a distributed lock.
+def get_async_redis() -> redis.asyncio.Redis:
+    """Get or create an asyncio Redis client for async route handlers."""
+    global _async_redis_client
+    if _async_redis_client is None:
+        _async_redis_client = _TimedAsyncRedis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            password=settings.REDIS_PASSWORD,
+            decode_responses=True,
+        )
+    return _async_redis_client
+
 
-    Returns True if lock acquired, False otherwise.
+# -------------- Scripts --------------
+
+# SET NX + INCR in one step so every new leader gets a strictly larger token
+_ACQUIRE_LEADER = """
+if redis.call('SET', KEYS[1], ARGV[1], 'NX', 'PX', ARGV[2]) then
+    return redis.call('INCR', KEYS[2])
+end
+return false
+"""
+
+_RENEW_IF_OWNER = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_DELETE_IF_OWNER = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+# -------------- Locks --------------
+
+
+def instance_identity() -> str:
+    """Unique id of this process, used as the owner value of leases and locks."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class RedisLock:
+    """Distributed lock owned by a random token.
+
+    `acquire` is `SET NX PX <token>`; `renew` and `release` are Lua scripts
+    that only touch the key while it still holds our token, so a holder whose
+    lease expired can never extend or delete a successor's lock.
+
+    Long jobs wrap their work in `keep_alive()` and call `progress()` as they
+    go: a heartbeat thread then renews the lease every third of the TTL, but
+    only while progress was reported within the last TTL, so a stuck job
+    still loses the lock. Check `lost` before each irreversible step.
     """
-    client = get_redis()
-    return client.set(name=key, value=str(time.time()), nx=True, ex=ttl_seconds) is True
 
+    def __init__(self, key: str, ttl_seconds: float, client: redis.Redis | None = None):
+        client = client or get_redis()
+        self.key = key
+        self.ttl_seconds = ttl_seconds
+        self.token = f"{instance_identity()}:{uuid.uuid4().hex}"
+        self._client = client
+        self._renew = client.register_script(_RENEW_IF_OWNER)
+        self._release = client.register_script(_DELETE_IF_OWNER)
+        self._acquired_at: float | None = None
+        self._valid_until = 0.0
+        self._last_progress = 0.0
+        self._lost = False
+
+    def _ttl_ms(self) -> int:
+        return int(self.ttl_seconds * 1000)
+
+    @property
+    def lost(self) -> bool:
+        """True once the lease is known or presumed to be gone."""
+        return self._lost or time.monotonic() >= self._valid_until
+
+    def acquire(self, timeout: float = 0, poll_seconds: float = 0.1) -> bool:
+        """Take the lock, retrying for up to `timeout` seconds."""
+        started = time.monotonic()
+        while True:
+            attempt = time.monotonic()
+            if self._client.set(self.key, self.token, nx=True, px=self._ttl_ms()):
+                self._acquired_at = self._last_progress = attempt
+                self._valid_until = attempt + self.ttl_seconds
+                self._lost = False
+                REDIS_LOCK_WAIT.labels(self.key).observe(attempt - started)
+                return True
+            if attempt - started + poll_seconds > timeout:
+                return False
+            time.sleep(poll_seconds)
+
+    def renew(self) -> bool:
+        attempt = time.monotonic()
+        if self._renew(keys=[self.key], args=[self.token, self._ttl_ms()]):
+            self._valid_until = attempt + self.ttl_seconds
+            return True
+        return False
+
+    def progress(self) -> None:
+        """Report that the holder is still making progress."""
+        self._last_progress = time.monotonic()
+
+    def release(self) -> bool:
+        """Delete the key if we still own it; False if the lease had been lost."""
+        if self._acquired_at is None:
+            return False
+        REDIS_LOCK_HOLD.labels(self.key).observe(time.monotonic() - self._acquired_at)
+        self._acquired_at = None
+        return bool(self._release(keys=[self.key], args=[self.token]))
+
+    def _mark_lost(self, reason: str) -> None:
+        self._lost = True
+        REDIS_LOCK_LOST.labels(self.key).inc()
+        log.warning("redis_lock_lost", key=self.key, reason=reason)
+
+    def _heartbeat(self, stop: threading.Event) -> None:
+        while not stop.wait(self.ttl_seconds / 3):
+            if time.monotonic() - self._last_progress > self.ttl_seconds:
+                # Stalled: stop renewing and let the lease run out
+                continue
+            try:
+                renewed = self.renew()
+            except redis.RedisError as exc:
+                log.warning("redis_lock_renew_error", key=self.key, error=str(exc))
+                continue
+            if not renewed:
+                self._mark_lost("renew_rejected")
+                return
+
+    @contextmanager
+    def keep_alive(self) -> Iterator["RedisLock"]:
+        """Renew the lease in the background while the body reports progress."""
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=self._heartbeat,
+            args=(stop,),
+            name=f"lock-heartbeat:{self.key}",
+            daemon=True,
+        )
+        thread.start()
+        try:
+            yield self
+        finally:
+            stop.set()
+            thread.join()
+
+
+def acquire_lock(key: str, ttl_seconds: float) -> RedisLock | None:
+    """Attempt to acquire a distributed lock without waiting.
+
+    Returns the held lock, or None if another owner holds it.
+    """
+    lock = RedisLock(key, ttl_seconds)
+    return lock if lock.acquire() else None
+
+
+def release_lock(lock: RedisLock) -> None:
+    """Release a lock taken with `acquire_lock` (no-op if it was lost)."""
+    if not lock.release():
+        log.warning("redis_lock_release_skipped", key=lock.key, reason="not_owner")
+
+
+# -------------- Leader election --------------
+
+
+class LeaderElection:
+    """Lease-based leader election on one Redis key.
+
+    A background thread tries to take the lease (`SET NX PX`) every third of
+    the lease and, once leader, renews it at the same pace. Each election
+    increments `<key>:fence`; the value is kept as `fencing_token` so work can
+    be attributed to (and checked against) a single leadership term.
+
+    `is_leader` turns false as soon as the lease may have expired locally,
+    even if Redis cannot be reached to confirm it, so a partitioned leader
+    stops before a successor can start. A crashed leader is replaced within
+    about 4/3 of the lease; one that shuts down cleanly releases immediately.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        lease_seconds: float,
+        on_elected: Callable[[], None],
+        on_demoted: Callable[[], None],
+        client: redis.Redis | None = None,
+    ):
+        client = client or get_redis()
+        self.key = key
+        self.fence_key = f"{key}:fence"
+        self.identity = instance_identity()
+        self.lease_seconds = lease_seconds
+        self.interval = lease_seconds / 3
+        self.fencing_token: int | None = None
+        self._on_elected = on_elected
+        self._on_demoted = on_demoted
+        self._valid_until = 0.0
+        self._acquire = client.register_script(_ACQUIRE_LEADER)
+        self._renew = client.register_script(_RENEW_IF_OWNER)
+        self._release = client.register_script(_DELETE_IF_OWNER)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self.fencing_token is not None and time.monotonic() < self._valid_until
+
+    def _lease_ms(self) -> int:
+        return int(self.lease_seconds * 1000)
+
+    def _demote(self, reason: str) -> None:
+        token, self.fencing_token = self.fencing_token, None
+        SCHEDULER_LEADER.set(0)
+        log.warning("leader_demoted", key=self.key, reason=reason, fencingToken=token)
+        self._on_demoted()
+
+    def step(self) -> None:
+        """One election round: acquire the lease or renew the one we hold."""
+        started = time.monotonic()
+        try:
+            if self.fencing_token is None:
+                token = self._acquire(
+                    keys=[self.key, self.fence_key],
+                    args=[self.identity, self._lease_ms()],
+                )
+                if token:
+                    self.fencing_token = int(token)
+                    self._valid_until = started + self.lease_seconds
+                    SCHEDULER_LEADER.set(1)
+                    log.info(
+                        "leader_elected", key=self.key, fencingToken=self.fencing_token
+                    )
+                    self._on_elected()
+            elif self._renew(keys=[self.key], args=[self.identity, self._lease_ms()]):
+                self._valid_until = started + self.lease_seconds
+            else:
+                self._demote("lease_lost")
+        except redis.RedisError as exc:
+            log.warning("leader_election_error", key=self.key, error=str(exc))
+            if self.fencing_token is not None and not self.is_leader:
+                self._demote("lease_expired")
+
+    def _run(self) -> None:
+        while True:
+            self.step()
+            if self._stop.wait(self.interval):
+                return
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name=f"leader-election:{self.key}", daemon=True
+        )
+        self._thread.start()
 
-def release_lock(key: str) -> None:
-    """Release a distributed lock by key."""
-    client = get_redis()
-    client.delete(key)
+    def stop(self) -> None:
+        """Stop campaigning and hand the lease over right away if we hold it."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self.fencing_token is None:
+            return
+        try:
+            self._release(keys=[self.key], args=[self.identity])
+        except redis.RedisError as exc:
+            log.warning("leader_release_error", key=self.key, error=str(exc))
+        self._demote("shutdown")
@@ -19,10 +19,64 @@ class Settings(BaseSettings):
     SCHEDULER_INTERVAL_MINUTES: int = 10
     SCHEDULER_ENABLED: bool = True
     SCHEDULER_TIMEZONE: str = "UTC"
+    # interval: poll every SCHEDULER_INTERVAL_MINUTES; event: one-shot job at
+    # midnight of the next date with unlogged expiries
+    SCHEDULER_MODE: str = "interval"
+    SCHEDULER_EXPIRY_CHANNEL: str = "policy-expiry-changed"
+    SCHEDULER_RESYNC_HOURS: int = 24
+    # Only the worker holding the Redis lease runs the scheduler
+    SCHEDULER_LEADER_ELECTION: bool = True
+    SCHEDULER_LEADER_KEY: str = "scheduler-leader"
+    # Failover bound: a crashed leader is replaced within ~4/3 of this
+    SCHEDULER_LEADER_LEASE_SECONDS: float = 15
     LOG_LEVEL: str | None = None
+    ASYNC_DB_ENABLED: bool = False
+    # Comma-separated SQLAlchemy URLs of read replicas; empty = primary only
+    DATABASE_REPLICA_URLS: str = ""
+    REPLICA_MAX_LAG_SECONDS: float = 5.0
+    REPLICA_HEALTH_CHECK_INTERVAL_SECONDS: float = 10.0
+    REPLICA_RETRY_AFTER_SECONDS: float = 30.0
+    REPLICA_CONNECT_TIMEOUT_SECONDS: int = 2
     # POLICY_DATE_MODE: str = "date_only"
     REDIS_LOCK_KEY: str = "policy-expiry-lock"
     REDIS_LOCK_TTL_SECONDS: int = 60
+    EXPIRY_JOB_CHUNK_SIZE: int = 1000
+    # Each run also logs expiries missed on this many previous days (0 = off)
+    EXPIRY_CATCHUP_DAYS: int = 3
+    EXPIRY_CATCHUP_CHECKPOINT_KEY: str = "policy-expiry-catchup"
+    # Expiry events: outbox table relayed to a Redis Stream by the leader
+    EXPIRY_OUTBOX_ENABLED: bool = True
+    EXPIRY_OUTBOX_STREAM: str = "policy-expiry-events"
+    EXPIRY_OUTBOX_STREAM_MAXLEN: int = 1_000_000
+    EXPIRY_OUTBOX_BATCH_SIZE: int = 500
+    EXPIRY_OUTBOX_RELAY_INTERVAL_SECONDS: float = 2
+    PAGINATION_DEFAULT_LIMIT: int = 50
+    PAGINATION_MAX_LIMIT: int = 500
+    EXPORT_BATCH_SIZE: int = 1000
+    VALIDITY_BATCH_MAX_ITEMS: int = 500
+    BULK_BATCH_SIZE: int = 1000
+    BULK_MAX_ITEMS: int = 50_000
+    COVERAGE_INDEX_ENABLED: bool = False
+    COVERAGE_INDEX_MAX_CARS: int = 100_000
+    COVERAGE_INDEX_TTL_SECONDS: int = 300
+    CACHE_ENABLED: bool = False
+    CACHE_CAR_TTL_SECONDS: int = 60
+    CACHE_POLICY_TTL_SECONDS: int = 300
+    METRICS_ENABLED: bool = True
+    QUERY_BUDGET_STRICT: bool = False
+    QUERY_BUDGET_MAX_STATEMENTS: int = 25
+    QUERY_BUDGET_MAX_REPEATS: int = 10
+    # 0 disables the slow-query log
+    SLOW_QUERY_THRESHOLD_MS: float = 200
+    SLOW_QUERY_EXPLAIN: bool = False
+    SLOW_QUERY_EXPLAIN_PER_MINUTE: int = 6
+    SLOW_QUERY_EXPLAIN_COOLDOWN_SECONDS: int = 600
+    PROFILING_ENABLED: bool = False
+    # Signs profiling tokens; profiling stays off while unset
+    PROFILING_SECRET: str | None = None
+    PROFILING_DIR: str = "profiles"
+    PROFILING_SAMPLE_INTERVAL_MS: float = 5
+    PROFILING_MAX_FILES: int = 50
 
     @property
     def DATABASE_URL(self) -> str:
@@ -32,6 +86,11 @@ class Settings(BaseSettings):
             f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
+    @property
+    def replica_urls(self) -> list[str]:
+        """Parsed DATABASE_REPLICA_URLS."""
+        return [u.strip() for u in self.DATABASE_REPLICA_URLS.split(",") if u.strip()]
+
     class Config:
         env_file = ".env"
         extra = "ignore"
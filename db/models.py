@@ -5,8 +5,8 @@ from __future__ import annotations
 from datetime import date, datetime
 from decimal import Decimal
 
-from sqlalchemy import (Date, DateTime, ForeignKey, Integer, Numeric, String,
-                        Text, func)
+from sqlalchemy import (BigInteger, Date, DateTime, ForeignKey, Index, Integer,
+                        Numeric, String, Text, func, text)
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -77,7 +77,40 @@ class InsurancePolicy(Base):
 
     car: Mapped["Car"] = relationship(back_populates="policies")
 
-    __table_args__ = ()
+    __table_args__ = (
+        # Scheduler lookup: end_date = :d AND logged_expiry_at IS NULL
+        Index(
+            "ix_insurance_policy_end_date_unlogged",
+            "end_date",
+            postgresql_where=text("logged_expiry_at IS NULL"),
+            sqlite_where=text("logged_expiry_at IS NULL"),
+        ),
+    )
+
+
+class PolicyExpiryOutbox(Base):
+    """Policy expiry events waiting to be relayed to the Redis Stream.
+
+    Written in the transaction that marks the policy as logged; rows are
+    deleted once relayed, so the table only holds the backlog.
+    """
+
+    __tablename__ = "policy_expiry_outbox"
+
+    # Relay order; SQLite only autoincrements INTEGER primary keys
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True
+    )
+    # No foreign keys: the event stays valid if the policy is deleted
+    policy_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    car_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    end_date: Mapped[date] = mapped_column(Date, nullable=False)
+    logged_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=False), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.now()
+    )
 
 
 class Claim(Base):
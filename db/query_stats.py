@@ -0,0 +1,142 @@
+"""Per-request SQL statement counting and N+1 detection.
+
+`install(engine)` hooks cursor events so every statement executed while a
+`QueryStats` is active (see `track`) is counted and timed. Statements are also
+grouped by shape (whitespace and IN-list length normalised) so a lazy load in a
+loop shows up as one shape repeated many times.
+
+With QUERY_BUDGET_STRICT enabled the statement that exceeds the budget raises
+`QueryBudgetExceeded` before it runs, so the traceback points at the caller.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import Engine, event
+
+from core.settings import settings
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+# "(?, ?, ?)", "(%s, %s)", "(%(p_1)s, ...)", "($1, $2)" -> "(?)"
+_PARAM_LIST = re.compile(
+    r"\(\s*(?:\?|%s|%\(\w+\)s|\$\d+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|\$\d+))*\s*\)"
+)
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised in strict mode when a request runs too many (or repeated) statements."""
+
+    def __init__(self, message: str, shape: str):
+        super().__init__(message)
+        self.shape = shape
+
+
+def statement_shape(statement: str) -> str:
+    """Normalise a statement so repeated executions compare equal."""
+    return _PARAM_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+@dataclass
+class QueryStats:
+    # None disables the corresponding check
+    max_statements: int | None = field(
+        default_factory=lambda: settings.QUERY_BUDGET_MAX_STATEMENTS
+    )
+    max_repeats: int | None = field(
+        default_factory=lambda: settings.QUERY_BUDGET_MAX_REPEATS
+    )
+    strict: bool = field(default_factory=lambda: settings.QUERY_BUDGET_STRICT)
+    count: int = 0
+    total_seconds: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+
+    @property
+    def db_time_ms(self) -> float:
+        return round(self.total_seconds * 1000, 3)
+
+    def most_repeated(self) -> tuple[str, int] | None:
+        common = self.shapes.most_common(1)
+        return common[0] if common else None
+
+    def violations(self) -> list[str]:
+        """Budget problems for the statements seen so far."""
+        problems = []
+        if self.max_statements is not None and self.count > self.max_statements:
+            problems.append(f"{self.count} statements (budget {self.max_statements})")
+        repeated = self.most_repeated()
+        if repeated and self.max_repeats is not None and repeated[1] > self.max_repeats:
+            problems.append(
+                f"same statement {repeated[1]} times (budget {self.max_repeats}),"
+                " likely N+1"
+            )
+        return problems
+
+    def record(self, statement: str) -> None:
+        shape = statement_shape(statement)
+        self.count += 1
+        self.shapes[shape] += 1
+        if self.strict and (problems := self.violations()):
+            raise QueryBudgetExceeded("; ".join(problems), shape)
+
+
+def current() -> QueryStats | None:
+    """Stats for the active request, if any."""
+    return _current.get()
+
+
+@contextmanager
+def track(stats: QueryStats | None = None) -> Iterator[QueryStats]:
+    """Count statements executed in this context (and threads copied from it)."""
+    stats = stats or QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def query_budget(max_statements: int | None, max_repeats: int | None):
+    """FastAPI dependency overriding the budget for routes heavy by design.
+
+    Use as `dependencies=[Depends(query_budget(...))]`; None means unlimited.
+    """
+
+    def dependency() -> None:
+        stats = _current.get()
+        if stats is not None:
+            stats.max_statements = max_statements
+            stats.max_repeats = max_repeats
+
+    return dependency
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+    stats.record(statement)
+    if context is not None:
+        context._query_stats_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    started = getattr(context, "_query_stats_started", None)
+    if stats is not None and started is not None:
+        stats.total_seconds += time.perf_counter() - started
+
+
+def install(engine: Engine) -> None:
+    """Attach the counting hooks to `engine` (idempotent)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,215 @@
+"""Read-replica routing: a replica pool with lag/health checks and a routing session.
+
+Read-only sessions get a replica chosen round-robin among replicas that are
+reachable and within `REPLICA_MAX_LAG_SECONDS` of the primary; when none are,
+they fall back to the primary. Writes (flushes and INSERT/UPDATE/DELETE or
+SELECT ... FOR UPDATE statements) always go to the primary, and a session that
+has written stays on the primary so it reads its own writes. A read that fails
+because its replica is unreachable is retried once on the primary, where the
+session then stays; the error is kept in `replica_error` for the caller to
+mark the replica down.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import (Delete, Engine, Insert, Result, Select, Update,
+                        create_engine, event, text)
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from core.logging import get_logger
+
+log = get_logger()
+
+# Seconds of replay lag; 0 when fully caught up (an idle primary must not look
+# like lag) or when the server is not a standby at all.
+PG_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+@dataclass
+class Replica:
+    """One replica: sync engine (probes, sync sessions) plus its async twin."""
+
+    url: str
+    engine: Engine
+    async_engine: AsyncEngine | None = None
+    healthy: bool = True
+    next_check: float = 0.0
+
+
+class ReplicaPool:
+    """Round-robin replica selection with cached health and staleness checks."""
+
+    def __init__(
+        self,
+        urls: list[str],
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+        retry_after_seconds: float,
+        connect_timeout_seconds: int,
+        with_async: bool = True,
+    ):
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self.replicas: list[Replica] = []
+        for url in urls:
+            connect_args = {}
+            if make_url(url).get_backend_name() == "postgresql":
+                connect_args["connect_timeout"] = connect_timeout_seconds
+            self.replicas.append(
+                Replica(
+                    url=url,
+                    engine=create_engine(
+                        url, pool_pre_ping=True, connect_args=connect_args
+                    ),
+                    async_engine=(
+                        create_async_engine(
+                            url, pool_pre_ping=True, connect_args=connect_args
+                        )
+                        if with_async
+                        else None
+                    ),
+                )
+            )
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def choose(self, block: bool = True) -> Replica | None:
+        """Return a usable replica, or None to fall back to the primary.
+
+        With `block=False` (async callers on the event loop) due health checks
+        run in a background thread and the cached state is used meanwhile.
+        """
+        n = len(self.replicas)
+        if not n:
+            return None
+        start = next(self._counter)
+        for offset in range(n):
+            replica = self.replicas[(start + offset) % n]
+            if self._usable(replica, block):
+                return replica
+        return None
+
+    def mark_down(self, replica: Replica) -> None:
+        replica.healthy = False
+        replica.next_check = time.monotonic() + self.retry_after_seconds
+
+    def _usable(self, replica: Replica, block: bool = True) -> bool:
+        now = time.monotonic()
+        if now < replica.next_check:
+            return replica.healthy
+        # One thread probes; others keep using the last known state meanwhile
+        if not self._lock.acquire(blocking=False):
+            return replica.healthy
+        if block:
+            self._check(replica)
+        else:
+            threading.Thread(
+                target=self._check, args=(replica,), name="replica-probe", daemon=True
+            ).start()
+        return replica.healthy
+
+    def _check(self, replica: Replica) -> None:
+        """Probe `replica` and cache the result; releases `_lock`."""
+        try:
+            replica.healthy = self._probe(replica)
+            delay = (
+                self.check_interval_seconds
+                if replica.healthy
+                else self.retry_after_seconds
+            )
+            replica.next_check = time.monotonic() + delay
+        finally:
+            self._lock.release()
+
+    def _probe(self, replica: Replica) -> bool:
+        try:
+            with replica.engine.connect() as conn:
+                if conn.dialect.name == "postgresql":
+                    lag = float(conn.execute(PG_LAG_SQL).scalar() or 0)
+                else:
+                    conn.execute(text("SELECT 1"))
+                    lag = 0.0
+        except Exception:
+            log.warning("replica_unavailable", replica=_safe_url(replica.url))
+            return False
+        if lag > self.max_lag_seconds:
+            log.warning(
+                "replica_lagging", replica=_safe_url(replica.url), lagSeconds=lag
+            )
+            return False
+        return True
+
+
+def replica_failed(session: RoutingSession, exc: DBAPIError) -> bool:
+    """True if `exc`, raised in `session`, means its replica is unreachable.
+
+    Failed connects raise OperationalError without `connection_invalidated`;
+    errors after the session pinned itself to the primary are not the
+    replica's.
+    """
+    if session.replica_bind is None or session._pinned_to_primary:
+        return False
+    return exc.connection_invalidated or isinstance(exc, OperationalError)
+
+
+def _safe_url(url: str) -> str:
+    return make_url(url).render_as_string(hide_password=True)
+
+
+class RoutingSession(Session):
+    """Session that sends reads to `replica_bind` and everything else to `bind`."""
+
+    def __init__(self, *args, replica_bind: Engine | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replica_bind = replica_bind
+        self.replica_error: DBAPIError | None = None
+        self._pinned_to_primary = False
+
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        if self.replica_bind is None or self._pinned_to_primary:
+            return super().get_bind(mapper, clause=clause, **kw)
+        is_write = self._flushing or isinstance(clause, (Insert, Update, Delete))
+        if isinstance(clause, Select) and clause._for_update_arg is not None:
+            is_write = True
+        if is_write:
+            self._pinned_to_primary = True
+            return super().get_bind(mapper, clause=clause, **kw)
+        return self.replica_bind
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _retry_on_primary(state: ORMExecuteState) -> Result | None:
+    """Run the statement; if the replica is unreachable, run it on the primary."""
+    session = state.session
+    if session.replica_bind is None or session._pinned_to_primary:
+        return None
+    try:
+        return state.invoke_statement()
+    except DBAPIError as exc:
+        if not replica_failed(session, exc):
+            raise
+        log.warning(
+            "replica_read_failed",
+            replica=session.replica_bind.url.render_as_string(hide_password=True),
+            error=type(exc.orig).__name__,
+        )
+        session.replica_error = exc
+        session.replica_bind = None
+    return state.invoke_statement()
@@ -1,9 +1,13 @@
 """SQLAlchemy session and engine setup."""
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
+from core.metrics import instrument_engine
 from core.settings import settings
+from db import query_stats, slow_queries
+from db.replicas import ReplicaPool, RoutingSession
 
 engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True, future=True)
 
@@ -12,6 +16,64 @@ SESSION_LOCAL = sessionmaker(
     bind=engine, autoflush=False, autocommit=False, future=True
 )
 
+# Async stack (psycopg async driver) used by route handlers running on the
+# event loop when ASYNC_DB_ENABLED is set. Engines connect lazily.
+async_engine = create_async_engine(settings.DATABASE_URL, pool_pre_ping=True)
+
+# expire_on_commit=False: async sessions cannot lazy-load expired attributes
+ASYNC_SESSION_LOCAL = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+# Read replicas (optional). Read sessions route SELECTs to a healthy replica
+# and anything that writes to the primary bound above.
+replica_pool = (
+    ReplicaPool(
+        settings.replica_urls,
+        max_lag_seconds=settings.REPLICA_MAX_LAG_SECONDS,
+        check_interval_seconds=settings.REPLICA_HEALTH_CHECK_INTERVAL_SECONDS,
+        retry_after_seconds=settings.REPLICA_RETRY_AFTER_SECONDS,
+        connect_timeout_seconds=settings.REPLICA_CONNECT_TIMEOUT_SECONDS,
+    )
+    if settings.replica_urls
+    else None
+)
+
+# Per-request statement counting (see api.middleware), slow-query log and
+# pool gauges for /metrics. EXPLAIN for async engines runs on the sync engine
+# of the same database.
+query_stats.install(engine)
+query_stats.install(async_engine.sync_engine)
+slow_queries.install(engine)
+slow_queries.install(async_engine.sync_engine, explain_engine=engine)
+instrument_engine(engine, "primary")
+instrument_engine(async_engine.sync_engine, "primary_async")
+for _replica in replica_pool.replicas if replica_pool else ():
+    query_stats.install(_replica.engine)
+    slow_queries.install(_replica.engine)
+    instrument_engine(_replica.engine, "replica")
+    if _replica.async_engine is not None:
+        query_stats.install(_replica.async_engine.sync_engine)
+        slow_queries.install(
+            _replica.async_engine.sync_engine, explain_engine=_replica.engine
+        )
+        instrument_engine(_replica.async_engine.sync_engine, "replica_async")
+
+READ_SESSION_LOCAL = sessionmaker(
+    bind=engine,
+    class_=RoutingSession,
+    autoflush=False,
+    autocommit=False,
+    future=True,
+)
+
+ASYNC_READ_SESSION_LOCAL = async_sessionmaker(
+    bind=async_engine,
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 
 def get_db():
     """Yield a database session for dependency injection."""
@@ -20,3 +82,35 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Yield an async database session for dependency injection."""
+    async with ASYNC_SESSION_LOCAL() as db:
+        yield db
+
+
+def get_read_db():
+    """Yield a session for read-only routes, routed to a replica when available."""
+    replica = replica_pool.choose() if replica_pool else None
+    db = READ_SESSION_LOCAL(replica_bind=replica.engine if replica else None)
+    try:
+        yield db
+    finally:
+        # Set when a read failed on the replica and was retried on the primary
+        if db.replica_error is not None:
+            replica_pool.mark_down(replica)
+        db.close()
+
+
+async def get_async_read_db():
+    """Async variant of `get_read_db`."""
+    # Never probe on the event loop: connect + lag query would stall it
+    replica = replica_pool.choose(block=False) if replica_pool else None
+    replica_bind = replica.async_engine.sync_engine if replica else None
+    async with ASYNC_READ_SESSION_LOCAL(replica_bind=replica_bind) as db:
+        try:
+            yield db
+        finally:
+            if db.sync_session.replica_error is not None:
+                replica_pool.mark_down(replica)
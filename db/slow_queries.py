@@ -0,0 +1,183 @@
+"""Slow-query log with optional, rate-limited EXPLAIN capture.
+
+`install(engine)` times every cursor execution. Statements slower than
+SLOW_QUERY_THRESHOLD_MS are logged as `slow_query` with the normalised SQL,
+redacted parameters (types only, never values) and the duration; the request
+id comes from the structlog context like every other request log line.
+
+With SLOW_QUERY_EXPLAIN enabled the plan of a slow statement is captured with
+`EXPLAIN (ANALYZE false, FORMAT JSON)` on a separate pooled connection in a
+background thread and logged as `slow_query_explain`. The statement is not
+re-executed. Capture is bounded so it cannot add meaningful load itself:
+at most one EXPLAIN runs at a time, at most SLOW_QUERY_EXPLAIN_PER_MINUTE
+start per minute, and each statement shape is explained at most once per
+SLOW_QUERY_EXPLAIN_COOLDOWN_SECONDS. Anything over those limits is dropped.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any
+
+import structlog
+from sqlalchemy import Engine, event
+
+from core.logging import get_logger
+from core.settings import settings
+from db.query_stats import statement_shape
+
+log = get_logger()
+
+# Connections running EXPLAIN carry this option so they are not timed again
+_LOG_OPTION = "slow_query_log"
+
+_EXPLAIN_PREFIX = {
+    "postgresql": "EXPLAIN (ANALYZE false, FORMAT JSON) ",
+    # Local development on SQLite
+    "sqlite": "EXPLAIN QUERY PLAN ",
+}
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+_MAX_TRACKED_SHAPES = 1000
+
+
+def redact(parameters: Any) -> Any:
+    """Replace bound values with their type names, keeping the structure."""
+    if isinstance(parameters, dict):
+        return {k: redact(v) for k, v in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact(v) for v in parameters]
+    return None if parameters is None else type(parameters).__name__
+
+
+class ExplainLimiter:
+    """Admission control for EXPLAIN captures (see module docstring)."""
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._started: deque[float] = deque()
+        self._last_by_shape: dict[str, float] = {}
+        self.inflight: Future | None = None
+
+    def submit(self, executor: Executor, shape: str, fn, *args) -> Future | None:
+        """Start `fn(*args)` on `executor` if the limits allow, else drop it."""
+        now = self._clock()
+        with self._lock:
+            if self.inflight is not None and not self.inflight.done():
+                return None
+            while self._started and now - self._started[0] >= 60:
+                self._started.popleft()
+            if len(self._started) >= settings.SLOW_QUERY_EXPLAIN_PER_MINUTE:
+                return None
+            last = self._last_by_shape.get(shape)
+            cooldown = settings.SLOW_QUERY_EXPLAIN_COOLDOWN_SECONDS
+            if last is not None and now - last < cooldown:
+                return None
+            if len(self._last_by_shape) >= _MAX_TRACKED_SHAPES:
+                self._last_by_shape.clear()
+            self._started.append(now)
+            self._last_by_shape[shape] = now
+            self.inflight = executor.submit(fn, *args)
+            return self.inflight
+
+
+limiter = ExplainLimiter()
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+
+
+def _explain(
+    engine: Engine, statement: str, parameters: Any, shape: str, request_id: str | None
+) -> None:
+    prefix = _EXPLAIN_PREFIX[engine.dialect.name]
+    try:
+        with engine.connect() as conn:
+            rows = (
+                conn.execution_options(**{_LOG_OPTION: False})
+                .exec_driver_sql(prefix + statement, parameters)
+                .all()
+            )
+    except Exception as exc:
+        log.warning(
+            "slow_query_explain_failed",
+            sql=shape,
+            error=str(exc),
+            request_id=request_id,
+        )
+        return
+    plan = (
+        rows[0][0] if engine.dialect.name == "postgresql" else [list(r) for r in rows]
+    )
+    log.info("slow_query_explain", sql=shape, plan=plan, request_id=request_id)
+
+
+def _maybe_explain(
+    explain_engine: Engine, statement: str, parameters: Any, shape: str
+) -> None:
+    if explain_engine.dialect.name not in _EXPLAIN_PREFIX:
+        return
+    if not statement.lstrip()[:6].upper().startswith(_EXPLAINABLE):
+        return
+    # Runs outside the request context on purpose: the EXPLAIN must not count
+    # towards the request's query budget
+    request_id = structlog.contextvars.get_contextvars().get("request_id")
+    limiter.submit(
+        _executor,
+        shape,
+        _explain,
+        explain_engine,
+        statement,
+        parameters,
+        shape,
+        request_id,
+    )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._slow_query_started = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany, explain_engine
+):
+    started = getattr(context, "_slow_query_started", None)
+    threshold_ms = settings.SLOW_QUERY_THRESHOLD_MS
+    if started is None or not threshold_ms:
+        return
+    duration_ms = (time.perf_counter() - started) * 1000
+    if duration_ms < threshold_ms or not conn.get_execution_options().get(
+        _LOG_OPTION, True
+    ):
+        return
+    shape = statement_shape(statement)
+    log.warning(
+        "slow_query",
+        sql=shape,
+        params=redact(parameters[0] if executemany else parameters),
+        executemany=executemany,
+        durationMs=round(duration_ms, 3),
+    )
+    if settings.SLOW_QUERY_EXPLAIN and not executemany:
+        _maybe_explain(explain_engine, statement, parameters, shape)
+
+
+def install(engine: Engine, explain_engine: Engine | None = None) -> None:
+    """Time statements on `engine` (idempotent).
+
+    EXPLAIN runs on `explain_engine` (default: `engine` itself); pass the sync
+    engine for the same database when `engine` belongs to an AsyncEngine.
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    explain_engine = explain_engine or engine
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        _after_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany, explain_engine
+        )
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
@@ -1,14 +1,22 @@
 import warnings
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI
 
 from api.errors import register_exception_handlers
+from api.middleware import RequestContextMiddleware
+from api.routers.async_reads import async_reads_router
+from api.routers.bulk import bulk_router
 from api.routers.cars import cars_router
 from api.routers.claims import claims_router
+from api.routers.export import export_router
 from api.routers.health import health_router
+from api.routers.metrics import metrics_router
 from api.routers.policies import policies_router
+from api.routers.profiles import profiles_router
 from core.logging import configure_logging, get_logger
+from core.metrics import MetricsMiddleware, mark_process_dead
+from core.profiling import ProfilingMiddleware
 from core.settings import settings
 from services.scheduler import start_scheduler, stop_scheduler
 
@@ -20,9 +28,6 @@ warnings.filterwarnings(
 log = get_logger()
 
 
-REQUEST_ID_HEADER = "X-Request-ID"
-
-
 def _build_lifespan(enable_scheduler: bool, configure_logs: bool):
     """Return a lifespan context manager configured for the requested flags."""
 
@@ -45,6 +50,7 @@ def _build_lifespan(enable_scheduler: bool, configure_logs: bool):
         # Shutdown
         if enable_scheduler:
             stop_scheduler()
+        mark_process_dead()
 
     return lifespan
 
@@ -68,36 +74,31 @@ def create_app(
     )
     app = FastAPI(title="Car Insurance API", version="0.1.0", lifespan=lifespan)
 
+    if settings.PROFILING_ENABLED:
+        # Inside the request context so profiles are keyed by request id
+        app.add_middleware(ProfilingMiddleware)
+
     # Middleware: bind request_id and request metadata
-    @app.middleware("http")
-    async def request_context_middleware(request: Request, call_next):  # type: ignore[unused-ignore]
-        import uuid
-
-        import structlog
-
-        # Extract/generate request id
-        request_id = request.headers.get(REQUEST_ID_HEADER) or str(uuid.uuid4())
-        structlog.contextvars.bind_contextvars(
-            request_id=request_id, path=request.url.path, method=request.method
-        )
-        try:
-            response: Response = await call_next(request)
-        except Exception:
-            # Ensure stack trace is logged with context (global exception handler may also run)
-            log.exception("unhandled_exception")
-            raise
-        finally:
-            # Clear to avoid leaking a cross tasks
-            structlog.contextvars.clear_contextvars()
-        # Propagate request id header
-        response.headers.setdefault(REQUEST_ID_HEADER, request_id)
-        return response
+    app.add_middleware(RequestContextMiddleware)
+
+    if settings.METRICS_ENABLED:
+        # Added last so it is outermost: latency includes the other middleware
+        app.add_middleware(MetricsMiddleware)
 
     # Routers
+    if settings.ASYNC_DB_ENABLED:
+        # Registered first so async handlers win for the GET paths they cover
+        app.include_router(async_reads_router, prefix="/api")
+    if settings.METRICS_ENABLED:
+        app.include_router(metrics_router)
+    if settings.PROFILING_ENABLED:
+        app.include_router(profiles_router)
     app.include_router(health_router, prefix="/api")
     app.include_router(cars_router, prefix="/api")
     app.include_router(policies_router, prefix="/api")
     app.include_router(claims_router, prefix="/api")
+    app.include_router(export_router, prefix="/api")
+    app.include_router(bulk_router, prefix="/api")
 
     register_exception_handlers(app)
     return app
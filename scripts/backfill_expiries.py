@@ -0,0 +1,99 @@
+"""Log expiries for a range of past days the scheduler never processed.
+
+Usage (from project root with venv active and docker db/redis running):
+    python -m scripts.backfill_expiries --from 2025-01-01 --to 2025-06-30
+
+Flags:
+    --from / --to     First and last day to process, inclusive (--to defaults
+                      to yesterday in SCHEDULER_TIMEZONE)
+    --chunk-size      Rows per UPDATE ... RETURNING + commit
+    --no-resume       Ignore the checkpoint of a previous run of the same range
+
+Days without unlogged expiries are skipped with one indexed MIN query each, so
+the cost is proportional to the rows marked, not to the length of the range.
+The last finished day is checkpointed in Redis; rerunning the same range after
+an interruption continues from the day after it. A Redis lock keeps two
+backfills from running at once (the scheduler job may run alongside: both only
+touch rows still unlogged).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from core.redis import acquire_lock, release_lock
+from core.settings import settings
+from db.session import SESSION_LOCAL
+from services.expiry_service import ExpiryRunAborted, catch_up_expiries
+
+JOB = "policy_expiry_backfill"
+LOCK_KEY = f"{settings.REDIS_LOCK_KEY}:backfill"
+
+
+def parse_args(argv=None):
+    yesterday = datetime.now(ZoneInfo(settings.SCHEDULER_TIMEZONE)).date() - timedelta(
+        days=1
+    )
+    parser = argparse.ArgumentParser(description="Backfill policy expiry logging")
+    parser.add_argument("--from", dest="start", type=date.fromisoformat, required=True)
+    parser.add_argument("--to", dest="end", type=date.fromisoformat, default=yesterday)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--no-resume", dest="resume", action="store_false")
+    return parser.parse_args(argv)
+
+
+def run(start: date, end: date, chunk_size: int, resume: bool = True) -> int:
+    """Backfill `start`..`end`; returns the number of policies marked."""
+    lock = acquire_lock(LOCK_KEY, settings.REDIS_LOCK_TTL_SECONDS)
+    if not lock:
+        sys.exit("Another backfill is running")
+    logged_at = datetime.now(ZoneInfo(settings.SCHEDULER_TIMEZONE))
+    day_started = time.perf_counter()
+
+    def on_day(day: date, count: int) -> None:
+        nonlocal day_started
+        elapsed = time.perf_counter() - day_started
+        print(
+            f"{day}  {count:>8} rows  {count / elapsed if elapsed else 0:>10.0f} rows/s"
+        )
+        day_started = time.perf_counter()
+
+    started = time.perf_counter()
+    db = SESSION_LOCAL()
+    try:
+        with lock.keep_alive():
+            total = catch_up_expiries(
+                db,
+                start,
+                end,
+                logged_at,
+                chunk_size,
+                JOB,
+                resume=resume,
+                stop=lambda: "lock_lost" if lock.lost else None,
+                progress=lock.progress,
+                on_day=on_day,
+            )
+    except ExpiryRunAborted as exc:
+        sys.exit(f"Aborted ({exc.reason}); rerun to resume")
+    finally:
+        db.close()
+        release_lock(lock)
+    elapsed = time.perf_counter() - started
+    print(f"Done: {total} rows in {elapsed:.1f}s")
+    return total
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.start > args.end:
+        sys.exit("--from is after --to")
+    run(args.start, args.end, chunk_size=args.chunk_size, resume=args.resume)
+
+
+if __name__ == "__main__":
+    main()
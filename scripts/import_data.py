@@ -0,0 +1,322 @@
+"""Bulk-import owners, cars, policies and claims from CSV or NDJSON files.
+
+Usage (from project root with venv active and docker db running):
+    python -m scripts.import_data --owners owners.csv --cars cars.ndjson \
+        --policies policies.csv --claims claims.csv --batch-size 50000
+
+Flags:
+    --owners / --cars / --policies / --claims
+                          Input file per resource (any subset; imported in that order)
+    --format              csv | ndjson | auto (default: from the file extension)
+    --batch-size          Rows per COPY + upsert transaction
+
+Records are streamed from disk in --batch-size chunks, loaded into a temporary
+staging table with `COPY ... FROM STDIN` and then merged into the real tables
+with one set-based statement per chunk. Memory stays bounded by the chunk size.
+
+Columns (snake_case or camelCase; CSV needs a header row):
+    owners    name, email
+    cars      vin, make, model, year_of_manufacture, owner_email
+    policies  vin, provider, start_date, end_date
+    claims    vin, claim_date, description, amount
+
+References are resolved by natural key: cars -> owner by email, policies and
+claims -> car by VIN. Rows whose reference does not resolve are skipped.
+Re-running an import is safe: owners are matched by email, cars are upserted
+on VIN and identical policies/claims are not inserted twice. "Written" counts
+input rows that inserted or changed something; the rest were skipped,
+duplicates within the file, or already up to date.
+
+Imports write straight to the tables and bypass the services: the Redis read
+cache keeps serving updated cars until CACHE_CAR_TTL_SECONDS, each API worker's
+coverage index keeps old coverage until COVERAGE_INDEX_TTL_SECONDS, and no
+expiry signal is published, so in SCHEDULER_MODE=event imported expiries are
+scheduled by the next resync (SCHEDULER_RESYNC_HOURS). Flush the read cache
+and restart the API after a large import if that matters.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+import time
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from core.config import to_camel
+from db.session import engine
+
+# -------------- Resources --------------
+
+
+@dataclass(frozen=True)
+class Resource:
+    stage: str
+    # (column, staging type); values are cast by COPY
+    columns: tuple[tuple[str, str], ...]
+    # Set-based merge statements run after each COPY, in order. Each counts
+    # input rows it inserted or changed: its rowcount, or the single value
+    # it returns when one input row can touch several table rows.
+    merges: tuple[str, ...]
+
+    def create_stage_sql(self) -> str:
+        cols = ", ".join(f"{name} {type_}" for name, type_ in self.columns)
+        # n = input ordinal, so "last row wins" for duplicate keys in a chunk
+        return (
+            f"CREATE TEMP TABLE IF NOT EXISTS {self.stage} (n bigint, {cols}) "
+            "ON COMMIT DELETE ROWS"
+        )
+
+    def copy_sql(self) -> str:
+        cols = ", ".join(name for name, _ in self.columns)
+        return f"COPY {self.stage} (n, {cols}) FROM STDIN"
+
+
+# One owner id per email; owner.email is not unique, oldest row wins
+_OWNER_BY_EMAIL = (
+    "(SELECT DISTINCT ON (email) id, email FROM owner "
+    "WHERE email IS NOT NULL ORDER BY email, id)"
+)
+
+RESOURCES: dict[str, Resource] = {
+    "owners": Resource(
+        stage="stage_owner",
+        columns=(("name", "text"), ("email", "text")),
+        merges=(
+            # owner.email is not unique: count emails, not updated rows
+            """
+            WITH updated AS (
+                UPDATE owner o SET name = s.name
+                FROM (
+                    SELECT DISTINCT ON (email) email, name FROM stage_owner
+                    WHERE email IS NOT NULL AND name IS NOT NULL
+                    ORDER BY email, n DESC
+                ) s
+                WHERE o.email = s.email AND o.name IS DISTINCT FROM s.name
+                RETURNING o.email
+            )
+            SELECT count(DISTINCT email) FROM updated
+            """,
+            """
+            INSERT INTO owner (name, email)
+            SELECT DISTINCT ON (s.email) s.name, s.email FROM stage_owner s
+            WHERE s.email IS NOT NULL AND s.name IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM owner o WHERE o.email = s.email)
+            ORDER BY s.email, s.n DESC
+            """,
+            # Without an email there is nothing to match on: always insert
+            """
+            INSERT INTO owner (name, email)
+            SELECT name, NULL FROM stage_owner
+            WHERE email IS NULL AND name IS NOT NULL
+            """,
+        ),
+    ),
+    "cars": Resource(
+        stage="stage_car",
+        columns=(
+            ("vin", "text"),
+            ("make", "text"),
+            ("model", "text"),
+            ("year_of_manufacture", "integer"),
+            ("owner_email", "text"),
+        ),
+        merges=(
+            f"""
+            INSERT INTO car (vin, make, model, year_of_manufacture, owner_id)
+            SELECT DISTINCT ON (s.vin)
+                s.vin, s.make, s.model, s.year_of_manufacture, o.id
+            FROM stage_car s
+            JOIN {_OWNER_BY_EMAIL} o ON o.email = s.owner_email
+            WHERE s.vin IS NOT NULL
+            ORDER BY s.vin, s.n DESC
+            ON CONFLICT (vin) DO UPDATE SET
+                make = EXCLUDED.make,
+                model = EXCLUDED.model,
+                year_of_manufacture = EXCLUDED.year_of_manufacture,
+                owner_id = EXCLUDED.owner_id
+            -- Unchanged cars are neither rewritten nor counted
+            WHERE (car.make, car.model, car.year_of_manufacture, car.owner_id)
+                IS DISTINCT FROM (EXCLUDED.make, EXCLUDED.model,
+                                  EXCLUDED.year_of_manufacture, EXCLUDED.owner_id)
+            """,
+        ),
+    ),
+    "policies": Resource(
+        stage="stage_policy",
+        columns=(
+            ("vin", "text"),
+            ("provider", "text"),
+            ("start_date", "date"),
+            ("end_date", "date"),
+        ),
+        merges=(
+            """
+            INSERT INTO insurance_policy (car_id, provider, start_date, end_date)
+            SELECT DISTINCT c.id, s.provider, s.start_date, s.end_date
+            FROM stage_policy s
+            JOIN car c ON c.vin = s.vin
+            WHERE s.start_date IS NOT NULL
+              AND s.end_date >= s.start_date
+              AND NOT EXISTS (
+                SELECT 1 FROM insurance_policy p
+                WHERE p.car_id = c.id
+                  AND p.provider IS NOT DISTINCT FROM s.provider
+                  AND p.start_date = s.start_date
+                  AND p.end_date = s.end_date
+              )
+            """,
+        ),
+    ),
+    "claims": Resource(
+        stage="stage_claim",
+        columns=(
+            ("vin", "text"),
+            ("claim_date", "date"),
+            ("description", "text"),
+            ("amount", "numeric(12, 2)"),
+        ),
+        merges=(
+            """
+            INSERT INTO claim (car_id, claim_date, description, amount)
+            SELECT DISTINCT c.id, s.claim_date, s.description, s.amount
+            FROM stage_claim s
+            JOIN car c ON c.vin = s.vin
+            WHERE s.claim_date IS NOT NULL
+              AND s.description IS NOT NULL
+              AND s.amount > 0
+              AND NOT EXISTS (
+                SELECT 1 FROM claim x
+                WHERE x.car_id = c.id
+                  AND x.claim_date = s.claim_date
+                  AND x.description = s.description
+                  AND x.amount = s.amount
+              )
+            """,
+        ),
+    ),
+}
+
+# FK-safe import order
+ORDER = ("owners", "cars", "policies", "claims")
+
+# -------------- Readers --------------
+
+
+def detect_format(path: Path, fmt: str) -> str:
+    if fmt != "auto":
+        return fmt
+    if path.suffix.lower() in (".ndjson", ".jsonl", ".json"):
+        return "ndjson"
+    return "csv"
+
+
+def iter_records(path: Path, fmt: str) -> Iterator[dict[str, Any]]:
+    """Yield one dict per input row without reading the whole file."""
+    with path.open(newline="", encoding="utf-8") as fh:
+        if fmt == "csv":
+            for row in csv.DictReader(fh):
+                # Empty CSV fields are NULLs, not empty strings
+                yield {k: (v if v != "" else None) for k, v in row.items()}
+        else:
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def row_values(record: dict[str, Any], columns: Iterable[str]) -> list[Any]:
+    return [record.get(c, record.get(to_camel(c))) for c in columns]
+
+
+def batched(records: Iterator, size: int) -> Iterator[list]:
+    while chunk := list(islice(records, size)):
+        yield chunk
+
+
+# -------------- Import --------------
+
+
+def import_file(conn, resource: str, path: Path, fmt: str, batch_size: int) -> None:
+    """COPY `path` into staging and merge it, one transaction per chunk."""
+    spec = RESOURCES[resource]
+    columns = [name for name, _ in spec.columns]
+    with conn.cursor() as cur:
+        cur.execute(spec.create_stage_sql())
+    conn.commit()
+
+    started = time.perf_counter()
+    read = written = 0
+    for chunk in batched(iter_records(path, fmt), batch_size):
+        with conn.cursor() as cur:
+            with cur.copy(spec.copy_sql()) as copy:
+                for n, record in enumerate(chunk, start=read):
+                    copy.write_row([n, *row_values(record, columns)])
+            for sql in spec.merges:
+                cur.execute(sql)
+                written += cur.fetchone()[0] if cur.description else cur.rowcount
+        # ON COMMIT DELETE ROWS empties the staging table for the next chunk
+        conn.commit()
+        read += len(chunk)
+        elapsed = time.perf_counter() - started
+        print(
+            f"{resource}: {read:,} rows read, {written:,} written "
+            f"({read / elapsed:,.0f} rows/s)",
+            flush=True,
+        )
+    elapsed = time.perf_counter() - started
+    print(
+        f"{resource}: done, {read:,} rows in {elapsed:.1f}s, "
+        f"{written:,} written, {read - written:,} skipped or unchanged"
+    )
+
+
+def run(files: dict[str, Path], fmt: str, batch_size: int) -> None:
+    if engine.dialect.name != "postgresql" or engine.dialect.driver != "psycopg":
+        sys.exit("import_data requires PostgreSQL with the psycopg (v3) driver")
+    raw = engine.raw_connection()
+    conn = raw.driver_connection
+    try:
+        for resource in ORDER:
+            if resource in files:
+                path = files[resource]
+                import_file(conn, resource, path, detect_format(path, fmt), batch_size)
+    except Exception as exc:
+        conn.rollback()
+        print(f"Error during import, current chunk rolled back: {exc}")
+        raise
+    finally:
+        raw.close()
+
+
+# -------------- CLI --------------
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Import CSV/NDJSON data via COPY and set-based upserts"
+    )
+    for resource in ORDER:
+        parser.add_argument(
+            f"--{resource}", type=Path, help=f"File with {resource} to import"
+        )
+    parser.add_argument("--format", choices=["auto", "csv", "ndjson"], default="auto")
+    parser.add_argument(
+        "--batch-size", type=int, default=50_000, help="Rows per transaction"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    files = {r: getattr(args, r) for r in ORDER if getattr(args, r) is not None}
+    if not files:
+        sys.exit("Nothing to import: pass at least one of --owners/--cars/...")
+    run(files, fmt=args.format, batch_size=args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Mint a signed token for request profiling.
+
+Usage (from project root, with PROFILING_SECRET set as in the app):
+    python -m scripts.profile_token --ttl 600
+    python -m scripts.profile_token --purpose admin
+
+Send a "request" token as the X-Profile-Token header (or ?profile_token=) on
+the request to profile; the response's X-Profile-Id names the capture. An
+"admin" token in the same header lists and downloads captures under
+/admin/profiles.
+"""
+
+import argparse
+import sys
+import time
+
+from core.profiling import sign_token
+from core.settings import settings
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Mint a profiling token")
+    parser.add_argument("--purpose", choices=["request", "admin"], default="request")
+    parser.add_argument(
+        "--ttl", type=int, default=600, help="Seconds until the token expires"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if not settings.PROFILING_SECRET:
+        sys.exit("PROFILING_SECRET is not set")
+    print(
+        sign_token(settings.PROFILING_SECRET, args.purpose, int(time.time()) + args.ttl)
+    )
+
+
+if __name__ == "__main__":
+    main()
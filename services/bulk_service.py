@@ -0,0 +1,246 @@
+"""Bulk create for cars, policies and claims.
+
+Items are validated one by one with the regular create schemas, referenced
+owners/cars and VINs are checked with set-based lookups, and the survivors are
+inserted with one multi-row `INSERT ... RETURNING id` per batch.
+
+Two modes:
+  * atomic  - any failing item aborts the request; nothing is written and the
+              remaining items are reported as "skipped".
+  * partial - failing items are reported, everything else is committed. Each
+              batch runs in a SAVEPOINT; if the database rejects it (e.g. a VIN
+              inserted concurrently) the batch is retried row by row.
+"""
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic import ValidationError as SchemaValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from api.schemas import CarCreate, ClaimCreate, InsurancePolicyCreate
+from core.logging import get_logger
+from core.settings import settings
+from db.models import Car, Claim, InsurancePolicy, Owner
+from services.coverage_index import coverage_index
+from services.exceptions import NotFoundError, ValidationError
+from services.expiry_signal import notify_expiry_date
+from services.integrity import translate_integrity_error
+
+log = get_logger()
+
+ErrorsFor = Callable[[BaseModel], dict[str, Exception]]
+
+
+def _chunks(items: list, size: int) -> Iterable[list]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def _schema_error(exc: SchemaValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in exc.errors()
+    )
+
+
+def _status_for(exc: Exception) -> str:
+    return "not_found" if isinstance(exc, NotFoundError) else "conflict"
+
+
+def _existing(db: Session, column, values: set, batch_size: int) -> set:
+    """Subset of `values` present in `column`, looked up in IN-list chunks."""
+    found: set = set()
+    for chunk in _chunks(sorted(values), batch_size):
+        found.update(db.scalars(select(column).where(column.in_(chunk))))
+    return found
+
+
+def _validate(
+    raw_items: list[dict[str, Any]], schema: type[BaseModel], results: list[dict]
+) -> list[tuple[int, BaseModel]]:
+    valid = []
+    for index, raw in enumerate(raw_items):
+        try:
+            valid.append((index, schema.model_validate(raw)))
+        except SchemaValidationError as e:
+            results[index] = {"status": "invalid", "error": _schema_error(e)}
+    return valid
+
+
+def _require_refs(
+    db: Session,
+    valid: list[tuple[int, BaseModel]],
+    results: list[dict],
+    attr: str,
+    column,
+    entity: str,
+    batch_size: int,
+) -> list[tuple[int, BaseModel]]:
+    """Drop items whose `attr` does not reference an existing row."""
+    present = _existing(db, column, {getattr(i, attr) for _, i in valid}, batch_size)
+    kept = []
+    for index, item in valid:
+        ref = getattr(item, attr)
+        if ref in present:
+            kept.append((index, item))
+        else:
+            results[index] = {
+                "status": "not_found",
+                "error": str(NotFoundError(entity, ref)),
+            }
+    return kept
+
+
+def _insert_batch(db: Session, model, rows: list[dict]) -> list[int]:
+    stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+    return list(db.scalars(stmt, rows))
+
+
+def _insert_partial(
+    db: Session,
+    model,
+    batch: list[tuple[int, BaseModel]],
+    results: list[dict],
+    errors_for: ErrorsFor,
+) -> None:
+    try:
+        with db.begin_nested():
+            ids = _insert_batch(db, model, [i.model_dump() for _, i in batch])
+    except IntegrityError:
+        # Someone else won a race against the pre-checks; isolate the culprits
+        for index, item in batch:
+            try:
+                with db.begin_nested():
+                    (results[index]["id"],) = _insert_batch(
+                        db, model, [item.model_dump()]
+                    )
+                results[index]["status"] = "created"
+            except IntegrityError as e:
+                err = translate_integrity_error(e, errors_for(item))
+                results[index] = {"status": _status_for(err), "error": str(err)}
+        return
+    for (index, _), new_id in zip(batch, ids):
+        results[index] = {"status": "created", "id": new_id}
+
+
+def _bulk_create(
+    db: Session,
+    model,
+    valid: list[tuple[int, BaseModel]],
+    results: list[dict],
+    errors_for: ErrorsFor,
+    atomic: bool,
+    batch_size: int,
+) -> None:
+    if atomic and any(r.get("status") for r in results):
+        for index, _ in valid:
+            results[index] = {"status": "skipped"}
+        return
+    for batch in _chunks(valid, batch_size):
+        if not atomic:
+            _insert_partial(db, model, batch, results, errors_for)
+            continue
+        try:
+            ids = _insert_batch(db, model, [i.model_dump() for _, i in batch])
+        except IntegrityError as e:
+            db.rollback()
+            raise translate_integrity_error(e, {}) from e
+        for (index, _), new_id in zip(batch, ids):
+            results[index] = {"status": "created", "id": new_id}
+    db.commit()
+
+
+def _finish(resource: str, results: list[dict], atomic: bool) -> list[dict]:
+    items = [{"index": i, **r} for i, r in enumerate(results)]
+    created = sum(1 for r in results if r["status"] == "created")
+    log.info(
+        "bulk_created",
+        resource=resource,
+        created=created,
+        failed=len(results) - created,
+        atomic=atomic,
+    )
+    return items
+
+
+def _check_size(raw_items: list) -> None:
+    if len(raw_items) > settings.BULK_MAX_ITEMS:
+        raise ValidationError(
+            f"At most {settings.BULK_MAX_ITEMS} items allowed per bulk request"
+        )
+
+
+def bulk_create_cars(
+    db: Session, raw_items: list[dict[str, Any]], atomic: bool = True
+) -> list[dict]:
+    """Create cars in batches; returns one status dict per input item."""
+    _check_size(raw_items)
+    batch_size = settings.BULK_BATCH_SIZE
+    results: list[dict] = [{} for _ in raw_items]
+    valid = _validate(raw_items, CarCreate, results)
+    valid = _require_refs(db, valid, results, "owner_id", Owner.id, "Owner", batch_size)
+
+    taken = _existing(db, Car.vin, {i.vin for _, i in valid}, batch_size)
+    unique = []
+    for index, item in valid:
+        if item.vin in taken:
+            results[index] = {
+                "status": "conflict",
+                "error": f"VIN '{item.vin}' already exists",
+            }
+        else:
+            taken.add(item.vin)
+            unique.append((index, item))
+
+    def errors_for(item: CarCreate) -> dict[str, Exception]:
+        return {
+            "fk_car_owner_id_owner": NotFoundError("Owner", item.owner_id),
+            "ix_car_vin": ValidationError(f"VIN '{item.vin}' already exists"),
+        }
+
+    _bulk_create(db, Car, unique, results, errors_for, atomic, batch_size)
+    return _finish("cars", results, atomic)
+
+
+def bulk_create_policies(
+    db: Session, raw_items: list[dict[str, Any]], atomic: bool = True
+) -> list[dict]:
+    """Create insurance policies in batches; one status dict per input item."""
+    _check_size(raw_items)
+    batch_size = settings.BULK_BATCH_SIZE
+    results: list[dict] = [{} for _ in raw_items]
+    valid = _validate(raw_items, InsurancePolicyCreate, results)
+    valid = _require_refs(db, valid, results, "car_id", Car.id, "Car", batch_size)
+
+    def errors_for(item: InsurancePolicyCreate) -> dict[str, Exception]:
+        return {"fk_insurance_policy_car_id_car": NotFoundError("Car", item.car_id)}
+
+    _bulk_create(db, InsurancePolicy, valid, results, errors_for, atomic, batch_size)
+    created = [item for index, item in valid if "id" in results[index]]
+    for car_id in {item.car_id for item in created}:
+        coverage_index.invalidate(car_id)
+    unlogged = [item.end_date for item in created if not item.logged_expiry_at]
+    if unlogged:
+        # The earliest date is the only one that can move the next run forward
+        notify_expiry_date(min(unlogged), None)
+    return _finish("policies", results, atomic)
+
+
+def bulk_create_claims(
+    db: Session, raw_items: list[dict[str, Any]], atomic: bool = True
+) -> list[dict]:
+    """Create claims in batches; one status dict per input item."""
+    _check_size(raw_items)
+    batch_size = settings.BULK_BATCH_SIZE
+    results: list[dict] = [{} for _ in raw_items]
+    valid = _validate(raw_items, ClaimCreate, results)
+    valid = _require_refs(db, valid, results, "car_id", Car.id, "Car", batch_size)
+
+    def errors_for(item: ClaimCreate) -> dict[str, Exception]:
+        return {"fk_claim_car_id_car": NotFoundError("Car", item.car_id)}
+
+    _bulk_create(db, Claim, valid, results, errors_for, atomic, batch_size)
+    return _finish("claims", results, atomic)
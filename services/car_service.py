@@ -1,19 +1,32 @@
 """Car service: encapsulates Car CRUD and nested resource creation orchestration."""
 
+from sqlalchemy import Row, insert, literal_column, select, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 
-from api.schemas import CarCreate
+from api.schemas import CarCreate, CarRead
 from core.logging import get_logger
+from core.settings import settings
 from db.models import Car, Owner
+from services.coverage_index import coverage_index
 from services.exceptions import NotFoundError, ValidationError
+from services.integrity import commit_detached, translate_integrity_error
+from services.pagination import keyset_page, keyset_page_async
+from services.read_cache import (get_car_read, get_car_read_async,
+                                 invalidate_car, invalidate_policies)
 
 log = get_logger()
 
 
-def list_cars(db: Session) -> list[Car]:
-    """List all cars with their owners."""
-    return db.query(Car).options(joinedload(Car.owner)).all()
+def list_cars(
+    db: Session,
+    limit: int = settings.PAGINATION_DEFAULT_LIMIT,
+    after: int | None = None,
+) -> tuple[list[Car], int | None]:
+    """List one page of cars with their owners, keyed on car id."""
+    query = db.query(Car).options(joinedload(Car.owner))
+    return keyset_page(query, Car.id, limit, after)
 
 
 def get_car(db: Session, car_id: int) -> Car:
@@ -24,50 +37,103 @@ def get_car(db: Session, car_id: int) -> Car:
     return car
 
 
+def get_car_cached(db: Session, car_id: int) -> Car | CarRead:
+    """Get a car through the Redis read-through cache when enabled."""
+    if not settings.CACHE_ENABLED:
+        return get_car(db, car_id)
+    return get_car_read(car_id, lambda: get_car(db, car_id))
+
+
+async def list_cars_async(
+    db: AsyncSession,
+    limit: int = settings.PAGINATION_DEFAULT_LIMIT,
+    after: int | None = None,
+) -> tuple[list[Car], int | None]:
+    """Async variant of `list_cars`."""
+    stmt = select(Car).options(joinedload(Car.owner))
+    return await keyset_page_async(db, stmt, Car.id, limit, after)
+
+
+async def get_car_async(db: AsyncSession, car_id: int) -> Car:
+    """Async variant of `get_car`."""
+    car = await db.scalar(
+        select(Car).options(joinedload(Car.owner)).where(Car.id == car_id)
+    )
+    if not car:
+        raise NotFoundError("Car", car_id)
+    return car
+
+
+async def get_car_cached_async(db: AsyncSession, car_id: int) -> Car | CarRead:
+    """Async variant of `get_car_cached`."""
+    if not settings.CACHE_ENABLED:
+        return await get_car_async(db, car_id)
+    return await get_car_read_async(car_id, lambda: get_car_async(db, car_id))
+
+
+# Owner columns returned with the written car row. The reference to the DML
+# target is literal: SQLAlchemy does not correlate RETURNING subqueries, so a
+# column reference would add a second `car` to the FROM list.
+_RETURNED_OWNER_ID = literal_column(f"{Car.__tablename__}.{Car.owner_id.key}")
+_RETURNING = (
+    Car,
+    select(Owner.name).where(Owner.id == _RETURNED_OWNER_ID).scalar_subquery(),
+    select(Owner.email).where(Owner.id == _RETURNED_OWNER_ID).scalar_subquery(),
+)
+
+
+def _car_write_errors(data: CarCreate) -> dict[str, Exception]:
+    return {
+        "fk_car_owner_id_owner": NotFoundError("Owner", data.owner_id),
+        "ix_car_vin": ValidationError(f"VIN '{data.vin}' already exists"),
+    }
+
+
+def _commit_written(db: Session, row: Row) -> Car:
+    car, owner_name, owner_email = row
+    owner = Owner(id=car.owner_id, name=owner_name, email=owner_email)
+    commit_detached(db, car, owner=owner)
+    return car
+
+
 def create_car(db: Session, data: CarCreate) -> Car:
-    """Create a new car and assign to owner."""
-    owner = db.query(Owner).filter(Owner.id == data.owner_id).first()
-    if not owner:
-        raise NotFoundError("Owner", data.owner_id)
-    existing = db.query(Car).filter(Car.vin == data.vin).first()
-    if existing:
-        raise ValidationError(f"VIN '{data.vin}' already exists")
-    car = Car(**data.model_dump())
-    db.add(car)
+    """Create a new car and assign to owner.
+
+    The INSERT ... RETURNING is the only statement: it also returns the owner
+    columns for the response. The owner FK and VIN unique index are enforced
+    by the database and surfaced as domain errors.
+    """
     try:
-        db.commit()
-    except Exception as e:
+        row = db.execute(
+            insert(Car).values(**data.model_dump()).returning(*_RETURNING)
+        ).one()
+    except IntegrityError as e:
         db.rollback()
-        if isinstance(e, IntegrityError):
-            raise ValidationError(f"VIN '{data.vin}' already exists")
-        raise
-    db.refresh(car)
+        raise translate_integrity_error(e, _car_write_errors(data)) from e
+    car = _commit_written(db, row)
     log.info("car_created", carId=car.id, ownerId=car.owner_id, vin=car.vin)
     return car
 
 
 def update_car(db: Session, car_id: int, data: CarCreate) -> Car:
     """Update an existing car's details."""
-    car = db.query(Car).filter(Car.id == car_id).first()
-    if not car:
-        raise NotFoundError("Car", car_id)
-    owner = db.query(Owner).filter(Owner.id == data.owner_id).first()
-    if not owner:
-        raise NotFoundError("Owner", data.owner_id)
-    if data.vin != car.vin:
-        existing_vin = db.query(Car).filter(Car.vin == data.vin).first()
-        if existing_vin:
-            raise ValidationError(f"VIN '{data.vin}' already exists")
-    for key, value in data.model_dump().items():
-        setattr(car, key, value)
+    stmt = (
+        update(Car)
+        .where(Car.id == car_id)
+        .values(**data.model_dump())
+        .returning(*_RETURNING)
+        .execution_options(synchronize_session=False)
+    )
     try:
-        db.commit()
-    except Exception as e:
+        row = db.execute(stmt).one_or_none()
+    except IntegrityError as e:
+        db.rollback()
+        raise translate_integrity_error(e, _car_write_errors(data)) from e
+    if row is None:
         db.rollback()
-        if isinstance(e, IntegrityError):
-            raise ValidationError("Update violates data integrity constraints")
-        raise
-    db.refresh(car)
+        raise NotFoundError("Car", car_id)
+    car = _commit_written(db, row)
+    invalidate_car(car_id)
     log.info("car_updated", carId=car.id, ownerId=car.owner_id, vin=car.vin)
     return car
 
@@ -77,6 +143,11 @@ def delete_car(db: Session, car_id: int) -> None:
     car = db.query(Car).filter(Car.id == car_id).first()
     if not car:
         raise NotFoundError("Car", car_id)
+    # Policies are loaded for the ORM cascade anyway; keep their ids for the cache
+    policy_ids = [p.id for p in car.policies]
     db.delete(car)
     db.commit()
+    coverage_index.invalidate(car_id)
+    invalidate_car(car_id)
+    invalidate_policies(*policy_ids)
     log.info("car_deleted", carId=car_id)
@@ -1,11 +1,17 @@
 """Claim service: creation and update logic."""
 
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from api.schemas import ClaimCreate, ClaimCreateNested
 from core.logging import get_logger
-from db.models import Car, Claim
+from core.settings import settings
+from db.models import Claim
 from services.exceptions import NotFoundError
+from services.integrity import commit_detached, translate_integrity_error
+from services.pagination import keyset_page, keyset_page_async
 
 log = get_logger()
 
@@ -13,20 +19,24 @@ log = get_logger()
 def create_claim(
     db: Session, car_id: int, data: ClaimCreate | ClaimCreateNested
 ) -> Claim:
-    car = db.query(Car).filter(Car.id == car_id).first()
-
-    if not car:
-        raise NotFoundError("Car", car_id)
-
-    claim = Claim(
-        car_id=car_id,
-        claim_date=data.claim_date,
-        description=data.description,
-        amount=data.amount,
+    stmt = (
+        insert(Claim)
+        .values(
+            car_id=car_id,
+            claim_date=data.claim_date,
+            description=data.description,
+            amount=data.amount,
+        )
+        .returning(Claim)
     )
-    db.add(claim)
-    db.commit()
-    db.refresh(claim)
+    try:
+        claim = db.scalars(stmt).one()
+    except IntegrityError as e:
+        db.rollback()
+        raise translate_integrity_error(
+            e, {"fk_claim_car_id_car": NotFoundError("Car", car_id)}
+        ) from e
+    commit_detached(db, claim)
 
     log.info(
         "claim_created",
@@ -37,12 +47,23 @@ def create_claim(
     return claim
 
 
-def update_claim(db: Session, claim: Claim, data: ClaimCreate) -> Claim:
-    claim.claim_date = data.claim_date
-    claim.description = data.description
-    claim.amount = data.amount
-    db.commit()
-    db.refresh(claim)
+def update_claim(db: Session, claim_id: int, data: ClaimCreate) -> Claim:
+    stmt = (
+        update(Claim)
+        .where(Claim.id == claim_id)
+        .values(
+            claim_date=data.claim_date,
+            description=data.description,
+            amount=data.amount,
+        )
+        .returning(Claim)
+        .execution_options(synchronize_session=False)
+    )
+    claim = db.scalars(stmt).one_or_none()
+    if claim is None:
+        db.rollback()
+        raise NotFoundError("Claim", claim_id)
+    commit_detached(db, claim)
     log.info(
         "claim_updated",
         claimId=claim.id,
@@ -56,8 +77,24 @@ def get_claim_by_id(db: Session, claim_id: int) -> Claim | None:
     return db.query(Claim).filter(Claim.id == claim_id).first()
 
 
-def list_claims(db: Session) -> list[Claim]:
-    return db.query(Claim).all()
+def list_claims(
+    db: Session,
+    limit: int = settings.PAGINATION_DEFAULT_LIMIT,
+    after: int | None = None,
+) -> tuple[list[Claim], int | None]:
+    return keyset_page(db.query(Claim), Claim.id, limit, after)
+
+
+async def get_claim_by_id_async(db: AsyncSession, claim_id: int) -> Claim | None:
+    return await db.scalar(select(Claim).where(Claim.id == claim_id))
+
+
+async def list_claims_async(
+    db: AsyncSession,
+    limit: int = settings.PAGINATION_DEFAULT_LIMIT,
+    after: int | None = None,
+) -> tuple[list[Claim], int | None]:
+    return await keyset_page_async(db, select(Claim), Claim.id, limit, after)
 
 
 def delete_claim(db: Session, claim: Claim) -> None:
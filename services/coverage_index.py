@@ -0,0 +1,155 @@
+"""In-process coverage interval index for insurance validity checks.
+
+Policies change rarely compared with how often validity is read, so each car's
+policy intervals are loaded once, merged into sorted disjoint ranges and then
+answered by bisection without touching the database.
+
+The index is per process: writes through `policy_service` invalidate the local
+entry immediately, other workers pick up changes when their entry expires
+(`COVERAGE_INDEX_TTL_SECONDS`).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import date, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.metrics import (COVERAGE_INDEX_INVALIDATIONS, COVERAGE_INDEX_LOOKUPS,
+                          COVERAGE_INDEX_SIZE)
+from core.settings import settings
+from db.models import Car, InsurancePolicy
+
+_HITS = COVERAGE_INDEX_LOOKUPS.labels("hit")
+_MISSES = COVERAGE_INDEX_LOOKUPS.labels("miss")
+
+
+class CarCoverage:
+    """Sorted, merged (start_date, end_date) intervals for one car."""
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, intervals: list[tuple[date, date]]):
+        self.starts: list[date] = []
+        self.ends: list[date] = []
+        for start, end in sorted(intervals):
+            # Date ranges are inclusive, so touching ranges merge too
+            if self.ends and start <= self.ends[-1] + timedelta(days=1):
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def covers(self, on_date: date) -> bool:
+        i = bisect_right(self.starts, on_date) - 1
+        return i >= 0 and self.ends[i] >= on_date
+
+
+class CoverageIndex:
+    """Lazily loaded, LRU-bounded map of car id -> CarCoverage."""
+
+    def __init__(self, max_cars: int, ttl_seconds: int):
+        self.max_cars = max_cars
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[int, tuple[float, CarCoverage]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on every invalidation so a load racing a write is not cached
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, db: Session, car_id: int) -> CarCoverage | None:
+        """Return coverage for `car_id`, or None when the car does not exist."""
+        coverage, generation = self._lookup(car_id)
+        if coverage is not None:
+            return coverage
+        coverage = self._build(db.execute(self._load_stmt(car_id)).all())
+        return self._store(car_id, coverage, generation)
+
+    async def get_async(self, db: AsyncSession, car_id: int) -> CarCoverage | None:
+        """Async variant of `get` for handlers running on the event loop."""
+        coverage, generation = self._lookup(car_id)
+        if coverage is not None:
+            return coverage
+        rows = (await db.execute(self._load_stmt(car_id))).all()
+        return self._store(car_id, self._build(rows), generation)
+
+    def invalidate(self, car_id: int | None = None) -> None:
+        """Drop one car's entry, or the whole index when car_id is None."""
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            if car_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(car_id, None)
+            COVERAGE_INDEX_INVALIDATIONS.inc()
+            COVERAGE_INDEX_SIZE.set(len(self._entries))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+            }
+
+    def _lookup(self, car_id: int) -> tuple[CarCoverage | None, int]:
+        """Return a fresh cached entry (counting the hit/miss) and the generation."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(car_id)
+            if entry is not None and now - entry[0] < self.ttl_seconds:
+                self._entries.move_to_end(car_id)
+                self.hits += 1
+                _HITS.inc()
+                return entry[1], self._generation
+            self.misses += 1
+            _MISSES.inc()
+            return None, self._generation
+
+    def _store(
+        self, car_id: int, coverage: CarCoverage | None, generation: int
+    ) -> CarCoverage | None:
+        if coverage is None:
+            return None
+        with self._lock:
+            if generation == self._generation:
+                self._entries[car_id] = (time.monotonic(), coverage)
+                self._entries.move_to_end(car_id)
+                while len(self._entries) > self.max_cars:
+                    self._entries.popitem(last=False)
+                COVERAGE_INDEX_SIZE.set(len(self._entries))
+        return coverage
+
+    @staticmethod
+    def _load_stmt(car_id: int):
+        # One round trip answers both "does the car exist" and its intervals
+        return (
+            select(InsurancePolicy.start_date, InsurancePolicy.end_date)
+            .select_from(Car)
+            .outerjoin(InsurancePolicy, InsurancePolicy.car_id == Car.id)
+            .where(Car.id == car_id)
+        )
+
+    @staticmethod
+    def _build(rows) -> CarCoverage | None:
+        if not rows:
+            return None
+        return CarCoverage(
+            [(start, end) for start, end in rows if start is not None and end]
+        )
+
+
+coverage_index = CoverageIndex(
+    max_cars=settings.COVERAGE_INDEX_MAX_CARS,
+    ttl_seconds=settings.COVERAGE_INDEX_TTL_SECONDS,
+)
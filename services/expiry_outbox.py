@@ -0,0 +1,143 @@
+"""Transactional outbox for policy expiry events.
+
+Marking a policy as logged also inserts a row into `policy_expiry_outbox` in
+the same transaction, so an event exists if and only if the marking
+committed. The scheduler leader relays the outbox every
+EXPIRY_OUTBOX_RELAY_INTERVAL_SECONDS: batches of EXPIRY_OUTBOX_BATCH_SIZE rows
+in id order are sent with one pipelined round trip of XADDs to the Redis
+Stream EXPIRY_OUTBOX_STREAM, then deleted.
+
+Only one relay runs at a time, across workers and leader handovers, by
+holding a Redis lock (`<stream>:relay`) while draining, so the stream follows
+outbox id order. Rows of a transaction still open when a batch is read are
+relayed with a later batch, after any higher ids already sent; the events of
+one policy are always in order.
+
+Delivery is at least once: a relay that dies between the XADDs and the delete
+sends the batch again. Each entry carries the outbox id as `eventId` for
+consumers to deduplicate on.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable
+
+import redis
+from redis.exceptions import RedisError
+from sqlalchemy import Row, delete, insert, select
+from sqlalchemy.orm import Session
+
+from core.logging import get_logger
+from core.redis import RedisLock
+from core.settings import settings
+from db.models import InsurancePolicy, PolicyExpiryOutbox
+
+log = get_logger()
+
+
+def record_expiries(db: Session, rows: Iterable[Row], logged_at: datetime) -> None:
+    """Queue events for `(id, car_id, end_date)` rows; the caller commits."""
+    if not settings.EXPIRY_OUTBOX_ENABLED:
+        return
+    events = [
+        {
+            "policy_id": r.id,
+            "car_id": r.car_id,
+            "end_date": r.end_date,
+            "logged_at": logged_at,
+        }
+        for r in rows
+    ]
+    if events:
+        db.execute(insert(PolicyExpiryOutbox), events)
+
+
+def record_expiry(db: Session, policy: InsurancePolicy, logged_at: datetime) -> None:
+    """Queue the event for one policy; the caller commits."""
+    if settings.EXPIRY_OUTBOX_ENABLED:
+        db.add(
+            PolicyExpiryOutbox(
+                policy_id=policy.id,
+                car_id=policy.car_id,
+                end_date=policy.end_date,
+                logged_at=logged_at,
+            )
+        )
+
+
+def _fields(event: PolicyExpiryOutbox) -> dict[str, str | int]:
+    return {
+        "eventId": event.id,
+        "policyId": event.policy_id,
+        "carId": event.car_id,
+        "endDate": event.end_date.isoformat(),
+        "loggedAt": event.logged_at.isoformat(),
+    }
+
+
+def relay_batch(
+    db: Session, client: redis.Redis, batch_size: int, lock: RedisLock | None = None
+) -> int:
+    """Send up to `batch_size` outbox rows to the stream; returns rows relayed.
+
+    With `lock`, nothing is sent once it is lost: another relay may own the
+    outbox by then.
+    """
+    events = (
+        db.execute(
+            select(PolicyExpiryOutbox).order_by(PolicyExpiryOutbox.id).limit(batch_size)
+        )
+        .scalars()
+        .all()
+    )
+    if not events or (lock is not None and lock.lost):
+        db.rollback()
+        return 0
+    pipe = client.pipeline(transaction=False)
+    for event in events:
+        pipe.xadd(
+            settings.EXPIRY_OUTBOX_STREAM,
+            _fields(event),
+            maxlen=settings.EXPIRY_OUTBOX_STREAM_MAXLEN,
+            approximate=True,
+        )
+    try:
+        pipe.execute()
+    except RedisError:
+        # Rows stay in the outbox and are sent again on the next run
+        db.rollback()
+        raise
+    db.execute(
+        delete(PolicyExpiryOutbox)
+        .where(PolicyExpiryOutbox.id.in_([e.id for e in events]))
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return len(events)
+
+
+def relay_lock_key() -> str:
+    return f"{settings.EXPIRY_OUTBOX_STREAM}:relay"
+
+
+def relay_pending(db: Session, client: redis.Redis, batch_size: int) -> int:
+    """Relay batches until the outbox is drained; returns rows relayed.
+
+    Returns 0 without reading the outbox while another relay holds the lock.
+    """
+    lock = RedisLock(relay_lock_key(), settings.REDIS_LOCK_TTL_SECONDS, client=client)
+    if not lock.acquire():
+        return 0
+    total = 0
+    try:
+        with lock.keep_alive():
+            while True:
+                count = relay_batch(db, client, batch_size, lock)
+                lock.progress()
+                total += count
+                if count < batch_size:
+                    break
+    finally:
+        lock.release()
+    return total
@@ -0,0 +1,163 @@
+"""Marking expired policies as logged, for one day or a range of days.
+
+`log_expiries_for_day` is the unit of work of the scheduler job: chunked
+`UPDATE ... RETURNING` statements with a commit per chunk. `catch_up_expiries`
+runs it for every day in a range that still has unlogged expiries, jumping
+over empty days with one indexed MIN query each, and can checkpoint the last
+finished day in Redis so an interrupted backfill resumes where it stopped.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Callable
+
+from redis.exceptions import RedisError
+from sqlalchemy.orm import Session
+
+from core.logging import get_logger
+from core.metrics import SCHEDULER_JOB_ROWS
+from core.redis import get_redis
+from core.settings import settings
+from services.policy_service import (mark_expiring_policies_logged,
+                                     next_unlogged_expiry_date)
+from services.read_cache import invalidate_policies
+
+log = get_logger()
+
+CHECKPOINT_TTL_SECONDS = 30 * 24 * 3600
+
+
+class ExpiryRunAborted(Exception):
+    """Raised when a run must stop before committing (lock or leadership lost)."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def _never_stop() -> str | None:
+    return None
+
+
+def _no_progress() -> None:
+    return None
+
+
+def log_expiries_for_day(
+    db: Session,
+    day: date,
+    logged_at: datetime,
+    chunk_size: int,
+    job: str,
+    in_window: bool = False,
+    stop: Callable[[], str | None] = _never_stop,
+    progress: Callable[[], None] = _no_progress,
+) -> int:
+    """Mark every unlogged policy ending on `day`; returns how many were marked.
+
+    `stop()` is asked before each commit and returns a reason to abort (the
+    chunk is rolled back and ExpiryRunAborted raised); `progress()` is called
+    after each commit.
+    """
+    total = 0
+    while True:
+        marked = mark_expiring_policies_logged(db, day, logged_at, chunk_size)
+        if not marked:
+            break
+        reason = stop()
+        if reason:
+            # Someone else may be running now; leave this chunk to them
+            db.rollback()
+            raise ExpiryRunAborted(reason)
+        db.commit()
+        progress()
+        for p in marked:
+            log.info(
+                "policy_expiry_logged",
+                policyId=p.id,
+                carId=p.car_id,
+                endDate=p.end_date.isoformat(),
+                inWindow=in_window,
+            )
+        invalidate_policies(*(p.id for p in marked))
+        total += len(marked)
+        SCHEDULER_JOB_ROWS.labels(job).inc(len(marked))
+        if len(marked) < chunk_size:
+            break
+    return total
+
+
+# -------------- Checkpoints --------------
+
+
+def checkpoint_key(start: date, end: date) -> str:
+    return f"{settings.EXPIRY_CATCHUP_CHECKPOINT_KEY}:{start}:{end}"
+
+
+def load_checkpoint(start: date, end: date) -> date | None:
+    """Last fully processed day of the `start`..`end` run, if any."""
+    try:
+        value = get_redis().get(checkpoint_key(start, end))
+    except RedisError as exc:
+        log.warning("expiry_checkpoint_unavailable", error=str(exc))
+        return None
+    return date.fromisoformat(value) if value else None
+
+
+def save_checkpoint(start: date, end: date, day: date) -> None:
+    try:
+        get_redis().set(
+            checkpoint_key(start, end), day.isoformat(), ex=CHECKPOINT_TTL_SECONDS
+        )
+    except RedisError as exc:
+        # Resuming without it only repeats the (cheap) MIN scans
+        log.warning("expiry_checkpoint_failed", day=day.isoformat(), error=str(exc))
+
+
+# -------------- Catch-up --------------
+
+
+def catch_up_expiries(
+    db: Session,
+    start: date,
+    end: date,
+    logged_at: datetime,
+    chunk_size: int,
+    job: str,
+    resume: bool = False,
+    stop: Callable[[], str | None] = _never_stop,
+    progress: Callable[[], None] = _no_progress,
+    on_day: Callable[[date, int], None] | None = None,
+) -> int:
+    """Log unlogged expiries for every day from `start` to `end` inclusive.
+
+    With `resume` the last finished day is checkpointed in Redis after each
+    day and a rerun of the same range starts after it. Returns rows marked.
+    """
+    day = start
+    if resume and (done := load_checkpoint(start, end)):
+        day = done + timedelta(days=1)
+        log.info(
+            "policy_expiry_catchup_resumed",
+            start=start.isoformat(),
+            day=day.isoformat(),
+        )
+    total = 0
+    while day <= end:
+        day = next_unlogged_expiry_date(db, day)
+        if day is None or day > end:
+            break
+        count = log_expiries_for_day(
+            db, day, logged_at, chunk_size, job, stop=stop, progress=progress
+        )
+        log.info("policy_expiry_catchup", date=day.isoformat(), count=count)
+        total += count
+        if resume:
+            save_checkpoint(start, end, day)
+        if on_day is not None:
+            on_day(day, count)
+        day += timedelta(days=1)
+    if resume:
+        save_checkpoint(start, end, end)
+    return total
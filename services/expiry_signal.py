@@ -0,0 +1,32 @@
+"""Expiry-date change notifications for the event-driven scheduler.
+
+With SCHEDULER_MODE=event the scheduler leader sleeps until the next date
+with unlogged expiries. Writers call `notify_expiry_date` after committing so
+the leader (whichever worker it is) can move its wake-up earlier; the message
+is a Redis PUBLISH of the ISO date. Redis errors are logged and ignored: the
+leader also resyncs from the database every SCHEDULER_RESYNC_HOURS.
+"""
+
+from datetime import date, datetime
+
+from redis.exceptions import RedisError
+
+from core.logging import get_logger
+from core.redis import get_redis
+from core.settings import settings
+
+log = get_logger()
+
+
+def notify_expiry_date(
+    end_date: date | None, logged_expiry_at: datetime | None
+) -> None:
+    """Announce that a policy ending on `end_date` still needs its expiry logged."""
+    if settings.SCHEDULER_MODE != "event" or end_date is None or logged_expiry_at:
+        return
+    try:
+        get_redis().publish(settings.SCHEDULER_EXPIRY_CHANNEL, end_date.isoformat())
+    except RedisError as exc:
+        log.warning(
+            "expiry_notify_failed", endDate=end_date.isoformat(), error=str(exc)
+        )
@@ -1,46 +1,189 @@
-"""History aggregation service."""
+"""History aggregation service.
 
+A car's policies and claims are merged by one UNION ALL query, newest event
+first, ordered and limited in the database. Each branch filters on `car_id`
+plus its event date (policy start_date / claim_date), so it is a range scan of
+ix_insurance_policy_car_id_start_date_end_date / ix_claim_car_id_claim_date,
+and each branch is limited to one page before the merge.
+
+Pages are chained with an opaque `before` cursor encoding the (event date,
+type, id) of the last event returned.
+"""
+
+import base64
+import binascii
+from datetime import date
+
+from sqlalchemy import (Date, Numeric, String, Text, and_, cast,
+                        literal_column, null, or_, select, union_all)
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from core.settings import settings
 from db.models import Car, Claim, InsurancePolicy
-from services.exceptions import NotFoundError
+from services.exceptions import NotFoundError, ValidationError
 
+EVENT_TYPES = ("CLAIM", "POLICY")
 
-def get_car_history(db: Session, car_id: int) -> list[dict]:
-    car = db.query(Car).filter(Car.id == car_id).first()
 
-    if not car:
-        raise NotFoundError("Car", car_id)
+def encode_cursor(event_date: date, event_type: str, event_id: int) -> str:
+    raw = f"{event_date.isoformat()}|{event_type}|{event_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
 
-    policies = db.query(InsurancePolicy).filter(InsurancePolicy.car_id == car_id).all()
-    claims = db.query(Claim).filter(Claim.car_id == car_id).all()
-    events: list[dict] = []
-
-    for p in policies:
-        events.append(
-            {
-                "type": "POLICY",
-                "policyId": p.id,
-                "startDate": p.start_date.isoformat(),
-                "endDate": p.end_date.isoformat() if p.end_date else None,
-                "provider": p.provider,
-            }
+def decode_cursor(cursor: str) -> tuple[date, str, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw_date, event_type, raw_id = (
+            base64.urlsafe_b64decode(padded).decode().split("|")
         )
+        decoded = (date.fromisoformat(raw_date), event_type, int(raw_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValidationError("Invalid history cursor") from exc
+    if event_type not in EVENT_TYPES:
+        raise ValidationError("Invalid history cursor")
+    return decoded
+
+
+def _before(event_type: str, date_col, id_col, cursor: tuple[date, str, int]):
+    """Predicate for rows after `cursor` in (date, type, id) DESC order."""
+    cursor_date, cursor_type, cursor_id = cursor
+    if event_type < cursor_type:
+        return date_col <= cursor_date
+    if event_type > cursor_type:
+        return date_col < cursor_date
+    return or_(
+        date_col < cursor_date, and_(date_col == cursor_date, id_col < cursor_id)
+    )
+
+
+def _branch(
+    event_type, model, date_col, columns, car_id, limit, before, date_from, date_to
+):
+    stmt = select(
+        # Inline constant so PostgreSQL types the UNION column as text
+        literal_column(f"'{event_type}'", String).label("type"),
+        model.id.label("id"),
+        date_col.label("event_date"),
+        *columns,
+    ).where(model.car_id == car_id)
+    if date_from is not None:
+        stmt = stmt.where(date_col >= date_from)
+    if date_to is not None:
+        stmt = stmt.where(date_col <= date_to)
+    if before is not None:
+        stmt = stmt.where(_before(event_type, date_col, model.id, before))
+    return stmt.order_by(date_col.desc(), model.id.desc()).limit(limit).subquery()
+
 
-    for c in claims:
-        events.append(
-            {
-                "type": "CLAIM",
-                "claimId": c.id,
-                "claimDate": c.claim_date.isoformat(),
-                "amount": float(c.amount),
-                "description": c.description,
-            }
+def _history_stmt(
+    car_id: int,
+    limit: int,
+    before: str | None,
+    event_type: str | None,
+    date_from: date | None,
+    date_to: date | None,
+):
+    cursor = decode_cursor(before) if before else None
+    args = (car_id, limit + 1, cursor, date_from, date_to)
+    branches = []
+    if event_type in (None, "POLICY"):
+        branches.append(
+            _branch(
+                "POLICY",
+                InsurancePolicy,
+                InsurancePolicy.start_date,
+                (
+                    InsurancePolicy.end_date.label("end_date"),
+                    InsurancePolicy.provider.label("provider"),
+                    cast(null(), Numeric(12, 2)).label("amount"),
+                    cast(null(), Text).label("description"),
+                ),
+                *args,
+            )
         )
+    if event_type in (None, "CLAIM"):
+        branches.append(
+            _branch(
+                "CLAIM",
+                Claim,
+                Claim.claim_date,
+                (
+                    cast(null(), Date).label("end_date"),
+                    cast(null(), String).label("provider"),
+                    Claim.amount.label("amount"),
+                    Claim.description.label("description"),
+                ),
+                *args,
+            )
+        )
+    merged = union_all(*(select(*b.c) for b in branches)).subquery("events")
+    return (
+        select(merged)
+        .order_by(
+            merged.c.event_date.desc(), merged.c.type.desc(), merged.c.id.desc()
+        )
+        .limit(limit + 1)
+    )
+
+
+def _to_event(row) -> dict:
+    if row.type == "POLICY":
+        return {
+            "type": "POLICY",
+            "policyId": row.id,
+            "startDate": row.event_date.isoformat(),
+            "endDate": row.end_date.isoformat() if row.end_date else None,
+            "provider": row.provider,
+        }
+    return {
+        "type": "CLAIM",
+        "claimId": row.id,
+        "claimDate": row.event_date.isoformat(),
+        "amount": float(row.amount),
+        "description": row.description,
+    }
+
 
-    def event_date(e: dict):
-        return e.get("startDate") or e.get("claimDate")
+def _page(rows, limit: int) -> tuple[list[dict], str | None]:
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.event_date, last.type, last.id)
+    return [_to_event(r) for r in rows], next_cursor
 
-    events.sort(key=event_date)
 
-    return events
+def get_car_history(
+    db: Session,
+    car_id: int,
+    limit: int = settings.PAGINATION_DEFAULT_LIMIT,
+    before: str | None = None,
+    event_type: str | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> tuple[list[dict], str | None]:
+    """Return one page of a car's events, newest first, and the next cursor."""
+    stmt = _history_stmt(car_id, limit, before, event_type, date_from, date_to)
+    rows = db.execute(stmt).all()
+    # Only an empty page needs the extra existence check
+    if not rows and db.query(Car.id).filter(Car.id == car_id).first() is None:
+        raise NotFoundError("Car", car_id)
+    return _page(rows, limit)
+
+
+async def get_car_history_async(
+    db: AsyncSession,
+    car_id: int,
+    limit: int = settings.PAGINATION_DEFAULT_LIMIT,
+    before: str | None = None,
+    event_type: str | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> tuple[list[dict], str | None]:
+    """Async variant of `get_car_history`."""
+    stmt = _history_stmt(car_id, limit, before, event_type, date_from, date_to)
+    rows = (await db.execute(stmt)).all()
+    if not rows and await db.scalar(select(Car.id).where(Car.id == car_id)) is None:
+        raise NotFoundError("Car", car_id)
+    return _page(rows, limit)
@@ -0,0 +1,57 @@
+"""Translate database constraint violations into domain exceptions.
+
+Write paths issue a single INSERT/UPDATE ... RETURNING and let the database
+enforce foreign keys and unique indexes instead of pre-checking with SELECTs.
+"""
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from services.exceptions import ValidationError
+
+# SQLite reports the failing column rather than the constraint name
+_SQLITE_UNIQUE_COLUMNS = {"car.vin": "ix_car_vin"}
+
+
+def constraint_name(exc: IntegrityError) -> str | None:
+    """Name of the violated constraint, when the driver reports one."""
+    diag = getattr(exc.orig, "diag", None)
+    name = getattr(diag, "constraint_name", None)
+    if name:
+        return name
+    message = str(exc.orig)
+    for column, index_name in _SQLITE_UNIQUE_COLUMNS.items():
+        if f"UNIQUE constraint failed: {column}" in message:
+            return index_name
+    return None
+
+
+def translate_integrity_error(
+    exc: IntegrityError, errors: dict[str, Exception]
+) -> Exception:
+    """Map `exc` to the domain error registered for its constraint name."""
+    name = constraint_name(exc)
+    if name in errors:
+        return errors[name]
+    if name is None and "FOREIGN KEY constraint failed" in str(exc.orig):
+        # SQLite does not say which foreign key failed; fine when there is one
+        fk_errors = [e for n, e in errors.items() if n.startswith("fk_")]
+        if len(fk_errors) == 1:
+            return fk_errors[0]
+    return ValidationError("Write violates data integrity constraints")
+
+
+def commit_detached(db: Session, *objs, **loaded) -> None:
+    """Commit, keeping `objs` usable for serialization without a refresh.
+
+    Objects returned by INSERT/UPDATE ... RETURNING are fully loaded; detaching
+    them before the commit stops expire-on-commit from costing a SELECT each.
+    `loaded` pre-populates relationships on the first object (e.g. owner=...).
+    """
+    for key, value in loaded.items():
+        set_committed_value(objs[0], key, value)
+    for obj in (*objs, *loaded.values()):
+        if obj is not None and obj in db:
+            db.expunge(obj)
+    db.commit()
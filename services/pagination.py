@@ -0,0 +1,36 @@
+"""Keyset (cursor) pagination helpers shared by the list services."""
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query
+
+
+def keyset_page(query: Query, key_column, limit: int, after: int | None = None):
+    """Return one page of `query` ordered by `key_column` plus the next cursor.
+
+    Rows are filtered with `key_column > after` instead of OFFSET so every page
+    is an index range scan of at most `limit + 1` rows, however deep it is.
+    The extra row only tells us whether another page exists.
+    """
+    if after is not None:
+        query = query.filter(key_column > after)
+    rows = query.order_by(key_column).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = getattr(rows[-1], key_column.key)
+    return rows, next_cursor
+
+
+async def keyset_page_async(
+    db: AsyncSession, stmt: Select, key_column, limit: int, after: int | None = None
+):
+    """Async variant of `keyset_page` for a `select()` of one ORM entity."""
+    if after is not None:
+        stmt = stmt.where(key_column > after)
+    rows = list(await db.scalars(stmt.order_by(key_column).limit(limit + 1)))
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = getattr(rows[-1], key_column.key)
+    return rows, next_cursor
@@ -2,12 +2,24 @@
 
 from datetime import date, datetime
 
+from sqlalchemy import Row, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from api.schemas import InsurancePolicyCreate, InsurancePolicyCreateNested
+from api.schemas import (InsurancePolicyCreate, InsurancePolicyCreateNested,
+                         InsurancePolicyRead)
 from core.logging import get_logger
-from db.models import Car, InsurancePolicy
+from core.settings import settings
+from db.models import InsurancePolicy
+from services.coverage_index import coverage_index
 from services.exceptions import NotFoundError, ValidationError
+from services.expiry_outbox import record_expiries, record_expiry
+from services.expiry_signal import notify_expiry_date
+from services.integrity import commit_detached, translate_integrity_error
+from services.pagination import keyset_page, keyset_page_async
+from services.read_cache import (get_policy_read, get_policy_read_async,
+                                 invalidate_policies)
 
 log = get_logger()
 
@@ -15,21 +27,27 @@ log = get_logger()
 def create_policy(
     db: Session, car_id: int, data: InsurancePolicyCreate | InsurancePolicyCreateNested
 ) -> InsurancePolicy:
-    car = db.query(Car).filter(Car.id == car_id).first()
-
-    if not car:
-        raise NotFoundError("Car", car_id)
-
-    policy = InsurancePolicy(
-        car_id=car_id,
-        provider=data.provider,
-        start_date=data.start_date,
-        end_date=data.end_date,
-        logged_expiry_at=data.logged_expiry_at,
+    stmt = (
+        insert(InsurancePolicy)
+        .values(
+            car_id=car_id,
+            provider=data.provider,
+            start_date=data.start_date,
+            end_date=data.end_date,
+            logged_expiry_at=data.logged_expiry_at,
+        )
+        .returning(InsurancePolicy)
     )
-    db.add(policy)
-    db.commit()
-    db.refresh(policy)
+    try:
+        policy = db.scalars(stmt).one()
+    except IntegrityError as e:
+        db.rollback()
+        raise translate_integrity_error(
+            e, {"fk_insurance_policy_car_id_car": NotFoundError("Car", car_id)}
+        ) from e
+    commit_detached(db, policy)
+    coverage_index.invalidate(car_id)
+    notify_expiry_date(policy.end_date, policy.logged_expiry_at)
 
     log.info(
         "policy_created",
@@ -41,14 +59,28 @@ def create_policy(
 
 
 def update_policy(
-    db: Session, policy: InsurancePolicy, data: InsurancePolicyCreate
+    db: Session, policy_id: int, data: InsurancePolicyCreate
 ) -> InsurancePolicy:
-    policy.provider = data.provider
-    policy.start_date = data.start_date
-    policy.end_date = data.end_date
-    policy.logged_expiry_at = data.logged_expiry_at
-    db.commit()
-    db.refresh(policy)
+    stmt = (
+        update(InsurancePolicy)
+        .where(InsurancePolicy.id == policy_id)
+        .values(
+            provider=data.provider,
+            start_date=data.start_date,
+            end_date=data.end_date,
+            logged_expiry_at=data.logged_expiry_at,
+        )
+        .returning(InsurancePolicy)
+        .execution_options(synchronize_session=False)
+    )
+    policy = db.scalars(stmt).one_or_none()
+    if policy is None:
+        db.rollback()
+        raise NotFoundError("Policy", policy_id)
+    commit_detached(db, policy)
+    coverage_index.invalidate(policy.car_id)
+    invalidate_policies(policy.id)
+    notify_expiry_date(policy.end_date, policy.logged_expiry_at)
     log.info(
         "policy_updated",
         policyId=policy.id,
@@ -62,6 +94,52 @@ def get_policy_by_id(db: Session, policy_id: int) -> InsurancePolicy | None:
     return db.query(InsurancePolicy).filter(InsurancePolicy.id == policy_id).first()
 
 
+def get_policy_cached(
+    db: Session, policy_id: int
+) -> InsurancePolicy | InsurancePolicyRead | None:
+    """Get a policy through the Redis read-through cache when enabled."""
+    if not settings.CACHE_ENABLED:
+        return get_policy_by_id(db, policy_id)
+
+    def load() -> InsurancePolicy:
+        policy = get_policy_by_id(db, policy_id)
+        if not policy:
+            raise NotFoundError("Policy", policy_id)
+        return policy
+
+    try:
+        return get_policy_read(policy_id, load)
+    except NotFoundError:
+        return None
+
+
+async def get_policy_by_id_async(
+    db: AsyncSession, policy_id: int
+) -> InsurancePolicy | None:
+    return await db.scalar(
+        select(InsurancePolicy).where(InsurancePolicy.id == policy_id)
+    )
+
+
+async def get_policy_cached_async(
+    db: AsyncSession, policy_id: int
+) -> InsurancePolicy | InsurancePolicyRead | None:
+    """Async variant of `get_policy_cached`."""
+    if not settings.CACHE_ENABLED:
+        return await get_policy_by_id_async(db, policy_id)
+
+    async def load() -> InsurancePolicy:
+        policy = await get_policy_by_id_async(db, policy_id)
+        if not policy:
+            raise NotFoundError("Policy", policy_id)
+        return policy
+
+    try:
+        return await get_policy_read_async(policy_id, load)
+    except NotFoundError:
+        return None
+
+
 def get_policies_for_car(db: Session, car_id: int) -> list[InsurancePolicy]:
     return db.query(InsurancePolicy).filter(InsurancePolicy.car_id == car_id).all()
 
@@ -80,6 +158,20 @@ def get_active_policy(
     )
 
 
+async def get_active_policy_async(
+    db: AsyncSession, car_id: int, on_date: date
+) -> InsurancePolicy | None:
+    return await db.scalar(
+        select(InsurancePolicy)
+        .where(
+            InsurancePolicy.car_id == car_id,
+            InsurancePolicy.start_date <= on_date,
+            InsurancePolicy.end_date >= on_date,
+        )
+        .limit(1)
+    )
+
+
 def get_unlogged_expiring_policies(
     db: Session, target_date: date
 ) -> list[InsurancePolicy]:
@@ -94,15 +186,76 @@ def get_unlogged_expiring_policies(
     )
 
 
+def next_unlogged_expiry_date(db: Session, from_date: date) -> date | None:
+    """Earliest end_date on or after from_date with an unlogged policy.
+
+    A single MIN over the partial (end_date WHERE logged_expiry_at IS NULL)
+    index, so it stays cheap however many policies exist.
+    """
+    return db.scalar(
+        select(func.min(InsurancePolicy.end_date)).where(
+            InsurancePolicy.end_date >= from_date,
+            InsurancePolicy.logged_expiry_at.is_(None),
+        )
+    )
+
+
+def mark_expiring_policies_logged(
+    db: Session, target_date: date, logged_at: datetime, limit: int
+) -> list[Row]:
+    """Mark up to `limit` unlogged policies ending on target_date as logged.
+
+    One `UPDATE ... WHERE id IN (SELECT ... LIMIT n) RETURNING` statement per
+    call; returns (id, car_id, end_date) rows for the policies it marked and
+    queues their expiry events in the outbox. The caller commits, so each
+    chunk holds row locks only for `limit` rows.
+    """
+    chunk = (
+        select(InsurancePolicy.id)
+        .where(
+            InsurancePolicy.end_date == target_date,
+            InsurancePolicy.logged_expiry_at.is_(None),
+        )
+        .order_by(InsurancePolicy.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    stmt = (
+        update(InsurancePolicy)
+        .where(InsurancePolicy.id.in_(chunk.scalar_subquery()))
+        .values(logged_expiry_at=logged_at)
+        .returning(InsurancePolicy.id, InsurancePolicy.car_id, InsurancePolicy.end_date)
+        .execution_options(synchronize_session=False)
+    )
+    rows = db.execute(stmt).all()
+    record_expiries(db, rows, logged_at)
+    return rows
+
+
 def mark_policy_logged(
     db: Session, policy: InsurancePolicy, logged_at: datetime
 ) -> None:
     policy.logged_expiry_at = logged_at
     db.add(policy)
+    record_expiry(db, policy, logged_at)
+
 
+def list_policies(
+    db: Session,
+    limit: int = settings.PAGINATION_DEFAULT_LIMIT,
+    after: int | None = None,
+) -> tuple[list[InsurancePolicy], int | None]:
+    return keyset_page(db.query(InsurancePolicy), InsurancePolicy.id, limit, after)
 
-def list_policies(db: Session) -> list[InsurancePolicy]:
-    return db.query(InsurancePolicy).all()
+
+async def list_policies_async(
+    db: AsyncSession,
+    limit: int = settings.PAGINATION_DEFAULT_LIMIT,
+    after: int | None = None,
+) -> tuple[list[InsurancePolicy], int | None]:
+    return await keyset_page_async(
+        db, select(InsurancePolicy), InsurancePolicy.id, limit, after
+    )
 
 
 def delete_policy(db: Session, policy: InsurancePolicy) -> None:
@@ -110,4 +263,6 @@ def delete_policy(db: Session, policy: InsurancePolicy) -> None:
     car_id = policy.car_id
     db.delete(policy)
     db.commit()
+    coverage_index.invalidate(car_id)
+    invalidate_policies(policy_id)
     log.info("policy_deleted", policyId=policy_id, carId=car_id)
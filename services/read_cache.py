@@ -0,0 +1,123 @@
+"""Redis read-through cache for the hottest single-entity reads.
+
+Payloads are the serialized API read schemas, so a hit never touches the
+database. Writers call the `invalidate_*` helpers after committing; entries
+also expire after a configurable TTL. Redis errors degrade to a DB read.
+
+Misses are loaded from the primary, not a replica: a replica still behind an
+update would put the old row back in the cache for the whole TTL. Hits never
+open a connection, so the primary only sees the misses.
+"""
+
+from typing import Awaitable, Callable, TypeVar
+
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from api.schemas import CarRead, InsurancePolicyRead
+from core.logging import get_logger
+from core.redis import get_async_redis, get_redis
+from core.settings import settings
+
+log = get_logger()
+
+S = TypeVar("S", bound=BaseModel)
+
+CAR_KEY = "cache:car:{}"
+POLICY_KEY = "cache:policy:{}"
+
+
+def read_through(key: str, ttl_seconds: int, schema: type[S], loader: Callable) -> S:
+    """Return `schema` for `key` from Redis, falling back to `loader()` on a miss.
+
+    `loader` returns the ORM object (or raises, e.g. NotFoundError, which is
+    never cached).
+    """
+    try:
+        cached = get_redis().get(key)
+    except RedisError:
+        log.warning("cache_unavailable", key=key)
+        return schema.model_validate(loader())
+    if cached is not None:
+        return schema.model_validate_json(cached)
+
+    payload = schema.model_validate(loader())
+    try:
+        get_redis().set(key, payload.model_dump_json(), ex=ttl_seconds)
+    except RedisError:
+        log.warning("cache_unavailable", key=key)
+    return payload
+
+
+async def read_through_async(
+    key: str,
+    ttl_seconds: int,
+    schema: type[S],
+    loader: Callable[[], Awaitable],
+) -> S:
+    """Async variant of `read_through` using the asyncio Redis client."""
+    client = get_async_redis()
+    try:
+        cached = await client.get(key)
+    except RedisError:
+        log.warning("cache_unavailable", key=key)
+        return schema.model_validate(await loader())
+    if cached is not None:
+        return schema.model_validate_json(cached)
+
+    payload = schema.model_validate(await loader())
+    try:
+        await client.set(key, payload.model_dump_json(), ex=ttl_seconds)
+    except RedisError:
+        log.warning("cache_unavailable", key=key)
+    return payload
+
+
+def _invalidate(*keys: str) -> None:
+    if not settings.CACHE_ENABLED or not keys:
+        return
+    try:
+        get_redis().delete(*keys)
+    except RedisError:
+        # Entry will still age out after its TTL
+        log.warning("cache_invalidation_failed", keys=list(keys))
+
+
+def get_car_read(car_id: int, loader: Callable) -> CarRead:
+    return read_through(
+        CAR_KEY.format(car_id), settings.CACHE_CAR_TTL_SECONDS, CarRead, loader
+    )
+
+
+def get_policy_read(policy_id: int, loader: Callable) -> InsurancePolicyRead:
+    return read_through(
+        POLICY_KEY.format(policy_id),
+        settings.CACHE_POLICY_TTL_SECONDS,
+        InsurancePolicyRead,
+        loader,
+    )
+
+
+async def get_car_read_async(car_id: int, loader: Callable[[], Awaitable]) -> CarRead:
+    return await read_through_async(
+        CAR_KEY.format(car_id), settings.CACHE_CAR_TTL_SECONDS, CarRead, loader
+    )
+
+
+async def get_policy_read_async(
+    policy_id: int, loader: Callable[[], Awaitable]
+) -> InsurancePolicyRead:
+    return await read_through_async(
+        POLICY_KEY.format(policy_id),
+        settings.CACHE_POLICY_TTL_SECONDS,
+        InsurancePolicyRead,
+        loader,
+    )
+
+
+def invalidate_car(car_id: int) -> None:
+    _invalidate(CAR_KEY.format(car_id))
+
+
+def invalidate_policies(*policy_ids: int) -> None:
+    _invalidate(*(POLICY_KEY.format(pid) for pid in policy_ids))
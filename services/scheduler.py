@@ -1,31 +1,69 @@
-"""Background scheduler with Redis lock for policy expiry logging."""
+"""Background scheduler with Redis lock for policy expiry logging.
+
+With SCHEDULER_LEADER_ELECTION (the default) every worker campaigns for a
+Redis lease, and only the elected leader creates the APScheduler and runs
+jobs; the others do no scheduler work beyond one lease attempt per
+SCHEDULER_LEADER_LEASE_SECONDS / 3.
+
+SCHEDULER_MODE=interval runs the expiry job every SCHEDULER_INTERVAL_MINUTES.
+SCHEDULER_MODE=event instead arms a one-shot job for midnight (in
+SCHEDULER_TIMEZONE) of the next date with unlogged expiries, found with one
+MIN query. Policy writes publish their end date (services.expiry_signal) and
+the leader moves the job earlier when needed; a resync every
+SCHEDULER_RESYNC_HOURS covers writes that bypass the services.
+
+In both modes the leader also relays the expiry event outbox
+(services.expiry_outbox) every EXPIRY_OUTBOX_RELAY_INTERVAL_SECONDS.
+"""
 
 from __future__ import annotations
 
-from datetime import datetime
+import threading
+import time
+from datetime import date, datetime
+from datetime import time as dt_time
+from datetime import timedelta
 from zoneinfo import ZoneInfo
 
 from apscheduler.schedulers.background import BackgroundScheduler
+from redis.exceptions import RedisError
 from sqlalchemy.orm import Session
 
 from core.logging import get_logger
-from core.redis import acquire_lock, release_lock
+from core.metrics import (SCHEDULER_JOB_DURATION, SCHEDULER_JOB_ROWS,
+                          SCHEDULER_JOB_RUNS)
+from core.redis import LeaderElection, acquire_lock, get_redis, release_lock
 from core.settings import settings
 from db.session import get_db
-from services.policy_service import (get_unlogged_expiring_policies,
-                                     mark_policy_logged)
+from services.expiry_outbox import relay_pending
+from services.expiry_service import (ExpiryRunAborted, catch_up_expiries,
+                                     log_expiries_for_day)
+from services.policy_service import next_unlogged_expiry_date
 
 log = get_logger()
 
 LOCK_KEY = settings.REDIS_LOCK_KEY
 LOCK_TTL_SECONDS = settings.REDIS_LOCK_TTL_SECONDS
+EXPIRY_JOB = "policy_expiry"
+EXPIRY_JOB_ID = "policy-expiry"
+RESYNC_JOB_ID = "policy-expiry-resync"
+OUTBOX_JOB = "expiry_outbox_relay"
+OUTBOX_JOB_ID = "expiry-outbox-relay"
 
 
 def _run_policy_expiry_job():
-    if not acquire_lock(LOCK_KEY, LOCK_TTL_SECONDS):
+    if _election is not None and not _election.is_leader:
+        # Demoted since the run was scheduled
+        SCHEDULER_JOB_RUNS.labels(EXPIRY_JOB, "skipped").inc()
+        return
+    lock = acquire_lock(LOCK_KEY, LOCK_TTL_SECONDS)
+    if not lock:
         # Another instance is running the job
+        SCHEDULER_JOB_RUNS.labels(EXPIRY_JOB, "skipped").inc()
         return
 
+    started = time.perf_counter()
+    outcome = "done"
     session_generator = get_db()
     db: Session = next(session_generator)
     try:
@@ -37,62 +75,271 @@ def _run_policy_expiry_job():
         in_window = start <= now_local < end
         today = now_local.date()
 
-        # Fallback: if we are outside the window but nothing has been logged yet for today allow a single catch-up run.
-        expiring = get_unlogged_expiring_policies(db, today)
-        if not expiring:
-            return
-        if not in_window:
-            # Check if any policy already has logged_expiry_at today (catch-up logic)
-            already_logged = any(
-                p.logged_expiry_at and p.logged_expiry_at.date() == today
-                for p in expiring
+        def stop() -> str | None:
+            if lock.lost:
+                return "lock_lost"
+            if _election is not None and not _election.is_leader:
+                return "leadership_lost"
+            return None
+
+        # Days missed while the scheduler was down (deploys, outages) first.
+        # Outside the window anything still unlogged for today is a catch-up
+        # run too. Chunks are committed one by one, so memory and row locks
+        # stay bounded; the lock is renewed while chunks keep completing.
+        chunk_size = settings.EXPIRY_JOB_CHUNK_SIZE
+        with lock.keep_alive():
+            if settings.EXPIRY_CATCHUP_DAYS:
+                catch_up_expiries(
+                    db,
+                    today - timedelta(days=settings.EXPIRY_CATCHUP_DAYS),
+                    today - timedelta(days=1),
+                    now_local,
+                    chunk_size,
+                    EXPIRY_JOB,
+                    stop=stop,
+                    progress=lock.progress,
+                )
+            total = log_expiries_for_day(
+                db,
+                today,
+                now_local,
+                chunk_size,
+                EXPIRY_JOB,
+                in_window=in_window,
+                stop=stop,
+                progress=lock.progress,
             )
-            if already_logged:
-                return
-            log.info("policy_expiry_catchup", date=today.isoformat())
-        for p in expiring:
+        if total and not in_window:
+            log.info("policy_expiry_catchup", date=today.isoformat(), count=total)
+        if total:
             log.info(
-                "policy_expiry_logged",
-                policyId=p.id,
-                carId=p.car_id,
-                endDate=p.end_date.isoformat(),
-                inWindow=in_window,
+                "policy_expiry_job_done",
+                date=today.isoformat(),
+                count=total,
+                fencingToken=_election.fencing_token if _election else None,
             )
-            mark_policy_logged(db, p, now_local)
-        db.commit()
+    except ExpiryRunAborted as exc:
+        outcome = "aborted"
+        log.warning("policy_expiry_job_aborted", reason=exc.reason)
     except Exception:
+        outcome = "error"
         log.exception("policy_expiry_job_error")
     finally:
         db.close()
-        release_lock(LOCK_KEY)
+        release_lock(lock)
+        SCHEDULER_JOB_DURATION.labels(EXPIRY_JOB).observe(time.perf_counter() - started)
+        SCHEDULER_JOB_RUNS.labels(EXPIRY_JOB, outcome).inc()
+
+
+def _run_outbox_relay_job():
+    """Drain the expiry event outbox into the Redis Stream."""
+    started = time.perf_counter()
+    outcome = "done"
+    session_generator = get_db()
+    db: Session = next(session_generator)
+    try:
+        relayed = relay_pending(db, get_redis(), settings.EXPIRY_OUTBOX_BATCH_SIZE)
+        SCHEDULER_JOB_ROWS.labels(OUTBOX_JOB).inc(relayed)
+    except Exception:
+        # Unsent rows stay in the outbox for the next run
+        outcome = "error"
+        log.exception("expiry_outbox_relay_error")
+    finally:
+        db.close()
+        SCHEDULER_JOB_DURATION.labels(OUTBOX_JOB).observe(time.perf_counter() - started)
+        SCHEDULER_JOB_RUNS.labels(OUTBOX_JOB, outcome).inc()
 
 
 _scheduler: BackgroundScheduler | None = None
+_election: LeaderElection | None = None
+_expiry_listener = None
+# Serialises job start/stop between lifespan and the election thread
+_scheduler_lock = threading.Lock()
+
+
+# -------------- Event mode --------------
+
+
+def _midnight(day: date) -> datetime:
+    return datetime.combine(day, dt_time.min, ZoneInfo(settings.SCHEDULER_TIMEZONE))
+
+
+def _schedule_expiry_at(run_at: datetime) -> None:
+    scheduler = _scheduler
+    if scheduler is None:
+        return
+    scheduler.add_job(
+        _run_scheduled_expiry_job,
+        "date",
+        run_date=run_at,
+        id=EXPIRY_JOB_ID,
+        replace_existing=True,
+        # A one-shot run skipped as misfired (busy or suspended process at
+        # midnight) would never re-arm itself; run it late instead
+        misfire_grace_time=None,
+        coalesce=True,
+    )
+    log.info("policy_expiry_scheduled", runAt=run_at.isoformat())
+
+
+def _schedule_next_expiry(after_run: bool = False) -> None:
+    """Arm the one-shot expiry job for the next date with unlogged expiries."""
+    scheduler = _scheduler
+    if scheduler is None:
+        return
+    now = datetime.now(ZoneInfo(settings.SCHEDULER_TIMEZONE))
+    session_generator = get_db()
+    db: Session = next(session_generator)
+    try:
+        # Days missed while no leader ran the job are caught up by the next
+        # run (EXPIRY_CATCHUP_DAYS), so they schedule it too: immediately
+        next_date = next_unlogged_expiry_date(
+            db, now.date() - timedelta(days=settings.EXPIRY_CATCHUP_DAYS)
+        )
+    finally:
+        db.close()
+    if next_date is None:
+        if scheduler.get_job(EXPIRY_JOB_ID):
+            scheduler.remove_job(EXPIRY_JOB_ID)
+        log.info("policy_expiry_idle")
+        return
+    if after_run and next_date <= now.date():
+        # The run left today's work behind (lock held elsewhere, aborted):
+        # retry on the polling interval rather than spinning
+        run_at = now + timedelta(minutes=settings.SCHEDULER_INTERVAL_MINUTES)
+    else:
+        run_at = max(_midnight(next_date), now)
+    _schedule_expiry_at(run_at)
+
+
+def _run_scheduled_expiry_job() -> None:
+    try:
+        _run_policy_expiry_job()
+    finally:
+        _schedule_next_expiry(after_run=True)
+
+
+def _on_expiry_changed(message) -> None:
+    """Pub/sub handler: move the expiry job earlier if a policy now needs it."""
+    scheduler = _scheduler
+    if scheduler is None:
+        return
+    try:
+        changed = date.fromisoformat(message["data"])
+    except (TypeError, ValueError):
+        log.warning("expiry_notify_invalid", data=message.get("data"))
+        return
+    now = datetime.now(ZoneInfo(settings.SCHEDULER_TIMEZONE))
+    if changed < now.date():
+        return
+    run_at = max(_midnight(changed), now)
+    job = scheduler.get_job(EXPIRY_JOB_ID)
+    if job is None or job.next_run_time is None or run_at < job.next_run_time:
+        _schedule_expiry_at(run_at)
+
+
+def _on_listener_error(exc, _pubsub, _thread) -> None:
+    # redis-py reconnects and resubscribes on the next read
+    log.warning("expiry_listener_error", error=str(exc))
+    time.sleep(1)
+
+
+def _listen_for_expiry_changes():
+    try:
+        pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{settings.SCHEDULER_EXPIRY_CHANNEL: _on_expiry_changed})
+        return pubsub.run_in_thread(
+            sleep_time=1.0, daemon=True, exception_handler=_on_listener_error
+        )
+    except RedisError as exc:
+        # The periodic resync still picks up new expiries
+        log.warning("expiry_listener_unavailable", error=str(exc))
+        return None
+
+
+# -------------- Lifecycle --------------
+
+
+def _start_jobs() -> None:
+    global _scheduler, _expiry_listener
+    with _scheduler_lock:
+        if _scheduler is not None:
+            return
+        tz = ZoneInfo(settings.SCHEDULER_TIMEZONE)
+        _scheduler = BackgroundScheduler(timezone=tz)
+        if settings.SCHEDULER_MODE == "event":
+            _scheduler.add_job(
+                _schedule_next_expiry,
+                "interval",
+                hours=settings.SCHEDULER_RESYNC_HOURS,
+                id=RESYNC_JOB_ID,
+                next_run_time=datetime.now(tz),
+                max_instances=1,
+                coalesce=True,
+            )
+            _expiry_listener = _listen_for_expiry_changes()
+        else:
+            _scheduler.add_job(
+                _run_policy_expiry_job,
+                "interval",
+                minutes=settings.SCHEDULER_INTERVAL_MINUTES,
+                id=EXPIRY_JOB_ID,
+                max_instances=1,
+                coalesce=True,
+            )
+        if settings.EXPIRY_OUTBOX_ENABLED:
+            _scheduler.add_job(
+                _run_outbox_relay_job,
+                "interval",
+                seconds=settings.EXPIRY_OUTBOX_RELAY_INTERVAL_SECONDS,
+                id=OUTBOX_JOB_ID,
+                max_instances=1,
+                coalesce=True,
+            )
+        _scheduler.start()
+    log.info(
+        "scheduler_started",
+        mode=settings.SCHEDULER_MODE,
+        intervalMinutes=settings.SCHEDULER_INTERVAL_MINUTES,
+    )
+
+
+def _stop_jobs() -> None:
+    global _scheduler, _expiry_listener
+    with _scheduler_lock:
+        if _scheduler is None:
+            return
+        if _expiry_listener is not None:
+            _expiry_listener.stop()
+            _expiry_listener = None
+        _scheduler.shutdown(wait=False)
+        _scheduler = None
+    log.info("scheduler_stopped")
 
 
 def start_scheduler() -> None:
-    global _scheduler
-    if _scheduler is not None:
+    global _election
+    if _scheduler is not None or _election is not None:
         return
     if not settings.SCHEDULER_ENABLED:
         log.info("scheduler_disabled")
         return
-    _scheduler = BackgroundScheduler(timezone=settings.SCHEDULER_TIMEZONE)
-    _scheduler.add_job(
-        _run_policy_expiry_job,
-        "interval",
-        minutes=settings.SCHEDULER_INTERVAL_MINUTES,
-        id="policy-expiry",
-        max_instances=1,
-        coalesce=True,
+    if not settings.SCHEDULER_LEADER_ELECTION:
+        _start_jobs()
+        return
+    _election = LeaderElection(
+        settings.SCHEDULER_LEADER_KEY,
+        settings.SCHEDULER_LEADER_LEASE_SECONDS,
+        on_elected=_start_jobs,
+        on_demoted=_stop_jobs,
     )
-    _scheduler.start()
-    log.info("scheduler_started", intervalMinutes=settings.SCHEDULER_INTERVAL_MINUTES)
+    _election.start()
 
 
 def stop_scheduler() -> None:
-    global _scheduler
-    if _scheduler:
-        _scheduler.shutdown(wait=False)
-        log.info("scheduler_stopped")
-        _scheduler = None
+    global _election
+    if _election is not None:
+        # Releases the lease; the demotion callback stops the jobs
+        _election.stop()
+        _election = None
+    _stop_jobs()
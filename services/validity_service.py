@@ -2,19 +2,20 @@
 
 from datetime import date
 
+from sqlalchemy import Date, Integer, exists, literal, select, union_all
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import column, func
 
-from db.models import Car
+from core.settings import settings
+from db.models import Car, InsurancePolicy
+from services.coverage_index import coverage_index
 from services.exceptions import NotFoundError, ValidationError
-from services.policy_service import get_active_policy
+from services.policy_service import get_active_policy, get_active_policy_async
 
 
-def is_insurance_valid(db: Session, car_id: int, on_date_str: str) -> bool:
-    car = db.query(Car).filter(Car.id == car_id).first()
-
-    if not car:
-        raise NotFoundError("Car", car_id)
-
+def parse_validity_date(on_date_str: str) -> date:
     try:
         year, month, day = map(int, on_date_str.split("-"))
         on_date = date(year, month, day)
@@ -23,5 +24,116 @@ def is_insurance_valid(db: Session, car_id: int, on_date_str: str) -> bool:
 
     if on_date.year < 1900 or on_date.year > 2100:
         raise ValidationError("Date out of range")
+    return on_date
+
+
+def is_insurance_valid(db: Session, car_id: int, on_date_str: str) -> bool:
+    if settings.COVERAGE_INDEX_ENABLED:
+        coverage = coverage_index.get(db, car_id)
+        if coverage is None:
+            raise NotFoundError("Car", car_id)
+        return coverage.covers(parse_validity_date(on_date_str))
+
+    car = db.query(Car).filter(Car.id == car_id).first()
+
+    if not car:
+        raise NotFoundError("Car", car_id)
+
+    on_date = parse_validity_date(on_date_str)
 
     return get_active_policy(db, car_id, on_date) is not None
+
+
+async def is_insurance_valid_async(
+    db: AsyncSession, car_id: int, on_date_str: str
+) -> bool:
+    if settings.COVERAGE_INDEX_ENABLED:
+        coverage = await coverage_index.get_async(db, car_id)
+        if coverage is None:
+            raise NotFoundError("Car", car_id)
+        return coverage.covers(parse_validity_date(on_date_str))
+
+    if await db.scalar(select(Car.id).where(Car.id == car_id)) is None:
+        raise NotFoundError("Car", car_id)
+
+    on_date = parse_validity_date(on_date_str)
+
+    return await get_active_policy_async(db, car_id, on_date) is not None
+
+
+def _pairs_source(dialect: str, pairs: list[tuple[int, date]]):
+    """Return a selectable with `car_id`/`on_date` columns holding `pairs`.
+
+    PostgreSQL gets two array parameters unnested server-side; other dialects
+    (SQLite in tests) get an inline UNION ALL of literal rows.
+    """
+    if dialect == "postgresql":
+        return (
+            func.unnest(
+                literal([p[0] for p in pairs], ARRAY(Integer)),
+                literal([p[1] for p in pairs], ARRAY(Date)),
+            )
+            .table_valued(column("car_id", Integer), column("on_date", Date))
+            # AS q(car_id, on_date): unnest's own columns have no names
+            .render_derived()
+            .alias("q")
+        )
+    rows = [
+        select(
+            literal(car_id, Integer).label("car_id"),
+            literal(on_date, Date).label("on_date"),
+        )
+        for car_id, on_date in pairs
+    ]
+    source = rows[0] if len(rows) == 1 else union_all(*rows)
+    return source.subquery("q")
+
+
+def is_insurance_valid_batch(
+    db: Session, items: list[tuple[int, str]]
+) -> list[dict]:
+    """Resolve many (car_id, date) pairs with one set-based query.
+
+    Results come back in input order. Each has `valid` set, or `error` set to
+    `invalid_date` / `not_found` instead of raising for the whole batch.
+    """
+    results: list[dict] = [
+        {"car_id": car_id, "date": on_date_str, "valid": None, "error": None}
+        for car_id, on_date_str in items
+    ]
+    parsed: dict[int, tuple[int, date]] = {}
+    for idx, (car_id, on_date_str) in enumerate(items):
+        try:
+            parsed[idx] = (car_id, parse_validity_date(on_date_str))
+        except ValidationError:
+            results[idx]["error"] = "invalid_date"
+
+    pairs = sorted(set(parsed.values()))
+    if not pairs:
+        return results
+
+    q = _pairs_source(db.get_bind().dialect.name, pairs)
+    # Correlated EXISTS probes ix_insurance_policy_car_id_start_date_end_date
+    covered = exists().where(
+        InsurancePolicy.car_id == q.c.car_id,
+        InsurancePolicy.start_date <= q.c.on_date,
+        InsurancePolicy.end_date >= q.c.on_date,
+    )
+    stmt = select(
+        q.c.car_id,
+        q.c.on_date,
+        Car.id.is_not(None).label("found"),
+        covered.label("valid"),
+    ).outerjoin(Car, Car.id == q.c.car_id)
+    resolved = {
+        (row.car_id, row.on_date): (bool(row.found), bool(row.valid))
+        for row in db.execute(stmt)
+    }
+
+    for idx, key in parsed.items():
+        found, valid = resolved[key]
+        if found:
+            results[idx]["valid"] = valid
+        else:
+            results[idx]["error"] = "not_found"
+    return results
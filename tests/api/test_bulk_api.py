@@ -0,0 +1,129 @@
+from unittest.mock import patch
+
+from sqlalchemy import func, select
+
+from db.models import Car, Claim, InsurancePolicy
+from services.bulk_service import _insert_batch
+from tests.utils.factories import create_car, create_owner
+
+
+def _count(db, model):
+    return db.scalar(select(func.count()).select_from(model))
+
+
+def test_bulk_cars_created_in_batches(client, db_session_fixture):
+    owner = create_owner(db_session_fixture)
+    items = [{"vin": f"BULK{i:04d}", "ownerId": owner.id} for i in range(5)]
+    with (
+        patch("services.bulk_service.settings.BULK_BATCH_SIZE", 2),
+        patch("services.bulk_service._insert_batch", wraps=_insert_batch) as spy,
+    ):
+        resp = client.post("/api/cars:bulk", json=items)
+
+    assert resp.status_code == 201
+    body = resp.json()
+    assert body["created"] == 5 and body["failed"] == 0
+    assert [i["index"] for i in body["items"]] == list(range(5))
+    ids = [i["id"] for i in body["items"]]
+    assert all(ids) and len(set(ids)) == 5
+    # One multi-row INSERT per batch
+    assert [len(c.args[2]) for c in spy.call_args_list] == [2, 2, 1]
+    vins = dict(db_session_fixture.execute(select(Car.id, Car.vin)).all())
+    assert [vins[i] for i in ids] == [f"BULK{i:04d}" for i in range(5)]
+
+
+def test_bulk_cars_atomic_rejects_everything(client, db_session_fixture):
+    owner = create_owner(db_session_fixture)
+    existing = create_car(db_session_fixture, owner=owner)
+    items = [
+        {"vin": "ATOM0001", "ownerId": owner.id},
+        {"vin": existing.vin, "ownerId": owner.id},
+        {"vin": "ATOM0002", "ownerId": 999999},
+        {"ownerId": owner.id},
+        {"vin": "ATOM0001", "ownerId": owner.id},
+    ]
+    resp = client.post("/api/cars:bulk", json=items)
+
+    assert resp.status_code == 400
+    statuses = [i["status"] for i in resp.json()["items"]]
+    assert statuses == ["skipped", "conflict", "not_found", "invalid", "conflict"]
+    assert _count(db_session_fixture, Car) == 1
+
+
+def test_bulk_cars_partial_commits_valid_items(client, db_session_fixture):
+    owner = create_owner(db_session_fixture)
+    existing = create_car(db_session_fixture, owner=owner)
+    items = [
+        {"vin": "PART0001", "ownerId": owner.id},
+        {"vin": existing.vin, "ownerId": owner.id},
+        {"vin": "PART0002", "ownerId": owner.id},
+    ]
+    resp = client.post("/api/cars:bulk?atomic=false", json=items)
+
+    assert resp.status_code == 207
+    body = resp.json()
+    assert body["created"] == 2 and body["failed"] == 1
+    assert body["items"][1]["status"] == "conflict"
+    assert "already exists" in body["items"][1]["error"]
+    assert _count(db_session_fixture, Car) == 3
+
+
+def test_bulk_partial_falls_back_to_rows_on_integrity_error(client, db_session_fixture):
+    owner = create_owner(db_session_fixture)
+    items = [
+        {"vin": "RACE0001", "ownerId": owner.id},
+        {"vin": "RACE0002", "ownerId": owner.id},
+    ]
+    # Simulate a concurrent writer taking RACE0002 after the VIN pre-check
+    with patch("services.bulk_service._existing", side_effect=[{owner.id}, set()]):
+        create_car(db_session_fixture, vin="RACE0002", owner=owner)
+        resp = client.post("/api/cars:bulk?atomic=false", json=items)
+
+    assert resp.status_code == 207
+    statuses = [i["status"] for i in resp.json()["items"]]
+    assert statuses == ["created", "conflict"]
+    assert _count(db_session_fixture, Car) == 2
+
+
+def test_bulk_policies_and_claims(client, db_session_fixture):
+    car = create_car(db_session_fixture)
+    policies = [
+        {
+            "carId": car.id,
+            "provider": "A",
+            "startDate": "2025-01-01",
+            "endDate": "2025-06-30",
+        },
+        {"carId": 999999, "startDate": "2025-01-01", "endDate": "2025-06-30"},
+    ]
+    claims = [
+        {
+            "carId": car.id,
+            "claimDate": "2025-02-01",
+            "description": "Dent",
+            "amount": 50,
+        },
+        {
+            "carId": car.id,
+            "claimDate": "not-a-date",
+            "description": "Dent",
+            "amount": 50,
+        },
+    ]
+
+    resp = client.post("/api/policies:bulk?atomic=false", json=policies)
+    assert resp.status_code == 207
+    assert [i["status"] for i in resp.json()["items"]] == ["created", "not_found"]
+
+    resp = client.post("/api/claims:bulk?atomic=false", json=claims)
+    assert resp.status_code == 207
+    assert [i["status"] for i in resp.json()["items"]] == ["created", "invalid"]
+
+    assert _count(db_session_fixture, InsurancePolicy) == 1
+    assert _count(db_session_fixture, Claim) == 1
+
+
+def test_bulk_too_many_items(client):
+    with patch("services.bulk_service.settings.BULK_MAX_ITEMS", 1):
+        resp = client.post("/api/claims:bulk", json=[{}, {}])
+    assert resp.status_code == 400
@@ -0,0 +1,52 @@
+import json
+from unittest.mock import patch
+
+from tests.utils.factories import create_car, create_claim, create_policy
+
+
+def _ndjson(resp):
+    return [json.loads(line) for line in resp.text.splitlines()]
+
+
+def test_export_cars_streams_ndjson(client, db_session_fixture):
+    cars = [create_car(db_session_fixture, vin=f"VEXP{i}") for i in range(3)]
+
+    # Force several fetch batches to exercise the streaming path
+    with patch("services.export_service.settings.EXPORT_BATCH_SIZE", 2):
+        resp = client.get("/api/export/cars")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    rows = _ndjson(resp)
+    assert [r["id"] for r in rows] == [c.id for c in cars]
+    assert rows[0]["owner"]["id"] == cars[0].owner_id
+
+
+def test_export_policies_and_claims(client, db_session_fixture):
+    car = create_car(db_session_fixture, vin="VEXPPC")
+    policy = create_policy(db_session_fixture, car)
+    claim = create_claim(db_session_fixture, car)
+
+    policies = _ndjson(client.get("/api/export/policies"))
+    assert policies == [
+        {
+            "id": policy.id,
+            "carId": car.id,
+            "provider": policy.provider,
+            "startDate": "2025-01-01",
+            "endDate": "2025-12-31",
+            "loggedExpiryAt": None,
+        }
+    ]
+    claims = _ndjson(client.get("/api/export/claims"))
+    assert [c["id"] for c in claims] == [claim.id]
+
+
+def test_export_empty_table(client):
+    resp = client.get("/api/export/claims")
+    assert resp.status_code == 200
+    assert resp.text == ""
+
+
+def test_export_unknown_resource(client):
+    assert client.get("/api/export/owners").status_code == 422
@@ -0,0 +1,111 @@
+from datetime import date
+
+from sqlalchemy import event
+
+from tests.utils.factories import create_car, create_claim, create_policy
+
+
+def _seed(db):
+    car = create_car(db, vin="VHIST1")
+    p1 = create_policy(db, car, start=date(2024, 1, 1), end=date(2024, 12, 31))
+    c1 = create_claim(db, car, claim_date=date(2024, 6, 1), amount=100)
+    p2 = create_policy(db, car, start=date(2025, 1, 1), end=date(2025, 12, 31))
+    c2 = create_claim(db, car, claim_date=date(2025, 1, 1), amount=50)
+    c3 = create_claim(db, car, claim_date=date(2025, 3, 1), amount=75)
+    return car, p1, c1, p2, c2, c3
+
+
+def _ids(items):
+    return [(e["type"], e.get("policyId") or e.get("claimId")) for e in items]
+
+
+def test_history_newest_first(client, db_session_fixture):
+    car, p1, c1, p2, c2, c3 = _seed(db_session_fixture)
+
+    resp = client.get(f"/api/cars/{car.id}/history")
+
+    assert resp.status_code == 200
+    body = resp.json()
+    # Same-day events: POLICY before CLAIM
+    assert _ids(body["items"]) == [
+        ("CLAIM", c3.id),
+        ("POLICY", p2.id),
+        ("CLAIM", c2.id),
+        ("CLAIM", c1.id),
+        ("POLICY", p1.id),
+    ]
+    assert body["nextCursor"] is None
+    assert body["items"][1] == {
+        "type": "POLICY",
+        "policyId": p2.id,
+        "startDate": "2025-01-01",
+        "endDate": "2025-12-31",
+        "provider": "Acme Insurance",
+    }
+    assert body["items"][0]["amount"] == 75.0
+
+
+def test_history_cursor_pages(client, db_session_fixture):
+    car, p1, c1, p2, c2, c3 = _seed(db_session_fixture)
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        body = client.get(f"/api/cars/{car.id}/history", params=params).json()
+        seen.extend(_ids(body["items"]))
+        if body["nextCursor"] is None:
+            break
+        params = {"limit": 2, "before": body["nextCursor"]}
+
+    assert seen == [
+        ("CLAIM", c3.id),
+        ("POLICY", p2.id),
+        ("CLAIM", c2.id),
+        ("CLAIM", c1.id),
+        ("POLICY", p1.id),
+    ]
+
+
+def test_history_filters(client, db_session_fixture):
+    car, p1, c1, p2, c2, c3 = _seed(db_session_fixture)
+    url = f"/api/cars/{car.id}/history"
+
+    claims = client.get(url, params={"type": "CLAIM"}).json()["items"]
+    assert _ids(claims) == [("CLAIM", c3.id), ("CLAIM", c2.id), ("CLAIM", c1.id)]
+
+    in_2025 = client.get(url, params={"from": "2025-01-01", "to": "2025-02-01"})
+    assert _ids(in_2025.json()["items"]) == [("POLICY", p2.id), ("CLAIM", c2.id)]
+
+
+def test_history_single_statement(client, db_session_fixture):
+    car, *_ = _seed(db_session_fixture)
+    car_id = car.id
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session_fixture.get_bind()
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        assert client.get(f"/api/cars/{car_id}/history").status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    assert len(statements) == 1
+    assert "UNION ALL" in statements[0]
+
+
+def test_history_empty_and_not_found(client, db_session_fixture):
+    car = create_car(db_session_fixture, vin="VHIST2")
+    assert client.get(f"/api/cars/{car.id}/history").json() == {
+        "items": [],
+        "nextCursor": None,
+    }
+    assert client.get("/api/cars/99999/history").status_code == 404
+
+
+def test_history_invalid_params(client, db_session_fixture):
+    car = create_car(db_session_fixture, vin="VHIST3")
+    url = f"/api/cars/{car.id}/history"
+    assert client.get(url, params={"before": "not-a-cursor"}).status_code == 400
+    assert client.get(url, params={"type": "OTHER"}).status_code == 422
@@ -0,0 +1,76 @@
+from unittest.mock import patch
+
+from core.redis import _TimedRedis
+from services.coverage_index import CoverageIndex
+from services.scheduler import _run_policy_expiry_job
+from tests.utils.factories import create_car, create_policy
+
+
+def _sample(body: str, prefix: str) -> float:
+    for line in body.splitlines():
+        if line.startswith(prefix):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+def test_route_latency_uses_path_template(client, db_session_fixture):
+    car = create_car(db_session_fixture)
+    series = (
+        'http_request_duration_seconds_count{method="GET",route="/api/cars/{car_id}"}'
+    )
+    before = _sample(client.get("/metrics").text, series)
+
+    client.get(f"/api/cars/{car.id}")
+    client.get(f"/api/cars/{car.id + 1000}")
+
+    body = client.get("/metrics").text
+    assert _sample(body, series) == before + 2
+    assert (
+        'http_requests_total{method="GET",route="/api/cars/{car_id}",status="404"}'
+        in body
+    )
+    assert "http_response_size_bytes_bucket" in body
+    assert 'http_requests_in_flight{method="GET"}' in body
+    assert 'db_pool_checked_out_connections{pool="primary"}' in body
+
+
+def test_coverage_index_metrics(client, db_session_fixture):
+    car = create_car(db_session_fixture)
+    create_policy(db_session_fixture, car)
+    hits = 'coverage_index_lookups_total{result="hit"}'
+    misses = 'coverage_index_lookups_total{result="miss"}'
+    body = client.get("/metrics").text
+    before = {series: _sample(body, series) for series in (hits, misses)}
+
+    index = CoverageIndex(max_cars=10, ttl_seconds=60)
+    with patch(
+        "services.validity_service.settings.COVERAGE_INDEX_ENABLED", True
+    ), patch("services.validity_service.coverage_index", index):
+        for _ in range(3):
+            url = f"/api/cars/{car.id}/insurance-valid"
+            assert client.get(url, params={"date": "2025-06-01"}).status_code == 200
+
+    body = client.get("/metrics").text
+    assert _sample(body, misses) == before[misses] + 1
+    assert _sample(body, hits) == before[hits] + 2
+    assert _sample(body, "coverage_index_cars ") == 1
+    assert "coverage_index_invalidations_total" in body
+
+
+def test_redis_command_latency_recorded():
+    client = _TimedRedis()
+    series = 'redis_command_duration_seconds_count{command="PING"}'
+    with patch("redis.Redis.execute_command", return_value=True):
+        from core.metrics import render_latest
+
+        before = _sample(render_latest()[0].decode(), series)
+        client.ping()
+        assert _sample(render_latest()[0].decode(), series) == before + 1
+
+
+def test_scheduler_job_metrics(client):
+    series = 'scheduler_job_runs_total{job="policy_expiry",outcome="skipped"}'
+    before = _sample(client.get("/metrics").text, series)
+    with patch("services.scheduler.acquire_lock", return_value=False):
+        _run_policy_expiry_job()
+    assert _sample(client.get("/metrics").text, series) == before + 1
@@ -0,0 +1,46 @@
+from tests.utils.factories import create_car, create_claim, create_policy
+
+
+def test_list_cars_pages_by_cursor(client, db_session_fixture):
+    cars = [create_car(db_session_fixture, vin=f"VPAGE{i}") for i in range(5)]
+
+    first = client.get("/api/cars", params={"limit": 2})
+    assert first.status_code == 200
+    page = first.json()
+    assert [c["id"] for c in page["items"]] == [cars[0].id, cars[1].id]
+    assert page["items"][0]["owner"]["id"] == cars[0].owner_id
+    assert page["nextCursor"] == cars[1].id
+
+    second = client.get("/api/cars", params={"limit": 2, "after": page["nextCursor"]})
+    assert [c["id"] for c in second.json()["items"]] == [cars[2].id, cars[3].id]
+
+    last = client.get(
+        "/api/cars", params={"limit": 2, "after": second.json()["nextCursor"]}
+    )
+    assert [c["id"] for c in last.json()["items"]] == [cars[4].id]
+    assert last.json()["nextCursor"] is None
+
+
+def test_list_cars_empty(client):
+    resp = client.get("/api/cars")
+    assert resp.status_code == 200
+    assert resp.json() == {"items": [], "nextCursor": None}
+
+
+def test_list_policies_and_claims_paginated(client, db_session_fixture):
+    car = create_car(db_session_fixture, vin="VPAGEPC")
+    policies = [create_policy(db_session_fixture, car) for _ in range(3)]
+    claims = [create_claim(db_session_fixture, car) for _ in range(3)]
+
+    resp = client.get("/api/policies", params={"limit": 2, "after": policies[0].id})
+    assert [p["id"] for p in resp.json()["items"]] == [policies[1].id, policies[2].id]
+    assert resp.json()["nextCursor"] is None
+
+    resp = client.get("/api/claims", params={"limit": 1})
+    assert [c["id"] for c in resp.json()["items"]] == [claims[0].id]
+    assert resp.json()["nextCursor"] == claims[0].id
+
+
+def test_list_limit_out_of_range(client):
+    assert client.get("/api/cars", params={"limit": 0}).status_code == 422
+    assert client.get("/api/policies", params={"limit": 100000}).status_code == 422
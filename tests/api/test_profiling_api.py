@@ -0,0 +1,99 @@
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from core.profiling import sign_token, verify_token
+from core.settings import settings
+from main import create_app
+
+SECRET = "test-secret"
+
+
+def _token(purpose: str, ttl: int = 60) -> str:
+    return sign_token(SECRET, purpose, int(time.time()) + ttl)
+
+
+@pytest.fixture()
+def profiling_client(tmp_path):
+    with patch.multiple(
+        settings,
+        PROFILING_ENABLED=True,
+        PROFILING_SECRET=SECRET,
+        PROFILING_DIR=str(tmp_path),
+        PROFILING_SAMPLE_INTERVAL_MS=1,
+        PROFILING_MAX_FILES=2,
+    ):
+        yield TestClient(create_app(enable_scheduler=False, configure_logs=False))
+
+
+def test_verify_token_checks_purpose_and_expiry():
+    with patch.multiple(settings, PROFILING_ENABLED=True, PROFILING_SECRET=SECRET):
+        assert verify_token(_token("request"), "request")
+        assert not verify_token(_token("request"), "admin")
+        assert not verify_token(_token("request", ttl=-1), "request")
+        assert not verify_token(_token("request") + "0", "request")
+        assert not verify_token("garbage", "request")
+
+
+def test_request_without_token_is_not_profiled(profiling_client, tmp_path):
+    resp = profiling_client.get("/api/health")
+    assert resp.status_code == 200
+    assert "X-Profile-Id" not in resp.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_profiled_request_is_listed_and_downloadable(profiling_client):
+    resp = profiling_client.get(
+        "/api/health",
+        headers={"X-Profile-Token": _token("request"), "X-Request-ID": "req-1"},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["X-Profile-Id"] == "req-1"
+
+    admin = {"X-Profile-Token": _token("admin")}
+    listed = profiling_client.get("/admin/profiles", headers=admin).json()
+    assert [p["id"] for p in listed] == ["req-1"]
+    assert set(listed[0]) == {"id", "sizeBytes", "createdAt"}
+
+    resp = profiling_client.get("/admin/profiles/req-1", headers=admin)
+    assert resp.status_code == 200
+    for line in resp.text.splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert ";" in stack and int(count) > 0
+
+
+def test_query_param_token_and_unsafe_request_id(profiling_client):
+    resp = profiling_client.get(
+        "/api/health",
+        params={"profile_token": _token("request")},
+        headers={"X-Request-ID": "../etc/passwd"},
+    )
+    profile_id = resp.headers["X-Profile-Id"]
+    assert profile_id != "../etc/passwd" and "/" not in profile_id
+
+
+def test_old_profiles_are_pruned(profiling_client, tmp_path):
+    for i in range(3):
+        profiling_client.get(
+            "/api/health",
+            headers={"X-Profile-Token": _token("request"), "X-Request-ID": f"r{i}"},
+        )
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_admin_endpoints_require_admin_token(profiling_client):
+    assert profiling_client.get("/admin/profiles").status_code == 403
+    resp = profiling_client.get(
+        "/admin/profiles", headers={"X-Profile-Token": _token("request")}
+    )
+    assert resp.status_code == 403
+    resp = profiling_client.get(
+        "/admin/profiles/missing", headers={"X-Profile-Token": _token("admin")}
+    )
+    assert resp.status_code == 404
+
+
+def test_profiling_routes_absent_when_disabled(client):
+    assert client.get("/admin/profiles").status_code == 404
@@ -0,0 +1,107 @@
+"""Round-trip budgets for write endpoints.
+
+Each write is a single INSERT/UPDATE ... RETURNING, car responses included
+(the owner columns come back from the same statement). These tests fail if a
+pre-check SELECT or post-commit refresh creeps back in.
+"""
+
+from contextlib import contextmanager
+from functools import partial
+from unittest.mock import patch
+
+import pytest
+
+from db.query_stats import QueryStats, track
+from tests.utils.factories import (create_car, create_claim, create_owner,
+                                   create_policy)
+
+
+@contextmanager
+def request_stats():
+    """Collect the statements of the requests made in this context."""
+    stats = QueryStats(max_statements=None, max_repeats=None, strict=False)
+    with patch("api.middleware.track_queries", partial(track, stats)):
+        yield stats
+
+
+def _policy_body(car_id=None):
+    body = {"provider": "Acme", "startDate": "2025-01-01", "endDate": "2025-12-31"}
+    if car_id is not None:
+        body["carId"] = car_id
+    return body
+
+
+def _claim_body(car_id=None):
+    body = {"claimDate": "2025-03-01", "description": "Scratch", "amount": 100.5}
+    if car_id is not None:
+        body["carId"] = car_id
+    return body
+
+
+@pytest.mark.parametrize(
+    "method,path,body,status,budget",
+    [
+        (
+            "post",
+            "/api/cars",
+            lambda ids: {"vin": "QC-NEW", "ownerId": ids["owner"]},
+            201,
+            1,
+        ),
+        (
+            "put",
+            "/api/cars/{car}",
+            lambda ids: {"vin": "QC-UPD", "ownerId": ids["owner"]},
+            200,
+            1,
+        ),
+        ("post", "/api/policies", lambda ids: _policy_body(ids["car"]), 201, 1),
+        ("put", "/api/policies/{policy}", lambda ids: _policy_body(ids["car"]), 200, 1),
+        ("post", "/api/cars/{car}/policies", lambda ids: _policy_body(), 201, 1),
+        ("post", "/api/claims", lambda ids: _claim_body(ids["car"]), 201, 1),
+        ("put", "/api/claims/{claim}", lambda ids: _claim_body(ids["car"]), 200, 1),
+        ("post", "/api/cars/{car}/claims", lambda ids: _claim_body(), 201, 1),
+    ],
+)
+def test_write_endpoint_round_trips(
+    client, db_session_fixture, method, path, body, status, budget
+):
+    owner = create_owner(db_session_fixture)
+    car = create_car(db_session_fixture, owner=owner)
+    policy = create_policy(db_session_fixture, car=car)
+    claim = create_claim(db_session_fixture, car=car)
+    ids = {"owner": owner.id, "car": car.id, "policy": policy.id, "claim": claim.id}
+    payload = body(ids)
+    url = path.format(**ids)
+
+    with request_stats() as stats:
+        resp = getattr(client, method)(url, json=payload)
+
+    assert resp.status_code == status, resp.text
+    assert stats.count == budget, stats.shapes
+
+
+def test_create_car_missing_owner_is_404(client):
+    with request_stats() as stats:
+        resp = client.post("/api/cars", json={"vin": "QC-NOOWNER", "ownerId": 999999})
+    assert resp.status_code == 404
+    assert "Owner" in resp.json()["detail"]
+    assert stats.count == 1
+
+
+def test_create_car_duplicate_vin_is_400(client, db_session_fixture):
+    car = create_car(db_session_fixture)
+    resp = client.post("/api/cars", json={"vin": car.vin, "ownerId": car.owner_id})
+    assert resp.status_code == 400
+    assert "already exists" in resp.json()["detail"]
+
+
+def test_create_claim_missing_car_is_404(client):
+    resp = client.post("/api/cars/999999/claims", json=_claim_body())
+    assert resp.status_code == 404
+    assert "Car" in resp.json()["detail"]
+
+
+def test_update_policy_missing_is_404(client):
+    resp = client.put("/api/policies/999999", json=_policy_body(1))
+    assert resp.status_code == 404
@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+from tests.utils.factories import create_car
+
+
+def test_request_log_line_carries_db_stats(client, db_session_fixture):
+    car = create_car(db_session_fixture)
+    with (
+        patch("api.middleware.log") as log,
+        patch("structlog.contextvars.bind_contextvars") as bind,
+    ):
+        resp = client.get(f"/api/cars/{car.id}")
+
+    assert resp.status_code == 200
+    bound = {k: v for call in bind.call_args_list for k, v in call.kwargs.items()}
+    assert bound["dbStatements"] == 1
+    assert bound["dbTimeMs"] >= 0
+    event, kwargs = log.info.call_args.args[0], log.info.call_args.kwargs
+    assert event == "request_completed"
+    assert kwargs["status"] == 200
+
+
+def test_strict_budget_fails_the_request(client, db_session_fixture):
+    create_car(db_session_fixture)
+    with (
+        patch("db.query_stats.settings.QUERY_BUDGET_STRICT", True),
+        patch("db.query_stats.settings.QUERY_BUDGET_MAX_STATEMENTS", 0),
+    ):
+        resp = client.get("/api/cars")
+    assert resp.status_code == 500
+    assert resp.json()["error"] == "query_budget_exceeded"
+
+
+def test_bulk_routes_are_exempt_from_budget(client, db_session_fixture):
+    car = create_car(db_session_fixture)
+    with (
+        patch("db.query_stats.settings.QUERY_BUDGET_STRICT", True),
+        patch("db.query_stats.settings.QUERY_BUDGET_MAX_STATEMENTS", 0),
+    ):
+        resp = client.post(
+            "/api/claims:bulk",
+            json=[
+                {
+                    "carId": car.id,
+                    "claimDate": "2025-01-01",
+                    "description": "x",
+                    "amount": 1,
+                }
+            ],
+        )
+    assert resp.status_code == 201
@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+import structlog
+from fastapi.testclient import TestClient
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from api.middleware import RequestContextMiddleware
+
+
+def test_request_id_is_echoed(client):
+    resp = client.get("/api/health", headers={"X-Request-ID": "abc-123"})
+    assert resp.status_code == 200
+    assert resp.headers["X-Request-ID"] == "abc-123"
+
+
+def test_request_id_is_generated_and_context_cleared(client):
+    with patch("structlog.contextvars.bind_contextvars") as bind:
+        resp = client.get("/api/health")
+
+    request_id = resp.headers["X-Request-ID"]
+    assert len(request_id) == 36
+    assert bind.call_args_list[0].kwargs == {
+        "request_id": request_id,
+        "path": "/api/health",
+        "method": "GET",
+    }
+    assert structlog.contextvars.get_contextvars() == {}
+
+
+def test_error_responses_carry_request_id(client):
+    resp = client.get("/api/cars/999999", headers={"X-Request-ID": "missing-car"})
+    assert resp.status_code == 404
+    assert resp.headers["X-Request-ID"] == "missing-car"
+
+
+def test_unhandled_exception_is_logged(client):
+    client = TestClient(client.app, raise_server_exceptions=False)
+    with (
+        patch("api.routers.health.HealthRead", side_effect=RuntimeError("boom")),
+        patch("api.middleware.log") as log,
+    ):
+        resp = client.get("/api/health")
+
+    assert resp.status_code == 500
+    log.exception.assert_called_once_with("unhandled_exception")
+
+
+def test_no_base_http_middleware(client):
+    stack = client.app.user_middleware
+    assert any(m.cls is RequestContextMiddleware for m in stack)
+    assert not any(m.cls is BaseHTTPMiddleware for m in stack)
@@ -0,0 +1,79 @@
+from datetime import date
+from unittest.mock import patch
+
+from tests.utils.factories import create_car, create_policy
+
+
+def test_batch_validity_in_input_order(client, db_session_fixture):
+    insured = create_car(db_session_fixture, vin="VBATCH1")
+    uninsured = create_car(db_session_fixture, vin="VBATCH2")
+    create_policy(
+        db_session_fixture, insured, start=date(2025, 1, 1), end=date(2025, 6, 30)
+    )
+
+    payload = [
+        {"carId": insured.id, "date": "2025-03-01"},
+        {"carId": insured.id, "date": "2025-07-01"},
+        {"carId": uninsured.id, "date": "2025-03-01"},
+        {"carId": 999999, "date": "2025-03-01"},
+        {"carId": insured.id, "date": "2025/03/01"},
+        {"carId": insured.id, "date": "2025-03-01"},
+    ]
+    resp = client.post("/api/insurance-valid:batch", json=payload)
+
+    assert resp.status_code == 200
+    assert [(r["valid"], r["error"]) for r in resp.json()] == [
+        (True, None),
+        (False, None),
+        (False, None),
+        (None, "not_found"),
+        (None, "invalid_date"),
+        (True, None),
+    ]
+    assert resp.json()[3] == {
+        "carId": 999999,
+        "date": "2025-03-01",
+        "valid": None,
+        "error": "not_found",
+    }
+
+
+def test_batch_validity_single_query(client, db_session_fixture):
+    from sqlalchemy import event
+
+    car = create_car(db_session_fixture, vin="VBATCH3")
+    create_policy(db_session_fixture, car)
+    car_id = car.id
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session_fixture.get_bind()
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        resp = client.post(
+            "/api/insurance-valid:batch",
+            json=[{"carId": car_id, "date": f"2025-0{m}-15"} for m in range(1, 10)],
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert resp.status_code == 200
+    assert all(r["valid"] for r in resp.json())
+    assert len(statements) == 1
+
+
+def test_batch_validity_empty(client):
+    resp = client.post("/api/insurance-valid:batch", json=[])
+    assert resp.status_code == 200
+    assert resp.json() == []
+
+
+def test_batch_validity_too_many_items(client):
+    with patch("api.routers.cars.settings.VALIDITY_BATCH_MAX_ITEMS", 1):
+        resp = client.post(
+            "/api/insurance-valid:batch",
+            json=[{"carId": 1, "date": "2025-01-01"}] * 2,
+        )
+    assert resp.status_code == 400
@@ -1,18 +1,22 @@
 """Pytest fixtures shared across test suites."""
 
+import contextlib
 import sys
 from pathlib import Path
 from typing import Generator
+from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from db import query_stats, slow_queries
 from db.base import Base
-from db.session import get_db
+from db.session import get_db, get_read_db
 from main import create_app
+from tests.utils.fake_redis import FakeRedis
 
 # In-memory SQLite for fast tests
 # StaticPool keeps the same connection for the lifespan of tests so data persists across requests
@@ -27,6 +31,18 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
+
+
+@event.listens_for(engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, _):
+    """SQLite leaves FK enforcement off; the write path relies on it."""
+    dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+
+query_stats.install(engine)
+slow_queries.install(engine)
+
+
 TESTING_SESSION_LOCAL = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -46,6 +62,7 @@ def override_get_db() -> Generator:
 # FastAPI dependency override applied in fixture
 app = create_app(enable_scheduler=False, configure_logs=False)
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_read_db] = override_get_db
 
 
 def get_test_client() -> TestClient:
@@ -76,3 +93,23 @@ def clean_database(db_session_fixture):
     for table in reversed(Base.metadata.sorted_tables):
         db_session_fixture.execute(table.delete())
     db_session_fixture.commit()
+
+
+# Modules that bind `get_redis` at import time
+_REDIS_USERS = (
+    "core.redis",
+    "services.read_cache",
+    "services.expiry_service",
+    "services.expiry_signal",
+    "services.scheduler",
+)
+
+
+@pytest.fixture()
+def fake_redis() -> Generator[FakeRedis, None, None]:
+    """One FakeRedis returned by every `get_redis` in the app."""
+    fake = FakeRedis()
+    with contextlib.ExitStack() as stack:
+        for module in _REDIS_USERS:
+            stack.enter_context(patch(f"{module}.get_redis", return_value=fake))
+        yield fake
@@ -0,0 +1,29 @@
+from benchmarks.middleware import run_middleware_bench
+from benchmarks.run import run_suite
+
+
+def test_benchmark_suite_smoke(tmp_path):
+    report = run_suite(
+        database_url=f"sqlite:///{tmp_path / 'bench.db'}",
+        cars=20,
+        iterations=3,
+        warmup=1,
+    )
+
+    assert report["meta"]["database"] == "sqlite"
+    results = report["results"]
+    assert "service.policy_expiry_job" in results
+    assert "http.GET /api/cars/{id}/history" in results
+    for name, r in results.items():
+        assert r["p50_ms"] <= r["p95_ms"] <= r["p99_ms"], name
+        assert r["ops_per_sec"] > 0
+    # The write paths are single-statement (see test_query_counts_api)
+    assert results["service.create_policy"]["sql_per_op"] == 1
+    assert results["service.get_car_history"]["sql_per_op"] == 1
+
+
+def test_middleware_benchmark_smoke():
+    report = run_middleware_bench(iterations=5, warmup=1)
+
+    assert set(report["results"]) == {"none", "decorator", "asgi"}
+    assert report["results"]["none"]["overhead_us"] == 0
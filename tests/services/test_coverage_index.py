@@ -0,0 +1,78 @@
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from api.schemas import InsurancePolicyCreateNested
+from services.coverage_index import CarCoverage, CoverageIndex
+from services.exceptions import NotFoundError
+from services.policy_service import create_policy as svc_create_policy
+from services.validity_service import is_insurance_valid
+from tests.utils.factories import create_car, create_policy
+
+
+def test_car_coverage_merges_and_bisects():
+    coverage = CarCoverage(
+        [
+            (date(2025, 3, 1), date(2025, 3, 31)),
+            (date(2025, 1, 1), date(2025, 1, 31)),
+            (date(2025, 2, 1), date(2025, 2, 10)),  # touches January
+            (date(2025, 3, 10), date(2025, 3, 15)),  # inside March
+        ]
+    )
+    assert coverage.starts == [date(2025, 1, 1), date(2025, 3, 1)]
+    assert coverage.ends == [date(2025, 2, 10), date(2025, 3, 31)]
+    assert coverage.covers(date(2025, 2, 10)) is True
+    assert coverage.covers(date(2025, 2, 11)) is False
+    assert coverage.covers(date(2024, 12, 31)) is False
+    assert coverage.covers(date(2025, 3, 31)) is True
+    assert CarCoverage([]).covers(date(2025, 1, 1)) is False
+
+
+@pytest.fixture()
+def index():
+    fresh = CoverageIndex(max_cars=10, ttl_seconds=60)
+    with patch("services.validity_service.settings.COVERAGE_INDEX_ENABLED", True), patch(
+        "services.validity_service.coverage_index", fresh
+    ), patch("services.policy_service.coverage_index", fresh):
+        yield fresh
+
+
+def test_validity_uses_index_and_counts_hits(db_session_fixture, index):
+    car = create_car(db_session_fixture)
+    create_policy(db_session_fixture, car)
+
+    assert is_insurance_valid(db_session_fixture, car.id, "2025-06-01") is True
+    assert is_insurance_valid(db_session_fixture, car.id, "2026-06-01") is False
+    assert index.stats() == {"hits": 1, "misses": 1, "invalidations": 0, "size": 1}
+
+
+def test_policy_write_invalidates_entry(db_session_fixture, index):
+    car = create_car(db_session_fixture)
+    assert is_insurance_valid(db_session_fixture, car.id, "2025-06-01") is False
+
+    svc_create_policy(
+        db_session_fixture,
+        car.id,
+        InsurancePolicyCreateNested(
+            provider="Acme", start_date=date(2025, 6, 1), end_date=date(2025, 6, 30)
+        ),
+    )
+
+    assert is_insurance_valid(db_session_fixture, car.id, "2025-06-01") is True
+    assert index.stats()["misses"] == 2
+    assert index.stats()["invalidations"] == 1
+
+
+def test_missing_car_not_cached(db_session_fixture, index):
+    with pytest.raises(NotFoundError):
+        is_insurance_valid(db_session_fixture, 9999, "2025-01-01")
+    assert index.stats()["size"] == 0
+
+
+def test_lru_bound(db_session_fixture):
+    small = CoverageIndex(max_cars=2, ttl_seconds=60)
+    cars = [create_car(db_session_fixture) for _ in range(3)]
+    for car in cars:
+        small.get(db_session_fixture, car.id)
+    assert small.stats()["size"] == 2
@@ -0,0 +1,167 @@
+import threading
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import pytest
+from apscheduler.schedulers.background import BackgroundScheduler
+from sqlalchemy.orm import sessionmaker
+
+from services import scheduler
+from services.policy_service import next_unlogged_expiry_date
+from tests.utils.factories import create_car, create_policy
+from tests.utils.fake_redis import FakeRedis
+
+UTC = ZoneInfo("UTC")
+
+
+def test_next_unlogged_expiry_date(db_session_fixture):
+    car = create_car(db_session_fixture)
+    create_policy(db_session_fixture, car, end=date(2025, 3, 1))
+    create_policy(
+        db_session_fixture, car, end=date(2025, 2, 1), logged_expiry_at=datetime.now()
+    )
+    create_policy(db_session_fixture, car, end=date(2025, 4, 1))
+    create_policy(db_session_fixture, car, end=date(2024, 12, 1))
+
+    assert next_unlogged_expiry_date(db_session_fixture, date(2025, 1, 1)) == date(
+        2025, 3, 1
+    )
+    assert next_unlogged_expiry_date(db_session_fixture, date(2025, 4, 2)) is None
+
+
+@pytest.fixture()
+def paused_scheduler(db_session_fixture):
+    """A started-but-paused APScheduler installed as the module scheduler."""
+    sched = BackgroundScheduler(timezone=UTC)
+    sched.start(paused=True)
+    SessionLocalTest = sessionmaker(bind=db_session_fixture.bind, autoflush=False)
+
+    def fake_get_db():
+        db = SessionLocalTest()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with (
+        patch("services.scheduler._scheduler", sched),
+        patch("services.scheduler.get_db", fake_get_db),
+    ):
+        yield sched
+    sched.shutdown(wait=False)
+
+
+def _run_time(sched):
+    return sched.get_job(scheduler.EXPIRY_JOB_ID).next_run_time
+
+
+def test_schedules_one_shot_at_midnight_of_next_expiry(
+    db_session_fixture, paused_scheduler
+):
+    today = datetime.now(UTC).date()
+    create_policy(db_session_fixture, end=today + timedelta(days=3))
+
+    scheduler._schedule_next_expiry()
+    assert _run_time(paused_scheduler) == datetime.combine(
+        today + timedelta(days=3), datetime.min.time(), UTC
+    )
+
+
+def test_no_unlogged_expiries_leaves_nothing_scheduled(paused_scheduler):
+    scheduler._schedule_next_expiry()
+    assert paused_scheduler.get_job(scheduler.EXPIRY_JOB_ID) is None
+
+
+def test_leftover_work_today_retries_on_interval(db_session_fixture, paused_scheduler):
+    today = datetime.now(UTC).date()
+    create_policy(db_session_fixture, start=today, end=today)
+
+    scheduler._schedule_next_expiry(after_run=True)
+    delay = _run_time(paused_scheduler) - datetime.now(UTC)
+    assert timedelta(minutes=9) < delay <= timedelta(minutes=10)
+
+
+def test_missed_days_schedule_an_immediate_catch_up(
+    db_session_fixture, paused_scheduler
+):
+    today = datetime.now(UTC).date()
+    # Missed during an outage; the next live expiry is weeks away
+    create_policy(db_session_fixture, end=today - timedelta(days=1))
+    create_policy(db_session_fixture, end=today + timedelta(days=30))
+
+    scheduler._schedule_next_expiry()
+    assert _run_time(paused_scheduler) - datetime.now(UTC) < timedelta(seconds=5)
+
+
+def test_gaps_older_than_catch_up_window_are_ignored(
+    db_session_fixture, paused_scheduler
+):
+    today = datetime.now(UTC).date()
+    stale = today - timedelta(days=scheduler.settings.EXPIRY_CATCHUP_DAYS + 1)
+    create_policy(db_session_fixture, start=stale, end=stale)
+    create_policy(db_session_fixture, end=today + timedelta(days=30))
+
+    scheduler._schedule_next_expiry()
+    assert _run_time(paused_scheduler).date() == today + timedelta(days=30)
+
+
+def test_late_one_shot_still_runs():
+    # The process was busy at the scheduled time: the run must not be dropped
+    sched = BackgroundScheduler(timezone=UTC)
+    sched.start()
+    ran = threading.Event()
+    try:
+        with (
+            patch("services.scheduler._scheduler", sched),
+            patch("services.scheduler._run_scheduled_expiry_job", ran.set),
+        ):
+            scheduler._schedule_expiry_at(datetime.now(UTC) - timedelta(seconds=30))
+            assert ran.wait(5)
+    finally:
+        sched.shutdown(wait=False)
+
+
+def test_change_notification_only_moves_job_earlier(paused_scheduler):
+    today = datetime.now(UTC).date()
+    in_ten = today + timedelta(days=10)
+    scheduler._schedule_expiry_at(datetime.combine(in_ten, datetime.min.time(), UTC))
+
+    scheduler._on_expiry_changed({"data": (today + timedelta(days=20)).isoformat()})
+    assert _run_time(paused_scheduler).date() == in_ten
+
+    scheduler._on_expiry_changed({"data": (today + timedelta(days=2)).isoformat()})
+    assert _run_time(paused_scheduler).date() == today + timedelta(days=2)
+
+    # Past dates belong to catch-up, not the live job
+    scheduler._on_expiry_changed({"data": (today - timedelta(days=2)).isoformat()})
+    assert _run_time(paused_scheduler).date() == today + timedelta(days=2)
+
+
+def test_policy_writes_publish_end_date_in_event_mode(client, db_session_fixture):
+    car = create_car(db_session_fixture)
+    fake = FakeRedis()
+    payload = {"provider": "P", "startDate": "2030-01-01", "endDate": "2030-06-30"}
+    with (
+        patch("services.expiry_signal.get_redis", return_value=fake),
+        patch("services.expiry_signal.settings.SCHEDULER_MODE", "event"),
+    ):
+        resp = client.post(f"/api/cars/{car.id}/policies", json=payload)
+        assert resp.status_code == 201
+        client.put(
+            f"/api/policies/{resp.json()['id']}",
+            json={**payload, "carId": car.id, "endDate": "2030-07-31"},
+        )
+
+    assert [m for _, m in fake.published] == ["2030-06-30", "2030-07-31"]
+
+
+def test_no_publish_in_interval_mode(client, db_session_fixture):
+    car = create_car(db_session_fixture)
+    fake = FakeRedis()
+    with patch("services.expiry_signal.get_redis", return_value=fake):
+        client.post(
+            f"/api/cars/{car.id}/policies",
+            json={"provider": "P", "startDate": "2030-01-01", "endDate": "2030-06-30"},
+        )
+    assert fake.published == []
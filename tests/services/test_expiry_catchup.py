@@ -0,0 +1,153 @@
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from core.settings import settings
+from db.models import InsurancePolicy
+from scripts import backfill_expiries
+from services import expiry_service
+from services.expiry_service import (ExpiryRunAborted, catch_up_expiries,
+                                     checkpoint_key, log_expiries_for_day)
+from services.scheduler import _run_policy_expiry_job
+from tests.utils.factories import create_car, create_policy
+
+LOGGED_AT = datetime(2025, 7, 1, 0, 5)
+
+
+def _unlogged(db) -> set[date]:
+    db.expire_all()
+    return {
+        p.end_date
+        for p in db.query(InsurancePolicy).filter(
+            InsurancePolicy.logged_expiry_at.is_(None)
+        )
+    }
+
+
+def test_catch_up_marks_range_and_skips_empty_days(db_session_fixture, fake_redis):
+    car = create_car(db_session_fixture)
+    for end in (
+        date(2025, 1, 3),
+        date(2025, 1, 3),
+        date(2025, 2, 20),
+        date(2025, 4, 1),
+    ):
+        create_policy(db_session_fixture, car, end=end)
+
+    with patch(
+        "services.expiry_service.log_expiries_for_day", wraps=log_expiries_for_day
+    ) as per_day:
+        total = catch_up_expiries(
+            db_session_fixture,
+            date(2025, 1, 1),
+            date(2025, 3, 31),
+            LOGGED_AT,
+            chunk_size=1,
+            job="test",
+        )
+
+    assert total == 3
+    # Only days with expiries are processed, not every day of the range
+    assert [c.args[1] for c in per_day.call_args_list] == [
+        date(2025, 1, 3),
+        date(2025, 2, 20),
+    ]
+    assert _unlogged(db_session_fixture) == {date(2025, 4, 1)}
+
+
+def test_catch_up_resumes_after_checkpoint(db_session_fixture, fake_redis):
+    car = create_car(db_session_fixture)
+    for end in (date(2025, 1, 2), date(2025, 1, 5), date(2025, 1, 9)):
+        create_policy(db_session_fixture, car, end=end)
+    start, end = date(2025, 1, 1), date(2025, 1, 31)
+
+    # Interrupted while working on the second day
+    calls = iter([None, "lock_lost"])
+    with pytest.raises(ExpiryRunAborted):
+        catch_up_expiries(
+            db_session_fixture,
+            start,
+            end,
+            LOGGED_AT,
+            chunk_size=10,
+            job="test",
+            resume=True,
+            stop=lambda: next(calls),
+        )
+    assert fake_redis.get(checkpoint_key(start, end)) == "2025-01-02"
+    assert _unlogged(db_session_fixture) == {date(2025, 1, 5), date(2025, 1, 9)}
+
+    days = []
+    total = catch_up_expiries(
+        db_session_fixture,
+        start,
+        end,
+        LOGGED_AT,
+        chunk_size=10,
+        job="test",
+        resume=True,
+        on_day=lambda day, count: days.append(day),
+    )
+    assert total == 2
+    assert days == [date(2025, 1, 5), date(2025, 1, 9)]
+    assert fake_redis.get(checkpoint_key(start, end)) == "2025-01-31"
+    assert _unlogged(db_session_fixture) == set()
+
+
+def test_checkpoint_without_resume_is_ignored(db_session_fixture, fake_redis):
+    car = create_car(db_session_fixture)
+    create_policy(db_session_fixture, car, end=date(2025, 1, 2))
+    start, end = date(2025, 1, 1), date(2025, 1, 31)
+    fake_redis.set(checkpoint_key(start, end), "2025-01-31")
+
+    assert expiry_service.load_checkpoint(start, end) == date(2025, 1, 31)
+    assert catch_up_expiries(db_session_fixture, start, end, LOGGED_AT, 10, "test") == 1
+
+
+def test_job_catches_up_recent_missed_days(db_session_fixture, fake_redis):
+    today = datetime.now(ZoneInfo(settings.SCHEDULER_TIMEZONE)).date()
+    car = create_car(db_session_fixture)
+    for days_ago in (
+        0,
+        1,
+        settings.EXPIRY_CATCHUP_DAYS,
+        settings.EXPIRY_CATCHUP_DAYS + 1,
+    ):
+        create_policy(db_session_fixture, car, end=today - timedelta(days=days_ago))
+    SessionLocalTest = sessionmaker(bind=db_session_fixture.bind, autoflush=False)
+
+    def fake_get_db():
+        db = SessionLocalTest()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with patch("services.scheduler.get_db", fake_get_db):
+        _run_policy_expiry_job()
+
+    # Older gaps are left to the backfill script
+    assert _unlogged(db_session_fixture) == {
+        today - timedelta(days=settings.EXPIRY_CATCHUP_DAYS + 1)
+    }
+
+
+def test_backfill_script_reports_per_day(db_session_fixture, fake_redis, capsys):
+    car = create_car(db_session_fixture)
+    for end in (date(2025, 3, 1), date(2025, 3, 1), date(2025, 3, 4)):
+        create_policy(db_session_fixture, car, end=end)
+    SessionLocalTest = sessionmaker(bind=db_session_fixture.bind, autoflush=False)
+
+    with patch("scripts.backfill_expiries.SESSION_LOCAL", SessionLocalTest):
+        backfill_expiries.main(["--from", "2025-03-01", "--to", "2025-03-31"])
+
+    out = capsys.readouterr().out
+    assert "2025-03-01         2 rows" in out
+    assert "2025-03-04         1 rows" in out
+    assert "Done: 3 rows" in out
+    assert _unlogged(db_session_fixture) == set()
+    # The lock was released
+    assert fake_redis.get(backfill_expiries.LOCK_KEY) is None
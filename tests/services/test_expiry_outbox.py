@@ -0,0 +1,133 @@
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from core.redis import RedisLock
+from core.settings import settings
+from db.models import PolicyExpiryOutbox
+from services.expiry_outbox import relay_lock_key, relay_pending
+from services.policy_service import (mark_expiring_policies_logged,
+                                     mark_policy_logged)
+from services.scheduler import _run_outbox_relay_job
+from tests.utils.factories import create_car, create_policy
+from tests.utils.fake_redis import FakeRedis
+
+DAY = date(2025, 5, 1)
+LOGGED_AT = datetime(2025, 5, 1, 0, 5)
+STREAM = settings.EXPIRY_OUTBOX_STREAM
+
+
+def _outbox(db) -> list[PolicyExpiryOutbox]:
+    return (
+        db.execute(select(PolicyExpiryOutbox).order_by(PolicyExpiryOutbox.id))
+        .scalars()
+        .all()
+    )
+
+
+def _create_expiring(db, count: int) -> list[int]:
+    car = create_car(db)
+    return [create_policy(db, car, end=DAY).id for _ in range(count)]
+
+
+def test_marking_writes_events_in_the_same_transaction(db_session_fixture):
+    ids = _create_expiring(db_session_fixture, 3)
+
+    mark_expiring_policies_logged(db_session_fixture, DAY, LOGGED_AT, limit=10)
+    db_session_fixture.rollback()
+    assert _outbox(db_session_fixture) == []
+
+    mark_expiring_policies_logged(db_session_fixture, DAY, LOGGED_AT, limit=10)
+    db_session_fixture.commit()
+    events = _outbox(db_session_fixture)
+    assert sorted(e.policy_id for e in events) == ids
+    assert {(e.end_date, e.logged_at) for e in events} == {(DAY, LOGGED_AT)}
+
+
+def test_mark_policy_logged_writes_event(db_session_fixture):
+    policy = create_policy(db_session_fixture, end=DAY)
+
+    mark_policy_logged(db_session_fixture, policy, LOGGED_AT)
+    db_session_fixture.commit()
+
+    [event] = _outbox(db_session_fixture)
+    assert (event.policy_id, event.car_id) == (policy.id, policy.car_id)
+
+
+def test_relay_drains_in_order_with_one_round_trip_per_batch(db_session_fixture):
+    _create_expiring(db_session_fixture, 5)
+    mark_expiring_policies_logged(db_session_fixture, DAY, LOGGED_AT, limit=10)
+    db_session_fixture.commit()
+    expected = [e.id for e in _outbox(db_session_fixture)]
+    fake = FakeRedis()
+
+    with patch.object(fake, "pipeline", wraps=fake.pipeline) as pipeline:
+        assert relay_pending(db_session_fixture, fake, batch_size=2) == 5
+
+    assert pipeline.call_count == 3
+    entries = [fields for _, fields in fake.streams[STREAM]]
+    assert [int(f["eventId"]) for f in entries] == expected
+    assert entries[0]["endDate"] == "2025-05-01"
+    assert entries[0]["loggedAt"] == LOGGED_AT.isoformat()
+    assert _outbox(db_session_fixture) == []
+
+
+def test_relay_keeps_events_when_redis_fails(db_session_fixture):
+    _create_expiring(db_session_fixture, 2)
+    mark_expiring_policies_logged(db_session_fixture, DAY, LOGGED_AT, limit=10)
+    db_session_fixture.commit()
+    fake = FakeRedis()
+
+    with patch.object(fake, "xadd", side_effect=RedisConnectionError("down")):
+        with pytest.raises(RedisConnectionError):
+            relay_pending(db_session_fixture, fake, batch_size=10)
+    assert len(_outbox(db_session_fixture)) == 2
+
+    assert relay_pending(db_session_fixture, fake, batch_size=10) == 2
+    assert len(fake.streams[STREAM]) == 2
+
+
+def test_only_one_relay_drains_at_a_time(db_session_fixture):
+    _create_expiring(db_session_fixture, 2)
+    mark_expiring_policies_logged(db_session_fixture, DAY, LOGGED_AT, limit=10)
+    db_session_fixture.commit()
+    fake = FakeRedis()
+    other = RedisLock(relay_lock_key(), 10, client=fake)
+    assert other.acquire()
+
+    # Sending now could interleave with the other relay's XADDs
+    assert relay_pending(db_session_fixture, fake, batch_size=10) == 0
+    assert STREAM not in fake.streams
+    assert len(_outbox(db_session_fixture)) == 2
+
+    other.release()
+    assert relay_pending(db_session_fixture, fake, batch_size=10) == 2
+    assert fake.get(relay_lock_key()) is None
+
+
+def test_relay_job(db_session_fixture):
+    _create_expiring(db_session_fixture, 2)
+    mark_expiring_policies_logged(db_session_fixture, DAY, LOGGED_AT, limit=10)
+    db_session_fixture.commit()
+    SessionLocalTest = sessionmaker(bind=db_session_fixture.bind, autoflush=False)
+    fake = FakeRedis()
+
+    def fake_get_db():
+        db = SessionLocalTest()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with patch("services.scheduler.get_db", fake_get_db), patch(
+        "services.scheduler.get_redis", return_value=fake
+    ):
+        _run_outbox_relay_job()
+
+    assert len(fake.streams[STREAM]) == 2
+    db_session_fixture.expire_all()
+    assert _outbox(db_session_fixture) == []
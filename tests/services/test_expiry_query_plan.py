@@ -0,0 +1,71 @@
+from datetime import date, datetime
+
+from sqlalchemy import event
+
+from services.policy_service import (get_unlogged_expiring_policies,
+                                     mark_expiring_policies_logged,
+                                     next_unlogged_expiry_date)
+from tests.utils.factories import create_car, create_policy
+
+INDEX_NAME = "ix_insurance_policy_end_date_unlogged"
+
+
+def _plans_for(db, fn):
+    """Run `fn`, then EXPLAIN every statement it executed on the same connection."""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    conn = db.connection()
+    return [
+        " ".join(
+            row[-1]
+            for row in conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            )
+        )
+        for statement, parameters in captured
+    ]
+
+
+def test_scheduler_chunk_update_uses_partial_index(db_session_fixture):
+    car = create_car(db_session_fixture)
+    for day in range(1, 20):
+        create_policy(
+            db_session_fixture, car, start=date(2025, 1, 1), end=date(2025, 1, day)
+        )
+
+    plans = _plans_for(
+        db_session_fixture,
+        lambda: mark_expiring_policies_logged(
+            db_session_fixture, date(2025, 1, 5), datetime(2025, 1, 5), 100
+        ),
+    )
+
+    # The UPDATE ... RETURNING, then the outbox INSERT of the returned rows
+    assert len(plans) == 2
+    assert INDEX_NAME in plans[0]
+    db_session_fixture.rollback()
+
+
+def test_unlogged_lookup_uses_partial_index(db_session_fixture):
+    plans = _plans_for(
+        db_session_fixture,
+        lambda: get_unlogged_expiring_policies(db_session_fixture, date(2025, 1, 5)),
+    )
+    assert INDEX_NAME in plans[0]
+
+
+def test_next_expiry_date_uses_partial_index(db_session_fixture):
+    plans = _plans_for(
+        db_session_fixture,
+        lambda: next_unlogged_expiry_date(db_session_fixture, date(2025, 1, 5)),
+    )
+    assert INDEX_NAME in plans[0]
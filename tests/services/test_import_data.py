@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import pytest
+
+from scripts.import_data import (RESOURCES, batched, detect_format,
+                                 iter_records, row_values)
+
+
+@pytest.mark.parametrize(
+    ("name", "fmt", "expected"),
+    [
+        ("cars.ndjson", "auto", "ndjson"),
+        ("cars.JSONL", "auto", "ndjson"),
+        ("cars.json", "auto", "ndjson"),
+        ("cars.csv", "auto", "csv"),
+        ("cars.txt", "auto", "csv"),
+        ("cars.csv", "ndjson", "ndjson"),
+    ],
+)
+def test_detect_format(name, fmt, expected):
+    assert detect_format(Path(name), fmt) == expected
+
+
+def test_iter_records_csv_maps_empty_fields_to_null(tmp_path):
+    path = tmp_path / "owners.csv"
+    path.write_text("name,email\nAna,ana@example.com\nBob,\n", encoding="utf-8")
+
+    assert list(iter_records(path, "csv")) == [
+        {"name": "Ana", "email": "ana@example.com"},
+        {"name": "Bob", "email": None},
+    ]
+
+
+def test_iter_records_ndjson_skips_blank_lines(tmp_path):
+    path = tmp_path / "cars.ndjson"
+    path.write_text('{"vin": "A1"}\n\n{"vin": "B2", "make": null}\n', encoding="utf-8")
+
+    assert list(iter_records(path, "ndjson")) == [
+        {"vin": "A1"},
+        {"vin": "B2", "make": None},
+    ]
+
+
+def test_row_values_accepts_snake_and_camel_case():
+    columns = [name for name, _ in RESOURCES["cars"].columns]
+    record = {"vin": "A1", "yearOfManufacture": 2020, "owner_email": "a@b.c"}
+
+    assert row_values(record, columns) == ["A1", None, None, 2020, "a@b.c"]
+
+
+def test_batched_yields_bounded_chunks():
+    assert list(batched(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(batched(iter([]), 2)) == []
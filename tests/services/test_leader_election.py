@@ -0,0 +1,113 @@
+from unittest.mock import patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from core.redis import LeaderElection
+from services import scheduler
+from tests.utils.fake_redis import FakeRedis
+
+
+class Calls:
+    def __init__(self):
+        self.events = []
+
+    def elected(self):
+        self.events.append("elected")
+
+    def demoted(self):
+        self.events.append("demoted")
+
+
+def _election(fake, calls, lease=15):
+    return LeaderElection(
+        "leader", lease, on_elected=calls.elected, on_demoted=calls.demoted, client=fake
+    )
+
+
+def test_only_one_leader_and_fencing_token_increases():
+    fake = FakeRedis()
+    a_calls, b_calls = Calls(), Calls()
+    a, b = _election(fake, a_calls), _election(fake, b_calls)
+
+    a.step()
+    b.step()
+    assert a.is_leader and a.fencing_token == 1
+    assert not b.is_leader and b_calls.events == []
+
+    # Clean handover on shutdown
+    a.stop()
+    assert a_calls.events == ["elected", "demoted"]
+    b.step()
+    assert b.is_leader and b.fencing_token == 2
+
+
+def test_renewal_keeps_lease_and_expiry_fails_over():
+    fake = FakeRedis()
+    a_calls = Calls()
+    a, b = _election(fake, a_calls), _election(fake, Calls())
+    a.step()
+    for _ in range(5):
+        fake.advance(5)
+        a.step()
+        b.step()
+    assert a.is_leader and not b.is_leader
+
+    # Leader stops renewing (e.g. process frozen); lease runs out in Redis
+    fake.advance(16)
+    b.step()
+    assert b.is_leader and b.fencing_token == 2
+    a.step()
+    assert a_calls.events == ["elected", "demoted"]
+    assert a.fencing_token is None
+
+
+def test_leader_steps_down_when_redis_unreachable_past_lease():
+    fake = FakeRedis()
+    calls = Calls()
+    election = _election(fake, calls, lease=0.05)
+    election.step()
+    assert election.is_leader
+
+    election._renew = lambda **kw: (_ for _ in ()).throw(RedisConnectionError("down"))
+    election._valid_until = 0
+    assert not election.is_leader
+    election.step()
+    assert calls.events == ["elected", "demoted"]
+
+
+@pytest.fixture()
+def reset_scheduler():
+    yield
+    scheduler.stop_scheduler()
+
+
+def test_followers_create_no_scheduler(reset_scheduler):
+    fake = FakeRedis()
+    fake.set("scheduler-leader", "someone-else", px=60_000)
+    with (
+        patch("core.redis.get_redis", return_value=fake),
+        patch("services.scheduler.settings.SCHEDULER_ENABLED", True),
+    ):
+        scheduler.start_scheduler()
+        scheduler._election._stop.set()
+        scheduler._election._thread.join()
+
+    assert scheduler._scheduler is None
+    assert not scheduler._election.is_leader
+
+
+def test_leader_runs_scheduler_until_stopped(reset_scheduler):
+    fake = FakeRedis()
+    with (
+        patch("core.redis.get_redis", return_value=fake),
+        patch("services.scheduler.settings.SCHEDULER_ENABLED", True),
+    ):
+        scheduler.start_scheduler()
+        scheduler._election._stop.set()
+        scheduler._election._thread.join()
+        assert scheduler._scheduler is not None
+        scheduler.stop_scheduler()
+
+    assert scheduler._scheduler is None
+    assert fake.get("scheduler-leader") is None
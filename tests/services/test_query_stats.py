@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy import select
+
+from db.models import Car
+from db.query_stats import (QueryBudgetExceeded, QueryStats, statement_shape,
+                            track)
+from tests.utils.factories import create_car
+
+
+def test_statement_shape_collapses_in_lists_and_whitespace():
+    a = statement_shape("SELECT id FROM car\n WHERE id IN (?, ?, ?)")
+    b = statement_shape("SELECT id FROM car WHERE id IN (?)")
+    c = statement_shape("SELECT id FROM car WHERE id IN (%(id_1)s, %(id_2)s)")
+    assert a == b == c == "SELECT id FROM car WHERE id IN (?)"
+
+
+def test_track_counts_statements_and_time(db_session_fixture):
+    car = create_car(db_session_fixture)
+    with track() as stats:
+        db_session_fixture.execute(select(Car).where(Car.id == car.id)).all()
+        db_session_fixture.execute(select(Car.vin)).all()
+    assert stats.count == 2
+    assert stats.total_seconds > 0
+    assert stats.violations() == []
+
+
+def test_repeated_shape_reported_as_n_plus_one(db_session_fixture):
+    cars = [create_car(db_session_fixture) for _ in range(4)]
+    with track(QueryStats(max_statements=100, max_repeats=3, strict=False)) as stats:
+        for car in cars:
+            db_session_fixture.execute(select(Car).where(Car.id == car.id)).all()
+    assert stats.most_repeated()[1] == 4
+    assert any("N+1" in p for p in stats.violations())
+
+
+def test_strict_mode_raises_before_the_offending_statement(db_session_fixture):
+    car = create_car(db_session_fixture)
+    stats = QueryStats(max_statements=2, max_repeats=None, strict=True)
+    with pytest.raises(QueryBudgetExceeded):
+        with track(stats):
+            for _ in range(3):
+                db_session_fixture.execute(select(Car).where(Car.id == car.id)).all()
+    db_session_fixture.rollback()
+    assert stats.count == 3
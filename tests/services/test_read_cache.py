@@ -0,0 +1,105 @@
+from unittest.mock import patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from api.schemas import CarCreate
+from db.base import Base
+from db.models import Car, Owner
+from db.replicas import RoutingSession
+from db.session import get_read_db
+from services.car_service import get_car_cached, update_car
+from services.policy_service import delete_policy, get_policy_cached
+from tests.utils.factories import create_car, create_policy
+
+
+@pytest.fixture(autouse=True)
+def cache_enabled():
+    with patch("core.settings.settings.CACHE_ENABLED", True):
+        yield
+
+
+def test_car_read_through_and_invalidation(db_session_fixture, fake_redis):
+    car = create_car(db_session_fixture, vin="VCACHE1")
+
+    first = get_car_cached(db_session_fixture, car.id)
+    assert f"cache:car:{car.id}" in fake_redis.store
+
+    with patch("services.car_service.get_car") as loader:
+        second = get_car_cached(db_session_fixture, car.id)
+    loader.assert_not_called()
+    assert second == first
+    assert second.owner.id == car.owner_id
+
+    update_car(
+        db_session_fixture,
+        car.id,
+        CarCreate(vin="VCACHE2", make="Kia", owner_id=car.owner_id),
+    )
+    assert f"cache:car:{car.id}" not in fake_redis.store
+    assert get_car_cached(db_session_fixture, car.id).vin == "VCACHE2"
+
+
+def test_policy_cache_miss_and_delete(db_session_fixture, fake_redis):
+    policy = create_policy(db_session_fixture)
+    policy_id = policy.id
+
+    assert get_policy_cached(db_session_fixture, policy_id).id == policy_id
+    assert f"cache:policy:{policy_id}" in fake_redis.store
+
+    delete_policy(db_session_fixture, policy)
+    assert fake_redis.store == {}
+    assert get_policy_cached(db_session_fixture, policy_id) is None
+
+
+def test_redis_down_falls_back_to_db(db_session_fixture):
+    car = create_car(db_session_fixture, vin="VCACHE3")
+
+    class DownRedis:
+        def get(self, key):
+            raise RedisConnectionError("down")
+
+    with patch("services.read_cache.get_redis", return_value=DownRedis()):
+        assert get_car_cached(db_session_fixture, car.id).vin == "VCACHE3"
+
+
+def test_get_car_api_uses_cache(client, db_session_fixture, fake_redis):
+    car = create_car(db_session_fixture, vin="VCACHE4")
+    assert client.get(f"/api/cars/{car.id}").json()["vin"] == "VCACHE4"
+    assert client.get(f"/api/cars/{car.id}").json()["vin"] == "VCACHE4"
+    assert client.get("/api/cars/424242").status_code == 404
+
+
+def test_cache_fill_after_update_ignores_lagging_replica(
+    client, db_session_fixture, fake_redis, tmp_path
+):
+    car = create_car(db_session_fixture, vin="VSTALE")
+    # A replica that has not replayed the update below yet
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    Base.metadata.create_all(bind=replica)
+    with replica.begin() as conn:
+        for model in (Owner, Car):
+            rows = db_session_fixture.execute(model.__table__.select()).mappings()
+            conn.execute(model.__table__.insert(), [dict(r) for r in rows])
+    ReplicaSession = sessionmaker(
+        bind=db_session_fixture.get_bind(), class_=RoutingSession
+    )
+
+    def lagging_read_db():
+        db = ReplicaSession(replica_bind=replica)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    resp = client.put(
+        f"/api/cars/{car.id}", json={"vin": "VFRESH", "ownerId": car.owner_id}
+    )
+    assert resp.status_code == 200
+    with patch.dict(client.app.dependency_overrides, {get_read_db: lagging_read_db}):
+        assert client.get(f"/api/cars/{car.id}").json()["vin"] == "VFRESH"
+
+    assert "VFRESH" in fake_redis.get(f"cache:car:{car.id}")
+    replica.dispose()
@@ -0,0 +1,99 @@
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+from sqlalchemy.orm import sessionmaker
+
+from core.redis import RedisLock
+from db.models import InsurancePolicy
+from services.scheduler import _run_policy_expiry_job
+from tests.utils.factories import create_car
+from tests.utils.fake_redis import FakeRedis
+
+
+def test_lock_is_exclusive_and_release_is_owner_checked():
+    fake = FakeRedis()
+    a, b = RedisLock("job", 10, client=fake), RedisLock("job", 10, client=fake)
+    assert a.acquire()
+    assert not b.acquire()
+
+    # a overran its TTL; b takes over and a must not delete b's lock
+    fake.advance(11)
+    assert b.acquire()
+    assert not a.renew()
+    assert not a.release()
+    assert fake.get("job") == b.token
+    assert b.release()
+    assert fake.get("job") is None
+
+
+def test_acquire_waits_up_to_timeout():
+    fake = FakeRedis()
+    RedisLock("job", 10, client=fake).acquire()
+    started = time.monotonic()
+    assert not RedisLock("job", 10, client=fake).acquire(
+        timeout=0.05, poll_seconds=0.01
+    )
+    assert time.monotonic() - started < 1
+
+
+def test_heartbeat_renews_only_while_progressing():
+    fake = FakeRedis()
+    lock = RedisLock("job", 0.3, client=fake)
+    lock.acquire()
+    with lock.keep_alive():
+        for _ in range(10):
+            time.sleep(0.05)
+            lock.progress()
+        assert not lock.lost
+        # No progress: renewals stop and the lease lapses
+        time.sleep(0.8)
+        assert lock.lost
+
+
+def test_heartbeat_marks_lock_lost_when_taken_over():
+    fake = FakeRedis()
+    lock = RedisLock("job", 0.3, client=fake)
+    lock.acquire()
+    with lock.keep_alive():
+        fake.set("job", "someone-else")
+        deadline = time.monotonic() + 2
+        while not lock._lost and time.monotonic() < deadline:
+            lock.progress()
+            time.sleep(0.02)
+    assert lock.lost
+
+
+def test_expiry_job_does_not_commit_after_losing_lock(db_session_fixture):
+    car = create_car(db_session_fixture)
+    today = datetime.now().date()
+    policy = InsurancePolicy(
+        car_id=car.id, provider="P", start_date=today, end_date=today
+    )
+    db_session_fixture.add(policy)
+    db_session_fixture.commit()
+    policy_id = policy.id
+
+    lock = RedisLock("policy-expiry-lock", 60, client=FakeRedis())
+    lock.acquire()
+    lock._lost = True
+    SessionLocalTest = sessionmaker(bind=db_session_fixture.bind, autoflush=False)
+
+    def fake_get_db():
+        db = SessionLocalTest()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with (
+        patch("services.scheduler.acquire_lock", return_value=lock),
+        patch("services.scheduler.get_db", fake_get_db),
+    ):
+        _run_policy_expiry_job()
+
+    fresh = SessionLocalTest()
+    try:
+        assert fresh.get(InsurancePolicy, policy_id).logged_expiry_at is None
+    finally:
+        fresh.close()
@@ -0,0 +1,159 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from db import session as db_session
+from db.base import Base
+from db.models import Owner
+from db.replicas import ReplicaPool, RoutingSession, replica_failed
+
+
+@pytest.fixture()
+def engines(tmp_path):
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    for engine in (primary, replica):
+        Base.metadata.create_all(bind=engine)
+    with replica.begin() as conn:
+        conn.execute(Owner.__table__.insert().values(name="FromReplica"))
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+def test_reads_go_to_replica_and_writes_to_primary(engines):
+    primary, replica = engines
+    Session = sessionmaker(bind=primary, class_=RoutingSession)
+    db = Session(replica_bind=replica)
+    try:
+        assert db.scalars(select(Owner.name)).all() == ["FromReplica"]
+
+        db.add(Owner(name="Written"))
+        db.commit()
+
+        # After a write the session is pinned to the primary (read-your-writes)
+        assert db.scalars(select(Owner.name)).all() == ["Written"]
+    finally:
+        db.close()
+
+
+def test_without_replica_everything_uses_primary(engines):
+    primary, _ = engines
+    db = sessionmaker(bind=primary, class_=RoutingSession)()
+    try:
+        assert db.scalars(select(Owner.name)).all() == []
+    finally:
+        db.close()
+
+
+def test_for_update_select_goes_to_primary(engines):
+    primary, replica = engines
+    db = sessionmaker(bind=primary, class_=RoutingSession)(replica_bind=replica)
+    try:
+        assert db.scalars(select(Owner.name).with_for_update()).all() == []
+    finally:
+        db.close()
+
+
+def _pool(urls):
+    return ReplicaPool(
+        urls,
+        max_lag_seconds=5,
+        check_interval_seconds=60,
+        retry_after_seconds=60,
+        connect_timeout_seconds=1,
+        with_async=False,
+    )
+
+
+def test_pool_round_robin_and_fallback(tmp_path):
+    pool = _pool([f"sqlite:///{tmp_path / 'a.db'}", f"sqlite:///{tmp_path / 'b.db'}"])
+    first, second = pool.choose(), pool.choose()
+    assert {first.url, second.url} == {r.url for r in pool.replicas}
+
+    for replica in pool.replicas:
+        pool.mark_down(replica)
+    assert pool.choose() is None
+
+
+def test_pool_skips_unreachable_or_lagging_replica(tmp_path):
+    pool = _pool([f"sqlite:///{tmp_path / 'a.db'}"])
+    with patch.object(ReplicaPool, "_probe", return_value=False) as probe:
+        assert pool.choose() is None
+        assert pool.choose() is None
+    # Unhealthy state is cached until the retry delay passes
+    assert probe.call_count == 1
+
+
+def test_non_blocking_choose_probes_in_background(tmp_path):
+    pool = _pool([f"sqlite:///{tmp_path / 'a.db'}"])
+    probed = threading.Event()
+    release = threading.Event()
+
+    def slow_probe(self, replica):
+        probed.set()
+        release.wait(5)
+        return False
+
+    with patch.object(ReplicaPool, "_probe", slow_probe):
+        # Returns the cached state while the probe is still running
+        assert pool.choose(block=False) is pool.replicas[0]
+        assert probed.wait(5)
+        release.set()
+        for _ in range(100):
+            if not pool.replicas[0].healthy:
+                break
+            time.sleep(0.01)
+    assert pool.choose(block=False) is None
+
+
+def test_failed_replica_connect_marks_it_down(engines):
+    primary, replica = engines
+    db = sessionmaker(bind=primary, class_=RoutingSession)(replica_bind=replica)
+    connect_error = OperationalError("connect", {}, Exception("refused"))
+    assert replica_failed(db, connect_error)
+
+    db.add(Owner(name="Written"))
+    db.flush()
+    # Once pinned to the primary, errors are not the replica's
+    assert not replica_failed(db, connect_error)
+    db.close()
+
+
+def test_read_failing_on_replica_is_retried_on_primary(engines, tmp_path):
+    primary, _ = engines
+    unreachable = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    with primary.begin() as conn:
+        conn.execute(Owner.__table__.insert().values(name="OnPrimary"))
+    db = sessionmaker(bind=primary, class_=RoutingSession)(replica_bind=unreachable)
+    try:
+        assert db.scalars(select(Owner.name)).all() == ["OnPrimary"]
+        assert isinstance(db.replica_error, OperationalError)
+        # Later reads of the request stay on the primary
+        assert db.get_bind(clause=select(Owner)) is primary
+    finally:
+        db.close()
+
+
+def test_read_dependency_marks_failed_replica_down(engines, tmp_path):
+    primary, _ = engines
+    pool = _pool([f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"])
+    # Looked healthy at the last check
+    pool.replicas[0].next_check = time.monotonic() + 60
+    Session = sessionmaker(bind=primary, class_=RoutingSession)
+
+    with patch.object(db_session, "replica_pool", pool), patch.object(
+        db_session, "READ_SESSION_LOCAL", Session
+    ):
+        dependency = db_session.get_read_db()
+        db = next(dependency)
+        assert db.scalars(select(Owner.name)).all() == []
+        dependency.close()
+
+    assert not pool.replicas[0].healthy
+    assert pool.choose() is None
@@ -4,6 +4,7 @@ from unittest.mock import patch
 from db.models import InsurancePolicy
 from services.scheduler import _run_policy_expiry_job
 from tests.utils.factories import create_car
+from tests.utils.fake_redis import FakeRedis
 
 
 def test_scheduler_lock_fail(db_session_fixture):
@@ -13,9 +14,9 @@ def test_scheduler_lock_fail(db_session_fixture):
 
 
 def test_scheduler_empty_expiring_list(db_session_fixture):
-    with patch("services.scheduler.acquire_lock", return_value=True), patch(
-        "services.scheduler.release_lock", return_value=None
-    ), patch("services.scheduler.get_db", return_value=iter([db_session_fixture])):
+    with patch("core.redis.get_redis", return_value=FakeRedis()), patch(
+        "services.scheduler.get_db", return_value=iter([db_session_fixture])
+    ):
         _run_policy_expiry_job()
     # No policies should be committed; nothing to assert except no errors
 
@@ -48,9 +49,9 @@ def test_scheduler_catchup_outside_window(db_session_fixture):
         finally:
             test_db.close()
 
-    with patch("services.scheduler.acquire_lock", return_value=True), patch(
-        "services.scheduler.release_lock", return_value=None
-    ), patch("services.scheduler.get_db", fake_get_db), patch(
+    with patch("core.redis.get_redis", return_value=FakeRedis()), patch(
+        "services.scheduler.get_db", fake_get_db
+    ), patch(
         "services.scheduler.datetime", FakeDT
     ):
         _run_policy_expiry_job()
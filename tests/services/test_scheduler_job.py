@@ -2,8 +2,10 @@ from datetime import datetime
 from unittest.mock import patch
 
 from db.models import InsurancePolicy
+from services.policy_service import mark_expiring_policies_logged
 from services.scheduler import _run_policy_expiry_job
 from tests.utils.factories import create_car
+from tests.utils.fake_redis import FakeRedis
 
 
 def test_policy_expiry_job_marks_unlogged(db_session_fixture):
@@ -34,9 +36,9 @@ def test_policy_expiry_job_marks_unlogged(db_session_fixture):
         finally:
             test_db.close()
 
-    with patch("services.scheduler.acquire_lock", return_value=True), patch(
-        "services.scheduler.release_lock", return_value=None
-    ), patch("services.scheduler.get_db", fake_get_db):
+    with patch("core.redis.get_redis", return_value=FakeRedis()), patch(
+        "services.scheduler.get_db", fake_get_db
+    ):
         # Act
         _run_policy_expiry_job()
 
@@ -53,3 +55,54 @@ def test_policy_expiry_job_marks_unlogged(db_session_fixture):
     finally:
         fresh.close()
     assert updated.logged_expiry_at is not None
+
+
+def test_policy_expiry_job_marks_in_chunks(db_session_fixture):
+    car = create_car(db_session_fixture, make="Chunk", model="Car")
+    today = datetime.now().date()
+    expiring = [
+        InsurancePolicy(car_id=car.id, provider="P", start_date=today, end_date=today)
+        for _ in range(5)
+    ]
+    other_day = InsurancePolicy(
+        car_id=car.id,
+        provider="P",
+        start_date=today.replace(year=today.year - 1),
+        end_date=today.replace(year=today.year - 1),
+    )
+    db_session_fixture.add_all([*expiring, other_day])
+    db_session_fixture.commit()
+    ids = [p.id for p in expiring]
+    other_id = other_day.id
+
+    from sqlalchemy.orm import sessionmaker
+
+    SessionLocalTest = sessionmaker(
+        bind=db_session_fixture.bind, autoflush=False, autocommit=False, future=True
+    )
+
+    def fake_get_db():
+        test_db = SessionLocalTest()
+        try:
+            yield test_db
+        finally:
+            test_db.close()
+
+    with patch("core.redis.get_redis", return_value=FakeRedis()), patch(
+        "services.scheduler.get_db", fake_get_db
+    ), patch(
+        "services.scheduler.settings.EXPIRY_JOB_CHUNK_SIZE", 2
+    ), patch(
+        "services.expiry_service.mark_expiring_policies_logged",
+        wraps=mark_expiring_policies_logged,
+    ) as marker:
+        _run_policy_expiry_job()
+
+    # 2 + 2 + 1 rows: the short third chunk ends the loop
+    assert marker.call_count == 3
+    fresh = SessionLocalTest()
+    try:
+        assert all(fresh.get(InsurancePolicy, i).logged_expiry_at for i in ids)
+        assert fresh.get(InsurancePolicy, other_id).logged_expiry_at is None
+    finally:
+        fresh.close()
@@ -0,0 +1,83 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from sqlalchemy import select
+
+from db import slow_queries
+from db.models import Car
+from db.slow_queries import ExplainLimiter, redact
+from tests.utils.factories import create_car
+
+
+def test_redact_keeps_structure_but_not_values():
+    assert redact({"vin_1": "SECRET", "id": 3, "x": None}) == {
+        "vin_1": "str",
+        "id": "int",
+        "x": None,
+    }
+    assert redact(("SECRET", 1.5)) == ["str", "float"]
+
+
+def test_slow_statement_is_logged(db_session_fixture):
+    car = create_car(db_session_fixture)
+    with (
+        patch("db.slow_queries.settings.SLOW_QUERY_THRESHOLD_MS", 1e-6),
+        patch("db.slow_queries.log") as log,
+    ):
+        db_session_fixture.execute(select(Car).where(Car.vin == car.vin)).all()
+
+    event, kwargs = log.warning.call_args.args[0], log.warning.call_args.kwargs
+    assert event == "slow_query"
+    assert kwargs["sql"].startswith("SELECT car.id")
+    assert car.vin not in str(kwargs["params"])
+    assert kwargs["durationMs"] > 0
+
+
+def test_fast_statement_is_not_logged(db_session_fixture):
+    with patch("db.slow_queries.log") as log:
+        db_session_fixture.execute(select(Car)).all()
+    log.warning.assert_not_called()
+
+
+def test_explain_captured_on_side_connection(db_session_fixture):
+    car = create_car(db_session_fixture)
+    limiter = ExplainLimiter()
+    with (
+        patch("db.slow_queries.settings.SLOW_QUERY_THRESHOLD_MS", 1e-6),
+        patch("db.slow_queries.settings.SLOW_QUERY_EXPLAIN", True),
+        patch("db.slow_queries.limiter", limiter),
+        patch("db.slow_queries.log") as log,
+    ):
+        db_session_fixture.execute(select(Car).where(Car.id == car.id)).all()
+        limiter.inflight.result(timeout=5)
+
+    (call,) = [c for c in log.info.call_args_list if c.args[0] == "slow_query_explain"]
+    assert call.kwargs["plan"]
+    # The EXPLAIN itself is never logged as a slow query
+    assert all("EXPLAIN" not in c.kwargs["sql"] for c in log.warning.call_args_list)
+
+
+def test_explain_limiter_bounds_captures():
+    now = [0.0]
+    limiter = ExplainLimiter(clock=lambda: now[0])
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    def admitted(shape):
+        future = limiter.submit(executor, shape, lambda: None)
+        if future is not None:
+            future.result()
+        return future is not None
+
+    with (
+        patch("db.slow_queries.settings.SLOW_QUERY_EXPLAIN_PER_MINUTE", 2),
+        patch("db.slow_queries.settings.SLOW_QUERY_EXPLAIN_COOLDOWN_SECONDS", 600),
+    ):
+        assert admitted("a")
+        assert not admitted("a")  # same shape within the cooldown
+        assert admitted("b")
+        assert not admitted("c")  # per-minute cap
+        now[0] = 61
+        assert admitted("c")
+        now[0] = 700
+        assert admitted("a")
+    executor.shutdown()
@@ -1,6 +1,10 @@
+from datetime import date
+
 import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
 
-from services.validity_service import is_insurance_valid
+from services.validity_service import _pairs_source, is_insurance_valid
 from tests.utils.factories import create_car, create_policy
 
 
@@ -46,3 +50,12 @@ def test_date_out_of_range_high_year(db_session_fixture):
     with pytest.raises(Exception) as exc:
         is_insurance_valid(db_session_fixture, car.id, "2201-07-01")
     assert "Date out of range" in str(exc.value)
+
+
+def test_pairs_source_names_unnest_columns_on_postgres():
+    q = _pairs_source("postgresql", [(1, date(2025, 1, 1)), (2, date(2025, 2, 1))])
+    sql = str(
+        select(q.c.car_id, q.c.on_date).compile(dialect=postgresql.dialect())
+    )
+    assert "unnest(" in sql
+    assert "AS q(car_id, on_date)" in sql
@@ -0,0 +1,118 @@
+"""In-memory stand-in for the Redis commands and Lua scripts used by core.redis."""
+
+from core import redis as core_redis
+
+
+class FakeRedis:
+    """Keys with millisecond expiry on a manual clock (`advance`)."""
+
+    def __init__(self):
+        self.now_ms = 0
+        self.store: dict[str, str] = {}
+        self.expires: dict[str, int] = {}
+        self.published: list[tuple[str, str]] = []
+        self.streams: dict[str, list[tuple[str, dict]]] = {}
+        self._stream_seq = 0
+
+    def advance(self, seconds: float) -> None:
+        self.now_ms += int(seconds * 1000)
+
+    def _expire(self, key):
+        if key in self.expires and self.expires[key] <= self.now_ms:
+            self.store.pop(key, None)
+            self.expires.pop(key, None)
+
+    def get(self, key):
+        self._expire(key)
+        return self.store.get(key)
+
+    def set(self, name, value, nx=False, px=None, ex=None):
+        self._expire(name)
+        if nx and name in self.store:
+            return None
+        self.store[name] = str(value)
+        self.expires.pop(name, None)
+        if px is not None or ex is not None:
+            self.expires[name] = self.now_ms + (px if px is not None else ex * 1000)
+        return True
+
+    def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            self._expire(key)
+            removed += self.store.pop(key, None) is not None
+            self.expires.pop(key, None)
+        return removed
+
+    def incr(self, key):
+        value = int(self.get(key) or 0) + 1
+        self.store[key] = str(value)
+        return value
+
+    def pexpire(self, key, ms):
+        if self.get(key) is None:
+            return 0
+        self.expires[key] = self.now_ms + int(ms)
+        return 1
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 0
+
+    def xadd(self, name, fields, maxlen=None, approximate=True):
+        self._stream_seq += 1
+        entry_id = f"{self.now_ms}-{self._stream_seq}"
+        entries = self.streams.setdefault(name, [])
+        entries.append((entry_id, {k: str(v) for k, v in fields.items()}))
+        if maxlen is not None:
+            del entries[:-maxlen]
+        return entry_id
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    # -- scripts --
+
+    def _acquire_leader(self, keys, args):
+        if self.set(keys[0], args[0], nx=True, px=int(args[1])):
+            return self.incr(keys[1])
+        return None
+
+    def _renew_if_owner(self, keys, args):
+        return self.pexpire(keys[0], args[1]) if self.get(keys[0]) == args[0] else 0
+
+    def _delete_if_owner(self, keys, args):
+        return self.delete(keys[0]) if self.get(keys[0]) == args[0] else 0
+
+    def register_script(self, source):
+        handler = {
+            core_redis._ACQUIRE_LEADER: self._acquire_leader,
+            core_redis._RENEW_IF_OWNER: self._renew_if_owner,
+            core_redis._DELETE_IF_OWNER: self._delete_if_owner,
+        }[source]
+
+        def script(keys=(), args=()):
+            return handler(list(keys), [str(a) for a in args])
+
+        return script
+
+
+class FakePipeline:
+    """Buffers commands and runs them against the FakeRedis on `execute`."""
+
+    def __init__(self, client: FakeRedis):
+        self.client = client
+        self.commands: list = []
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+
+        def queue(*args, **kwargs):
+            self.commands.append((method, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        commands, self.commands = self.commands, []
+        return [method(*args, **kwargs) for method, args, kwargs in commands]